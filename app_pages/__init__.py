@@ -0,0 +1 @@
+"""Halaman aplikasi Streamlit, satu modul per halaman (di-import saat dibuka)"""
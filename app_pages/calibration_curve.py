@@ -0,0 +1,233 @@
+import streamlit as st
+import pandas as pd
+
+from nanocalibrate import (REPORT_FORMATS, REPORT_MAX_ROWS, StreamSummary, available_formats,
+                           bootstrap_calibration, cached_text, calibrate_frame, calibration_report,
+                           dump_models, export_file_name, export_mime, influence_frame,
+                           lazy_export, model_records, predict_concentrations, prediction_frame,
+                           report_formats, report_pool)
+from nanocalibrate.plotting import calibration_figure
+
+from .common import active_calibration, calibration_frame, paged_table, sample_queue
+
+
+def render(profiler):
+    """Halaman Calibration Curve; setiap tahap diukur lewat `profiler`"""
+    st.markdown('<h2 class="sub-header">📈 Calibration Curve Analysis</h2>', unsafe_allow_html=True)
+    
+    df = calibration_frame()
+    if df is None:
+        st.warning("⚠️ Please input calibration data first on the 'Data Input' page.")
+        return
+    
+    x_col = st.session_state.get('x_col', df.columns[0])
+    y_col = st.session_state.get('y_col', df.columns[1] if len(df.columns) > 1 else df.columns[0])
+    
+    x = df[x_col].values
+    y = df[y_col].values
+    
+    # Pilih standar yang dikecualikan dari kurva
+    excluded = st.multiselect("Exclude standards:", list(range(len(x))),
+                              default=[i for i in st.session_state.get('excluded_standards', []) if i < len(x)],
+                              format_func=lambda i, x=x, y=y: f"#{i + 1}: x = {x[i]:g}, y = {y[i]:g}")
+    st.session_state['excluded_standards'] = excluded
+    
+    # Hitung regresi
+    with profiler.span("fit"):
+        x, y, results = active_calibration(x, y)
+    
+    if results is None:
+        st.error("Not enough data points for calibration. Need at least 2 points.")
+        return
+    
+    # Tampilkan hasil utama dalam metrics
+    st.markdown("### 📐 Calibration Parameters")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.markdown('<div class="metric-card">', unsafe_allow_html=True)
+        st.metric("Slope", f"{results['slope']:.4f} ± {results['se_slope']:.4f}")
+        st.caption(f"95% CI: ±{results['ci_slope']:.4f}")
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown('<div class="metric-card">', unsafe_allow_html=True)
+        st.metric("Intercept", f"{results['intercept']:.4f} ± {results['se_intercept']:.4f}")
+        st.caption(f"95% CI: ±{results['ci_intercept']:.4f}")
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown('<div class="metric-card">', unsafe_allow_html=True)
+        st.metric("R²", f"{results['r_squared']:.6f}")
+        st.caption(f"R = {results['r_value']:.4f}")
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    with col4:
+        st.markdown('<div class="metric-card">', unsafe_allow_html=True)
+        st.metric("p-value", f"{results['p_value']:.6f}")
+        st.caption("For slope ≠ 0")
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Tampilkan LOD dan LOQ
+    st.markdown("### 🔬 Detection Limits")
+    
+    lod_col1, lod_col2, lod_col3 = st.columns(3)
+    with lod_col1:
+        st.markdown('<div class="metric-card">', unsafe_allow_html=True)
+        st.metric("LOD (3.3σ/slope)", f"{results['LOD']:.6f}")
+        st.caption("Limit of Detection")
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    with lod_col2:
+        st.markdown('<div class="metric-card">', unsafe_allow_html=True)
+        st.metric("LOQ (10σ/slope)", f"{results['LOQ']:.6f}")
+        st.caption("Limit of Quantification")
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    with lod_col3:
+        st.markdown('<div class="metric-card">', unsafe_allow_html=True)
+        s_res = results['s_res']
+        st.metric("S_res", f"{s_res:.6f}")
+        st.caption("Std. Dev. of Residuals")
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Grafik 1: Kurva kalibrasi
+    st.markdown("### 📊 Calibration Curve Plot")
+    
+    with profiler.span("figure"):
+        fig1 = calibration_figure(x, y, results)
+    
+    with profiler.span("plotly_chart"):
+        st.plotly_chart(fig1, width='stretch')
+    
+    # Tabel data lengkap
+    st.markdown("### 📋 Complete Calculation Table")
+    
+    df_results = pd.DataFrame({
+        'Concentration (x)': x,
+        'Response (y)': y,
+        'Predicted y': results['y_pred'],
+        'Residual': results['residuals'],
+        'Residual²': results['residuals'] ** 2
+    })
+    
+    with profiler.span("results_table"):
+        paged_table(df_results, key="results_table")
+    
+    # Diagnostik outlier per standar (closed-form leave-one-out)
+    if len(x) > 3:
+        st.markdown("### 🔎 Influence Diagnostics")
+        with profiler.span("influence"):
+            df_influence = influence_frame(x, y)
+        n_flagged = int(df_influence['Influential'].sum())
+        if n_flagged:
+            st.warning(f"⚠️ {n_flagged} standard(s) flagged as influential "
+                       "(|deleted studentized residual| > 3 or Cook's D > 1).")
+        with profiler.span("influence_table"):
+            paged_table(df_influence, key="influence_table")
+    
+    # Ketidakpastian bootstrap / Monte Carlo untuk parameter kalibrasi
+    with st.expander("🎲 Bootstrap Uncertainty"):
+        bs_col1, bs_col2, bs_col3 = st.columns(3)
+        with bs_col1:
+            bs_method = st.selectbox("Method:", ["residual", "pairs", "montecarlo"])
+        with bs_col2:
+            bs_resamples = st.number_input("Resamples:", min_value=100, max_value=1_000_000,
+                                           value=10_000, step=1000)
+        with bs_col3:
+            bs_seed = st.number_input("Seed:", min_value=0, value=0)
+        
+        if len(x) > 2 and st.button("Run Bootstrap"):
+            with profiler.span("bootstrap"):
+                boot = bootstrap_calibration(x, y, n_resamples=int(bs_resamples), method=bs_method,
+                                             seed=int(bs_seed))
+            st.dataframe(pd.DataFrame({
+                'Parameter': list(boot['intervals']),
+                'Estimate': [boot['estimate'][k] for k in boot['intervals']],
+                '2.5%': [v[0] for v in boot['intervals'].values()],
+                '97.5%': [v[1] for v in boot['intervals'].values()],
+            }), width='stretch')
+    
+    # Kalibrasi batch untuk semua kolom respons (multi-analit / multi-run)
+    with st.expander("🧮 Batch Calibration (all response columns)"):
+        numeric_cols = [c for c in df.select_dtypes('number').columns if c != x_col]
+        batch_cols = st.multiselect("Response columns:", numeric_cols, default=numeric_cols)
+        group_col = st.selectbox("Group by run/batch column (optional):",
+                                 ["(none)"] + [c for c in df.columns if c != x_col and c not in batch_cols])
+        if batch_cols:
+            with profiler.span("batch_calibration"):
+                df_batch = calibrate_frame(df, x_col, batch_cols,
+                                           group_col=None if group_col == "(none)" else group_col)
+            st.dataframe(df_batch, width='stretch')
+    
+    # Download results
+    st.markdown("### 💾 Export Results")
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        # File dibuat hanya saat tombol diklik (dan di-cache per isi data)
+        export_format = st.selectbox("Format:", available_formats(), key="export_format_results")
+        st.download_button("📥 Download Results",
+                           data=lazy_export(df_results, export_format),
+                           file_name=export_file_name("calibration_results", export_format),
+                           mime=export_mime(export_format),
+                           on_click="ignore")
+    
+    with col2:
+        # Generate report summary
+        report = calibration_report(results)
+        
+        st.download_button("📄 Download Report Summary",
+                           data=lambda: cached_text(report),
+                           file_name="calibration_report.txt",
+                           mime="text/plain",
+                           on_click="ignore")
+    
+    with col3:
+        # Model siap pakai untuk `serve --model id=file.ncal` atau `load_model`
+        st.download_button("🧩 Download Model (.ncal)",
+                           data=lambda: dump_models(model_records(results, ["calibration"])),
+                           file_name="calibration_model.ncal",
+                           mime="application/octet-stream",
+                           on_click="ignore")
+
+    # Report lengkap (grafik, tabel parameter, standar dan prediksi) dibuat di worker background
+    st.markdown("### 📑 Full Report")
+    rep_col1, rep_col2 = st.columns([1, 2])
+    with rep_col1:
+        report_format = st.selectbox("Report format:", report_formats(), key="report_format")
+    with rep_col2:
+        queue = sample_queue()
+        if st.button("Generate Report"):
+            predictions = summary = None
+            if len(queue) > 0:
+                # Report hanya memuat REPORT_MAX_ROWS baris prediksi; sisanya masuk ringkasan
+                prediction = predict_concentrations(queue.responses, results)
+                stream = StreamSummary()
+                stream.update(prediction)
+                predictions = prediction_frame(prediction, 0.95).head(REPORT_MAX_ROWS)
+                summary = stream.as_dict()
+            st.session_state['report_job'] = (
+                report_format, report_pool.submit(x, y, results, predictions, summary,
+                                                  fmt=report_format))
+    job = st.session_state.get('report_job')
+    if job is not None:
+        fmt, future = job
+        if not future.done():
+            report_status(future)
+        elif future.exception() is not None:
+            st.error(f"Report failed: {future.exception()}")
+        else:
+            st.download_button(f"📑 Download Report ({fmt})",
+                               data=future.result(),
+                               file_name=f"calibration_report{REPORT_FORMATS[fmt][0]}",
+                               mime=REPORT_FORMATS[fmt][1],
+                               on_click="ignore")
+
+
+@st.fragment(run_every=1)
+def report_status(future):
+    """Tunggu report tanpa memblokir halaman; rerun penuh sekali saat selesai"""
+    if future.done():
+        st.rerun()
+    st.info("⏳ Rendering report in the background...")
@@ -0,0 +1,93 @@
+import streamlit as st
+import numpy as np
+
+from nanocalibrate import (CalibrationModel, DEFAULT_PAGE_SIZE, SampleQueue, array_hash,
+                           cached_calibration, dataset_store, format_page, page_count, table_view)
+
+
+def store_calibration_data(df):
+    """Simpan data kalibrasi di dataset store; sesi hanya memegang handle-nya"""
+    st.session_state['calibration_data'] = dataset_store.put(df)
+
+
+def calibration_frame():
+    """DataFrame kalibrasi sesi ini (memory-mapped, dipakai bersama), atau None"""
+    handle = st.session_state.get('calibration_data')
+    return None if handle is None else handle.frame()
+
+
+def sample_queue():
+    """Daftar respons sampel sesi ini (bertahan antar rerun)"""
+    return st.session_state.setdefault('sample_queue', SampleQueue())
+
+
+def session_cached(name, key, compute):
+    """Hasil `compute()` yang disimpan di session dan dihitung ulang hanya jika `key` berubah"""
+    cached = st.session_state.get(f'cached_{name}')
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    value = compute()
+    st.session_state[f'cached_{name}'] = (key, value)
+    return value
+
+
+def active_rows(x, y):
+    """Mask baris standar aktif, sejajar dengan x/y yang dikembalikan `active_calibration`"""
+    mask = np.ones(len(x), dtype=bool)
+    excluded = [i for i in st.session_state.get('excluded_standards', []) if i < len(x)]
+    if excluded:
+        # Model inkremental melewati baris dengan nilai kosong
+        mask[excluded] = False
+        mask &= np.isfinite(np.asarray(x, dtype=float)) & np.isfinite(np.asarray(y, dtype=float))
+    return mask
+
+
+def active_calibration(x, y):
+    """Kembalikan (x, y, results) untuk standar yang aktif"""
+    excluded = [i for i in st.session_state.get('excluded_standards', []) if i < len(x)]
+    if not excluded:
+        return x, y, cached_calibration(x, y)
+    
+    # Model inkremental: toggle standar hanya menambah/menghapus satu titik
+    data_key = array_hash(x, y)
+    model = st.session_state.get('calibration_model')
+    if model is None or st.session_state.get('calibration_model_key') != data_key:
+        model = CalibrationModel()
+        st.session_state['calibration_model'] = model
+        st.session_state['calibration_model_key'] = data_key
+    model.set_excluded(excluded, x, y)
+    x_active, y_active = model.arrays()
+    return x_active, y_active, model.results()
+
+
+def paged_table(df, key, decimals=6, page_size=DEFAULT_PAGE_SIZE):
+    """Tampilkan hanya satu halaman baris, bukan seluruh DataFrame"""
+    if len(df) <= page_size:
+        st.dataframe(format_page(df, decimals), width='stretch')
+        return
+    
+    numeric_cols = [c for c in df.columns if df[c].dtype.kind in 'fiu']
+    tcol1, tcol2, tcol3, tcol4 = st.columns([2, 1, 2, 2])
+    with tcol1:
+        sort_by = st.selectbox("Sort by:", ["(none)"] + list(df.columns), key=f"{key}_sort")
+    with tcol2:
+        descending = st.checkbox("Descending", key=f"{key}_desc")
+    with tcol3:
+        filter_col = st.selectbox("Filter column:", ["(none)"] + numeric_cols, key=f"{key}_filter")
+    lo = hi = None
+    if filter_col != "(none)":
+        with tcol4:
+            lo = st.number_input("Min:", value=float(np.nanmin(df[filter_col])), key=f"{key}_lo")
+            hi = st.number_input("Max:", value=float(np.nanmax(df[filter_col])), key=f"{key}_hi")
+    
+    rows = table_view(df, sort_by=None if sort_by == "(none)" else sort_by,
+                      ascending=not descending,
+                      filter_col=None if filter_col == "(none)" else filter_col, lo=lo, hi=hi)
+    n_pages = page_count(len(rows), page_size)
+    page_no = st.number_input(f"Page (of {n_pages}):", min_value=1, max_value=n_pages,
+                              value=1, key=f"{key}_page")
+    start = (page_no - 1) * page_size
+    st.dataframe(format_page(df.iloc[rows[start:start + page_size]], decimals),
+                 width='stretch')
+    st.caption(f"Showing rows {start + 1 if len(rows) else 0}-{min(start + page_size, len(rows))} "
+               f"of {len(rows)} ({len(df)} total)")
@@ -0,0 +1,128 @@
+import streamlit as st
+import pandas as pd
+
+from nanocalibrate import calibrate_workbook, read_table, read_workbook, sheet_names
+
+from .common import calibration_frame, paged_table, session_cached, store_calibration_data
+
+
+def render(profiler):
+    """Halaman Data Input; setiap tahap diukur lewat `profiler`"""
+    st.markdown('<h2 class="sub-header">📥 Input Calibration Data</h2>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        st.markdown("#### Method 1: Manual Input")
+        st.markdown("Enter your calibration standard data:")
+        
+        # Input manual
+        default_data = """Concentration,Response
+0,0.01
+0.5,0.15
+1.0,0.32
+2.0,0.61
+5.0,1.52
+10.0,3.01"""
+        
+        data_text = st.text_area("Paste CSV data (with headers):", 
+                                value=default_data, 
+                                height=200)
+        
+        if st.button("Load Manual Data", key="load_manual"):
+            try:
+                # Parse CSV dari text
+                from io import StringIO
+                with profiler.span("parse_manual"):
+                    df = pd.read_csv(StringIO(data_text))
+                store_calibration_data(df)
+                st.success(f"Data loaded! {len(df)} points imported.")
+            except:
+                st.error("Error parsing CSV data. Please check format.")
+    
+    with col2:
+        st.markdown("#### Method 2: File Upload")
+        st.markdown("Upload your calibration data file:")
+        
+        uploaded_file = st.file_uploader("Choose CSV or Excel file", 
+                                        type=['csv', 'xlsx', 'xls'])
+        
+        if uploaded_file is not None:
+            try:
+                sheet = None
+                if uploaded_file.name.lower().endswith(('.xlsx', '.xls')):
+                    # Hanya nama sheet yang dibaca di sini; isi sel diparse untuk sheet terpilih saja
+                    with profiler.span("sheet_names"):
+                        sheets = session_cached("upload_sheets", uploaded_file.file_id,
+                                                lambda: sheet_names(uploaded_file))
+                    if len(sheets) > 1:
+                        sheet = st.selectbox("Sheet:", sheets)
+                    else:
+                        sheet = sheets[0]
+                
+                # Data disimpan ke store hanya saat file atau sheet berganti, bukan di setiap rerun
+                upload_key = (uploaded_file.file_id, sheet)
+                loaded = st.session_state.get('loaded_upload')
+                if loaded is None or loaded[0] != upload_key:
+                    with profiler.span("parse_upload"):
+                        df = read_table(uploaded_file, sheet_name=sheet)
+                    profiler.count("rows_parsed", len(df))
+                    store_calibration_data(df)
+                    loaded = st.session_state['loaded_upload'] = (upload_key, len(df))
+                source = f" from sheet '{sheet}'" if sheet is not None else ""
+                st.success(f"File uploaded successfully! {loaded[1]} rows loaded{source}.")
+                
+                if (sheet is not None and len(sheets) > 1
+                        and st.checkbox(f"📚 Calibrate all {len(sheets)} sheets",
+                                        help="Parses every sheet; first column = concentration, "
+                                             "second column = response.")):
+                    # Satu kurva per sheet, di-fit sekaligus; parse berurutan (workers=1)
+                    # agar server tidak membuka process pool di setiap cache miss
+                    with profiler.span("calibrate_workbook"):
+                        df_sheets = session_cached(
+                            "upload_sheet_fits", uploaded_file.file_id,
+                            lambda: calibrate_workbook(read_workbook(uploaded_file, workers=1)))
+                    if len(df_sheets) > 0:
+                        st.dataframe(df_sheets[['Sheet', 'n', 'slope', 'intercept',
+                                                'r_squared', 'LOD', 'LOQ']],
+                                     width='stretch')
+            except Exception as e:
+                st.error(f"Error reading file: {e}")
+    
+    # Tampilkan data jika sudah dimuat
+    df = calibration_frame()
+    if df is not None:
+        
+        st.markdown("---")
+        st.markdown("#### 📋 Data Preview")
+        
+        # Pilih kolom
+        col1, col2 = st.columns(2)
+        with col1:
+            x_col = st.selectbox("Select X column (Concentration):", 
+                                df.columns, 
+                                index=0 if len(df.columns) > 0 else 0)
+        with col2:
+            y_col = st.selectbox("Select Y column (Response):", 
+                                df.columns, 
+                                index=1 if len(df.columns) > 1 else 0)
+        
+        # Simpan pilihan kolom
+        st.session_state['x_col'] = x_col
+        st.session_state['y_col'] = y_col
+        
+        # Tampilkan tabel
+        with profiler.span("preview_table"):
+            paged_table(df, key="data_preview")
+        
+        # Tampilkan statistik sederhana
+        st.markdown("#### 📊 Data Statistics")
+        stat_col1, stat_col2, stat_col3, stat_col4 = st.columns(4)
+        with stat_col1:
+            st.metric("Number of Points", len(df))
+        with stat_col2:
+            st.metric("X Mean", f"{df[x_col].mean():.4f}")
+        with stat_col3:
+            st.metric("Y Mean", f"{df[y_col].mean():.4f}")
+        with stat_col4:
+            st.metric("Data Range", f"{df[x_col].min():.4f} - {df[x_col].max():.4f}")
@@ -0,0 +1,122 @@
+import streamlit as st
+import numpy as np
+
+from nanocalibrate import find_linear_range, validate_method
+
+from .common import active_calibration, active_rows, calibration_frame, paged_table, session_cached
+
+
+def render(profiler):
+    """Halaman Method Validation; setiap tahap diukur lewat `profiler`"""
+    st.markdown('<h2 class="sub-header">📊 Method Validation Parameters</h2>', unsafe_allow_html=True)
+    
+    df = calibration_frame()
+    if df is None:
+        st.warning("⚠️ Please input calibration data first.")
+        return
+    
+    x_col = st.session_state.get('x_col', df.columns[0])
+    y_col = st.session_state.get('y_col', df.columns[1] if len(df.columns) > 1 else df.columns[0])
+    
+    x = df[x_col].values
+    y = df[y_col].values
+    active = active_rows(x, y)
+    
+    with profiler.span("fit"):
+        x, y, results = active_calibration(x, y)
+    
+    if results is None:
+        st.error("Calibration not available.")
+        return
+    
+    st.markdown("### 🧪 Validation Parameters Calculator")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("#### Linearity")
+        st.info(f"**R²:** {results['r_squared']:.6f}")
+        
+        # Diisi setelah validate_method dihitung (ANOVA lack-of-fit dan uji Mandel ada di hasilnya)
+        linearity = st.container()
+    
+    with col2:
+        st.markdown("#### Sensitivity")
+        st.info(f"**Sensitivity (slope):** {results['slope']:.6f}")
+        st.metric("LOD", f"{results['LOD']:.6f}")
+        st.metric("LOQ", f"{results['LOQ']:.6f}")
+    
+    # Additional validation parameters
+    st.markdown("### 📈 Additional Calculations")
+    
+    # Range
+    st.markdown(f"**Working Range:** {min(x):.6f} - {max(x):.6f}")
+    
+    # Pencarian rentang linear otomatis
+    st.markdown("#### Linear Range Search")
+    lr_col1, lr_col2, lr_col3 = st.columns(3)
+    with lr_col1:
+        min_r2 = st.number_input("Minimum R²", min_value=0.0, max_value=1.0,
+                                 value=0.99, step=0.001, format="%.4f")
+    with lr_col2:
+        max_residual_pct = st.number_input("Maximum residual (%)", min_value=0.0,
+                                           value=15.0, step=1.0)
+    with lr_col3:
+        min_points = st.number_input("Minimum number of points", min_value=3,
+                                     max_value=max(3, len(x)), value=min(5, max(3, len(x))))
+    
+    with profiler.span("linear_range"):
+        linear_range = find_linear_range(x, y, min_r2=min_r2, max_residual_pct=max_residual_pct,
+                                         min_points=int(min_points))
+    if linear_range is None:
+        st.warning("No concentration window meets the linearity criteria.")
+    else:
+        st.markdown(f"**Linear Range:** {linear_range['x_low']:.6f} - {linear_range['x_high']:.6f} "
+                    f"({linear_range['n']} points, {linear_range['levels']} levels, "
+                    f"R² = {linear_range['r_squared']:.6f}, "
+                    f"max residual = {linear_range['max_residual_pct']:.2f}%)")
+    
+    # Studi validasi dari data long-format (level, replikat, hari, analis)
+    st.markdown("### 🧪 Precision, Accuracy & Recovery")
+    st.caption("Each row is one measurement; rows with the same level, day and analyst are replicates.")
+    options = ["(none)"] + list(df.columns)
+    vcol1, vcol2, vcol3 = st.columns(3)
+    with vcol1:
+        day_col = st.selectbox("Day / run column:", options, key="validation_day")
+    with vcol2:
+        analyst_col = st.selectbox("Analyst column:", options, key="validation_analyst")
+    with vcol3:
+        conf_level = st.slider("Confidence Level (%)", 90, 99, 95, key="validation_confidence")
+    
+    # Hanya standar aktif (tanpa yang dikecualikan), sejajar dengan x/y dari active_calibration
+    day = df[day_col].to_numpy()[active] if day_col != "(none)" else None
+    analyst = df[analyst_col].to_numpy()[active] if analyst_col != "(none)" else None
+    # Hasil disimpan per dataset, kolom, standar aktif dan model; rerun tanpa perubahan tidak menghitung ulang
+    validation_key = (st.session_state['calibration_data'].key, x_col, y_col, day_col, analyst_col,
+                      conf_level, tuple(np.flatnonzero(~active)), results['slope'], results['intercept'])
+    with profiler.span("validation"):
+        validation = session_cached(
+            "validation", validation_key,
+            lambda: validate_method(x, y, day=day, analyst=analyst, model=results,
+                                    confidence=conf_level / 100))
+    
+    st.markdown("#### Precision")
+    paged_table(validation['precision'], key="precision_table", decimals=4)
+    st.markdown("#### Accuracy & Recovery")
+    paged_table(validation['accuracy'], key="accuracy_table", decimals=4)
+    with st.expander("ANOVA with lack-of-fit (active standards)"):
+        st.dataframe(validation['lack_of_fit'], width='stretch')
+    
+    # ANOVA regresi dengan lack-of-fit dari pure error (replikat per level) dan uji Mandel
+    anova = validation['lack_of_fit']
+    mandel = validation['mandel']
+    with linearity:
+        if np.isfinite(anova['F'][0]):
+            st.metric("F-value", f"{anova['F'][0]:.4f}")
+        if np.isfinite(anova['F'][2]):
+            st.metric("Lack-of-fit F", f"{anova['F'][2]:.4f}",
+                      help=f"p = {anova['p-value'][2]:.4g} (pure error from replicates per level)")
+        if mandel is not None:
+            verdict = "linear" if mandel['linear'] else "quadratic fits better"
+            st.caption(f"Mandel's test: F = {mandel['F']:.3f} "
+                       f"(critical {mandel['F_critical']:.3f}) → {verdict}")
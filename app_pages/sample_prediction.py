@@ -0,0 +1,338 @@
+import streamlit as st
+import numpy as np
+import pandas as pd
+
+from nanocalibrate import (DEFAULT_TOLERANCE, DEFAULT_WATCH_ROOT, FolderWatcher,
+                           available_formats, bootstrap_calibration, bootstrap_predictions,
+                           cluster_responses, export_file_name, export_mime, format_page,
+                           group_replicates, lazy_export, predict_concentrations, prediction_frame,
+                           prediction_interval, read_columns, read_samples, replicate_interval,
+                           replicate_summary, resolve_under, stream_predictions)
+
+from .common import (active_calibration, calibration_frame, paged_table, sample_queue,
+                     session_cached)
+
+# Detik antar poll folder pada mode watch
+WATCH_INTERVAL = 2
+
+# Parameter model yang menentukan hasil prediksi (kunci cache per sesi)
+MODEL_KEYS = ('n', 'slope', 'intercept', 's_res', 'y_mean', 'Sxx', 'LOD', 'LOQ', 'x_max')
+
+
+def render(profiler):
+    """Halaman Sample Prediction; setiap tahap diukur lewat `profiler`"""
+    st.markdown('<h2 class="sub-header">🔍 Predict Unknown Samples</h2>', unsafe_allow_html=True)
+
+    df = calibration_frame()
+    if df is None:
+        st.warning("⚠️ Please input calibration data and create calibration curve first.")
+        return
+
+    x_col = st.session_state.get('x_col', df.columns[0])
+    y_col = st.session_state.get('y_col', df.columns[1] if len(df.columns) > 1 else df.columns[0])
+
+    x = df[x_col].values
+    y = df[y_col].values
+
+    with profiler.span("fit"):
+        x, y, results = active_calibration(x, y)
+
+    if results is None:
+        st.error("Calibration not available. Please check data.")
+        return
+
+    st.markdown(f"**Using calibration equation:** `{results['equation']}` (R² = {results['r_squared']:.6f})")
+
+    # Input sampel; respons ditambahkan ke daftar sesi yang bertahan antar rerun
+    st.markdown("### 🔢 Input Sample Responses")
+
+    queue = sample_queue()
+    input_method = st.radio("Input method:", ["Single Value", "Multiple Values", "Upload File",
+                                              "Watch Folder"])
+
+    if input_method == "Single Value":
+        # Form: mengubah input tidak memicu rerun sampai tombol ditekan
+        with st.form("single_sample"):
+            col1, col2 = st.columns(2)
+            with col1:
+                response = st.number_input("Sample response:",
+                                          value=0.5,
+                                          min_value=0.0,
+                                          step=0.01,
+                                          format="%.4f")
+            with col2:
+                replicate = st.number_input("Number of replicates:",
+                                           min_value=1,
+                                           max_value=10,
+                                           value=3)
+            if st.form_submit_button("Add to List"):
+                queue.append(np.full(replicate, response))
+
+    elif input_method == "Multiple Values":
+        with st.form("multiple_samples"):
+            responses_text = st.text_area("Enter responses (one per line):",
+                                         value="0.45\n0.48\n0.47\n1.25\n1.23\n1.26")
+            if st.form_submit_button("Parse Responses"):
+                # Baris yang bukan angka dilewati
+                values = pd.to_numeric(pd.Series(responses_text.strip().split('\n')).str.strip(),
+                                       errors='coerce').to_numpy()
+                queue.append(values[np.isfinite(values)])
+
+    elif input_method == "Upload File":
+        sample_file = st.file_uploader("Upload sample responses file", type=['csv', 'txt'])
+        if sample_file is not None:
+            try:
+                response_col = id_col = None
+                if sample_file.name.endswith('.csv'):
+                    columns = read_columns(sample_file)
+                    response_col = st.selectbox("Response column:", columns)
+                    id_col = st.selectbox("Sample ID column (groups replicates):",
+                                          ["(none)"] + [c for c in columns if c != response_col])
+                    id_col = None if id_col == "(none)" else id_col
+                stream_only = st.checkbox("Summary only (constant memory, for very large files)")
+
+                # Baca file per chunk dengan progress bar
+                progress_bar = st.progress(0.0, text="Reading sample file...")
+                update_progress = lambda f: progress_bar.progress(f, text=f"Reading sample file... {f:.0%}")
+                if stream_only:
+                    # Ringkasan dihitung sekali per file, kolom dan model, bukan di setiap rerun
+                    def stream_summary():
+                        with profiler.span("stream_predictions"):
+                            summary = stream_predictions(sample_file, results, column=response_col,
+                                                         progress=update_progress).as_dict()
+                        profiler.count("rows_parsed", summary['count'])
+                        return summary
+                    stream_key = (sample_file.file_id, response_col,
+                                  tuple(results[key] for key in MODEL_KEYS))
+                    summary = session_cached("stream_summary", stream_key, stream_summary)
+                    progress_bar.empty()
+                    st.markdown(f"**{summary['count']} sample response(s) processed**")
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        st.metric("Mean Concentration", f"{summary['mean']:.6f}")
+                    with col2:
+                        st.metric("Standard Deviation", f"{summary['std']:.6f}")
+                    with col3:
+                        st.metric("CV%", f"{summary['cv']:.2f}%")
+                    st.caption(f"< LOD: {summary['below_lod']} | < LOQ: {summary['below_loq']} | "
+                               f"> Range: {summary['above_range']}")
+                else:
+                    # Setiap file (dan pilihan kolomnya) dibaca sekali saja, bukan di setiap rerun
+                    source = (sample_file.file_id, response_col, id_col)
+                    if not queue.has_source(source):
+                        with profiler.span("read_samples"):
+                            responses, ids = read_samples(sample_file, column=response_col,
+                                                          id_column=id_col,
+                                                          progress=update_progress)
+                        queue.append(responses, ids, source=source)
+                        profiler.count("rows_parsed", len(responses))
+                    progress_bar.empty()
+            except Exception as e:
+                st.error(f"Error reading file: {e}")
+
+    else:  # Watch Folder
+        watch_controls(results)
+        return
+
+    # Tampilkan responses yang sudah dimasukkan
+    if len(queue) > 0:
+        col1, col2 = st.columns([4, 1])
+        with col1:
+            st.markdown(f"**{len(queue)} sample response(s) in the list**")
+        with col2:
+            if st.button("Clear List"):
+                queue.clear()
+
+    if len(queue) > 0:
+        prediction_results(queue, results, x, y, profiler)
+
+
+@st.fragment
+def prediction_results(queue, results, x, y, profiler):
+    """Statistik, CI dan tabel prediksi untuk daftar sampel.
+
+    Berjalan sebagai fragment: widget di sini (toleransi, tingkat
+    kepercayaan, bootstrap, tabel) hanya me-rerun bagian ini, tanpa
+    membaca input atau fit ulang. Prediksi dan ringkasan replikat
+    disimpan di session per versi daftar dan model, jadi mengganti
+    tingkat kepercayaan hanya menghitung ulang kolom CI.
+    """
+    # Rerun fragment saja diukur dengan profiler sendiri (run utama sudah ditutup)
+    with profiler.fragment("prediction_results") as fragment_profiler:
+        _prediction_results(queue, results, x, y, fragment_profiler)
+    if fragment_profiler is not profiler and fragment_profiler.record is not None:
+        st.caption(f"🩺 Fragment rerun: {fragment_profiler.record['total_seconds'] * 1e3:.1f} ms")
+
+
+def _prediction_results(queue, results, x, y, profiler):
+    responses = queue.responses
+    model_key = tuple(results[key] for key in MODEL_KEYS)
+    base_key = (queue.version, model_key)
+
+    # Hitung konsentrasi dan SE untuk semua response sekaligus (vectorized)
+    def predict():
+        with profiler.span("predict"):
+            prediction = predict_concentrations(responses, results)
+        return prediction, prediction_frame(prediction)[['Response', 'Calculated Concentration',
+                                                         '< LOD', '< LOQ', '> Range']]
+    prediction, df_base = session_cached("sample_prediction", base_key, predict)
+    concentrations = prediction['concentration']
+
+    # Kelompok replikat: dari kolom ID sampel; respons tanpa ID dikelompokkan per kedekatan
+    sample_ids = queue.ids
+    if sample_ids is None or queue.missing_ids:
+        tolerance = st.number_input("Replicate tolerance (% of response):", min_value=0.0,
+                                    max_value=100.0, value=DEFAULT_TOLERANCE * 100, step=0.5,
+                                    help="Sorted responses without a sample ID that are closer "
+                                         "than this are treated as replicates of one sample")
+        with profiler.span("group_replicates"):
+            groups = session_cached(
+                "sample_groups", (queue.version, tolerance),
+                lambda: (cluster_responses(responses, tolerance / 100) + 1 if sample_ids is None
+                         else group_replicates(responses, sample_ids, tolerance / 100)))
+    else:
+        tolerance = None
+        groups = sample_ids
+
+    # Statistik per sampel (mean, SD, CV); kolom CI ditambahkan per tingkat kepercayaan
+    st.markdown("### 📊 Prediction Statistics")
+    conf_level = st.slider("Confidence Level (%)", 90, 99, 95)
+    confidence = conf_level / 100
+    with profiler.span("replicate_summary"):
+        df_summary = session_cached(
+            "sample_summary", base_key + (tolerance,),
+            lambda: replicate_summary(concentrations, groups, responses=responses)
+            .drop(columns=['95% CI Lower', '95% CI Upper']))
+        lower, upper = replicate_interval(df_summary['Mean Concentration'].to_numpy(),
+                                          df_summary['SD'].to_numpy(),
+                                          df_summary['Replicates'].to_numpy(), confidence)
+        df_summary = df_summary.assign(**{f'{confidence:.0%} CI Lower': lower,
+                                          f'{confidence:.0%} CI Upper': upper})
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Samples", len(df_summary))
+    with col2:
+        st.metric("Responses", len(concentrations))
+    with col3:
+        cv = df_summary['CV%'].to_numpy()
+        st.metric("Median CV%", f"{np.nanmedian(cv):.2f}%" if np.isfinite(cv).any() else "n/a")
+    with profiler.span("summary_table"):
+        paged_table(df_summary, key="summary_table")
+
+    df_samples = df_base.copy(deep=False)
+    df_samples.insert(0, 'Sample', groups)
+    if len(concentrations) > 1:
+        # Prediksi dengan interval kepercayaan
+        st.markdown("### 📐 Confidence Intervals")
+
+        if prediction['se_pred'] is not None:
+            with profiler.span("predict_ci"):
+                ci_lower, ci_upper = prediction_interval(concentrations, prediction['se_pred'],
+                                                         results['n'], confidence)
+
+            df_samples['SE Prediction'] = prediction['se_pred']
+            df_samples[f'{conf_level}% CI Lower'] = ci_lower
+            df_samples[f'{conf_level}% CI Upper'] = ci_upper
+
+            # Interval bootstrap (opsional, lebih berat); draw disimpan, hanya percentile yang dihitung ulang
+            if st.checkbox("Add bootstrap intervals (2000 resamples)"):
+                with profiler.span("bootstrap"):
+                    boot = session_cached("sample_bootstrap", model_key,
+                                          lambda: bootstrap_calibration(x, y, n_resamples=2000,
+                                                                        seed=0))
+                    boot_pred = bootstrap_predictions(responses, {**boot, 'confidence': confidence})
+                df_samples[f'{conf_level}% Bootstrap Lower'] = boot_pred['low']
+                df_samples[f'{conf_level}% Bootstrap Upper'] = boot_pred['high']
+
+    # Tabel prediksi ditampilkan sekali, setelah semua kolom lengkap
+    st.markdown("### 📋 Prediction Table")
+    with profiler.span("samples_table"):
+        paged_table(df_samples, key="samples_table")
+
+    # Export tabel prediksi
+    exp_col1, exp_col2 = st.columns(2)
+    with exp_col1:
+        sample_format = st.selectbox("Format:", available_formats(), key="export_format_samples")
+    with exp_col2:
+        st.download_button("📥 Download Predictions",
+                           data=lazy_export(df_samples, sample_format),
+                           file_name=export_file_name("sample_predictions", sample_format),
+                           mime=export_mime(sample_format),
+                           on_click="ignore")
+
+
+def watch_controls(results):
+    """Mode watch: ikuti folder instrumen, prediksi hanya baris yang baru ditambahkan"""
+    if DEFAULT_WATCH_ROOT is None:
+        # Folder dan file output dipilih klien browser; tanpa root yang dikonfigurasi mode ini mati
+        st.info("Watching folders from the app is disabled. Set `NANOCALIBRATE_WATCH_ROOT` to the "
+                "instrument data folder, or run `python -m nanocalibrate watch` on the server.")
+        return
+    watcher = st.session_state.get('folder_watcher')
+    if watcher is None:
+        with st.form("watch_folder"):
+            directory = st.text_input("Folder to watch:", value=".",
+                                      help=f"Folder inside {DEFAULT_WATCH_ROOT} the instrument "
+                                           "appends .txt/.csv readings to")
+            column = st.text_input("Response column (CSV files):", value="",
+                                   help="Leave empty to use the first column")
+            output = st.text_input("Append predictions to (CSV, optional):", value="",
+                                   help=f"Path inside {DEFAULT_WATCH_ROOT}")
+            skip_existing = st.checkbox("Only new readings (skip rows already in the files)")
+            if st.form_submit_button("Start Watching"):
+                try:
+                    # Kedua path harus tetap di dalam root setelah realpath (termasuk symlink dan ..)
+                    directory = resolve_under(DEFAULT_WATCH_ROOT, directory)
+                    output = resolve_under(DEFAULT_WATCH_ROOT, output) if output else None
+                    watcher = FolderWatcher(directory, results, column=column or None,
+                                            output=output, skip_existing=skip_existing)
+                    st.session_state['folder_watcher'] = watcher
+                except (OSError, ValueError) as e:
+                    st.error(f"Cannot watch folder: {e}")
+        if watcher is None:
+            return
+    else:
+        # Baris baru selalu diprediksi dengan kurva yang aktif saat ini
+        watcher.set_model(results)
+        col1, col2 = st.columns([4, 1])
+        with col1:
+            st.markdown(f"**Watching** `{watcher.directory}`"
+                        + (f" → `{watcher.output}`" if watcher.output else ""))
+        with col2:
+            # Callback dijalankan sebelum rerun, jadi form langsung tampil lagi
+            st.button("Stop Watching", on_click=st.session_state.pop,
+                      args=('folder_watcher', None))
+    watch_results(watcher)
+
+
+@st.fragment(run_every=WATCH_INTERVAL)
+def watch_results(watcher):
+    """Poll folder dan tampilkan ringkasan berjalan serta baris terbaru.
+
+    Fragment ini dijalankan ulang setiap `WATCH_INTERVAL` detik; setiap
+    poll hanya membaca byte yang ditambahkan sejak poll sebelumnya, jadi
+    riwayat tidak pernah diproses ulang.
+    """
+    try:
+        watcher.poll()
+    except (OSError, ValueError) as e:
+        st.error(f"Error reading folder: {e}")
+        return
+    stats = watcher.stats()
+    summary = stats['summary']
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Readings", summary['count'], delta=watcher.last_poll_rows or None)
+    with col2:
+        st.metric("Mean Concentration", f"{summary['mean']:.6f}")
+    with col3:
+        st.metric("Standard Deviation", f"{summary['std']:.6f}")
+    with col4:
+        st.metric("Files", stats['files'])
+    st.caption(f"< LOD: {summary['below_lod']} | < LOQ: {summary['below_loq']} | "
+               f"> Range: {summary['above_range']} | "
+               f"{stats['rows_per_second']:,.0f} readings/s processed")
+    if watcher.recent is not None:
+        st.markdown(f"### 📋 Latest {len(watcher.recent)} Readings")
+        st.dataframe(format_page(watcher.recent.iloc[::-1]), width='stretch')
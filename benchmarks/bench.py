@@ -0,0 +1,316 @@
+"""Benchmark NanoCalibrate: fit, prediksi, parsing, file model, report dan pembuatan grafik.
+
+Contoh:
+    python benchmarks/bench.py --quick --output bench_results.json
+    python benchmarks/bench.py --baseline benchmarks/baseline.json --threshold 0.25
+
+Data sintetis dibuat dengan seed tetap. Setiap kasus diukur beberapa kali
+dan yang dicatat adalah waktu terbaik. Dengan `--baseline`, hasil
+dibandingkan dan script keluar dengan kode 1 jika ada kasus yang lebih
+lambat dari baseline melebihi `--threshold`.
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from nanocalibrate import (ReportPool, calculate_calibration, fit_batch,  # noqa: E402
+                           load_model, load_models, model_records, model_results,
+                           predict_concentrations, prediction_frame, read_responses, read_table,
+                           read_workbook, render_report, save_model, save_models, validate_method,
+                           workbook_cache)
+from nanocalibrate.watch import FolderWatcher  # noqa: E402
+
+FULL_SIZES = (10, 1_000, 100_000, 10_000_000)
+QUICK_SIZES = (10, 1_000, 100_000)
+FULL_CURVES = (1, 100, 10_000)
+QUICK_CURVES = (1, 100, 1_000)
+# Excel dibaca sel per sel, jadi ukurannya dibatasi
+EXCEL_MAX_ROWS = 100_000
+# Workbook multi-sheet: jumlah sheet dan batas baris per sheet
+EXCEL_SHEETS = 4
+EXCEL_SHEET_MAX_ROWS = 10_000
+# Mode watch: ukuran satu lonjakan baris baru per poll
+WATCH_MAX_ROWS = 100_000
+# Jumlah report maksimum per kasus pool report
+REPORT_MAX_CURVES = 1_000
+# Grafik Plotly di atas ukuran ini tidak realistis untuk browser
+FIGURE_MAX_POINTS = 1_000_000
+# Selisih waktu di bawah ini dianggap noise saat membandingkan dengan baseline
+MIN_DELTA_SECONDS = 0.001
+
+
+def timeit(func, min_time=0.2, max_repeat=20):
+    """Waktu terbaik (detik) dari beberapa kali pemanggilan"""
+    best = float('inf')
+    total = 0.0
+    repeat = 0
+    while repeat < max_repeat and (repeat < 3 or total < min_time):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        total += elapsed
+        repeat += 1
+        if elapsed > 5 * min_time:
+            break
+    return best
+
+
+def synthetic(n, seed=0):
+    rng = np.random.default_rng(seed)
+    x = np.linspace(0, 10, n)
+    y = 0.01 + 0.3 * x + rng.normal(0, 0.01, n)
+    return x, y
+
+
+def bench_fit(sizes):
+    for n in sizes:
+        x, y = synthetic(max(n, 3))
+        yield {'name': 'calculate_calibration', 'size': n,
+               'seconds': timeit(lambda: calculate_calibration(x, y))}
+
+
+def bench_batch(curves, n_points=6):
+    x, _ = synthetic(n_points)
+    rng = np.random.default_rng(1)
+    for m in curves:
+        Y = 0.3 * x[:, None] * rng.uniform(0.5, 2, m) + rng.normal(0, 0.01, (n_points, m))
+        yield {'name': 'fit_batch', 'curves': m, 'size': n_points,
+               'seconds': timeit(lambda: fit_batch(x, Y))}
+        # Pembanding: loop calculate_calibration per kurva (maks. 1000 kurva)
+        k = min(m, 1_000)
+        loop = timeit(lambda: [calculate_calibration(x, Y[:, j]) for j in range(k)],
+                      max_repeat=3)
+        yield {'name': 'calculate_calibration_loop', 'curves': m, 'size': n_points,
+               'seconds': loop * m / k, 'extrapolated': k != m}
+
+
+def bench_predict(sizes):
+    x, y = synthetic(20)
+    model = calculate_calibration(x, y)
+    for n in sizes:
+        responses = np.random.default_rng(2).uniform(0, 3, n)
+        yield {'name': 'predict_concentrations', 'size': n,
+               'seconds': timeit(lambda: predict_concentrations(responses, model))}
+        yield {'name': 'predict_concentrations_float32', 'size': n,
+               'seconds': timeit(lambda: predict_concentrations(responses, model,
+                                                                dtype=np.float32))}
+
+
+def bench_ingest(sizes, workdir):
+    for n in sizes:
+        x, y = synthetic(n)
+        csv_path = Path(workdir) / f"cal_{n}.csv"
+        txt_path = Path(workdir) / f"samples_{n}.txt"
+        pd.DataFrame({'Concentration': x, 'Response': y}).to_csv(csv_path, index=False)
+        np.savetxt(txt_path, y, fmt='%.6f')
+        yield {'name': 'read_table_csv', 'size': n,
+               'seconds': timeit(lambda: read_table(str(csv_path)), max_repeat=5)}
+        yield {'name': 'read_responses_txt', 'size': n,
+               'seconds': timeit(lambda: read_responses(str(txt_path)), max_repeat=5)}
+        if n <= EXCEL_MAX_ROWS:
+            try:
+                xlsx = io.BytesIO()
+                pd.DataFrame({'Concentration': x, 'Response': y}).to_excel(xlsx, index=False)
+            except ImportError:
+                continue
+            xlsx.name = 'cal.xlsx'
+            # Cache workbook dikosongkan agar yang diukur parsing, bukan cache hit
+            yield {'name': 'read_table_excel', 'size': n,
+                   'seconds': timeit(lambda: (workbook_cache.clear(), read_table(xlsx)),
+                                     max_repeat=3)}
+            if n <= EXCEL_SHEET_MAX_ROWS:
+                workbook = io.BytesIO()
+                with pd.ExcelWriter(workbook) as writer:
+                    for i in range(EXCEL_SHEETS):
+                        pd.DataFrame({'Concentration': x, 'Response': y * (i + 1)}).to_excel(
+                            writer, sheet_name=f"Analyte{i}", index=False)
+                data = workbook.getvalue()
+                yield {'name': 'read_workbook', 'size': n, 'sheets': EXCEL_SHEETS,
+                       'seconds': timeit(lambda: (workbook_cache.clear(), read_workbook(data)),
+                                         max_repeat=3)}
+                yield {'name': 'read_workbook_cached', 'size': n, 'sheets': EXCEL_SHEETS,
+                       'seconds': timeit(lambda: read_workbook(data))}
+        if n <= WATCH_MAX_ROWS:
+            watch_dir = Path(workdir) / f"watch_{n}"
+            watch_dir.mkdir()
+            np.savetxt(watch_dir / "samples.txt", y, fmt='%.6f')
+            watcher = FolderWatcher(watch_dir, calculate_calibration(*synthetic(6)),
+                                    output=Path(workdir) / f"watch_{n}.csv")
+            # Offset direset agar setiap poll memproses n baris sebagai data baru
+            yield {'name': 'watch_poll', 'size': n,
+                   'seconds': timeit(lambda: (watcher.files.clear(), watcher.poll()),
+                                     max_repeat=5)}
+
+
+def bench_artifacts(curves, workdir, n_points=6):
+    x, y = synthetic(n_points)
+    path = Path(workdir) / "model.ncal"
+    save_model(path, calculate_calibration(x, y), 'single')
+    yield {'name': 'load_model', 'size': 1,
+           'seconds': timeit(lambda: load_model(path))}
+    rng = np.random.default_rng(3)
+    for m in curves:
+        Y = 0.3 * x[:, None] * rng.uniform(0.5, 2, m) + rng.normal(0, 0.01, (n_points, m))
+        records = model_records(fit_batch(x, Y), [f"model{j}" for j in range(m)])
+        bulk = Path(workdir) / f"models_{m}.ncal"
+        yield {'name': 'save_models', 'curves': m, 'size': n_points,
+               'seconds': timeit(lambda: save_models(bulk, records))}
+        yield {'name': 'load_models', 'curves': m, 'size': n_points,
+               'seconds': timeit(lambda: model_results(load_models(bulk)))}
+
+
+def bench_validation(sizes):
+    rng = np.random.default_rng(4)
+    for n in sizes:
+        n = max(n, 12)
+        level = rng.choice([0.5, 1, 2, 5, 10, 20], n)
+        day = rng.integers(0, 10, n)
+        analyst = rng.integers(0, 3, n)
+        response = 0.01 + 0.3 * level + rng.normal(0, 0.01, 10)[day] + rng.normal(0, 0.005, n)
+        yield {'name': 'validate_method', 'size': n,
+               'seconds': timeit(lambda: validate_method(level, response, day, analyst),
+                                 max_repeat=5)}
+
+
+def bench_report(sizes, curves, n_points=6):
+    model_x, model_y = synthetic(n_points)
+    model = calculate_calibration(model_x, model_y)
+    predictions = prediction_frame(predict_concentrations(model_y, model), 0.95)
+    for n in sizes:
+        x, y = synthetic(n)
+        results = calculate_calibration(x, y)
+        yield {'name': 'render_report', 'size': n,
+               'seconds': timeit(lambda: render_report(x, y, results, predictions),
+                                 max_repeat=5)}
+    # Banyak report sekaligus lewat pool worker; cache dikosongkan agar semua benar-benar dibuat
+    pool = ReportPool()
+    rng = np.random.default_rng(5)
+    for m in curves:
+        if m > REPORT_MAX_CURVES:
+            continue
+        tasks = []
+        for _ in range(m):
+            y = model_y * rng.uniform(0.5, 2) + rng.normal(0, 0.01, n_points)
+            tasks.append((model_x, y, calculate_calibration(model_x, y)))
+        yield {'name': 'report_pool', 'curves': m, 'size': n_points, 'workers': pool.workers,
+               'seconds': timeit(lambda: (pool.cache.clear(), pool.map(tasks)), max_repeat=3)}
+    pool.shutdown()
+
+
+def bench_figure(sizes):
+    try:
+        from nanocalibrate.plotting import calibration_figure
+    except ImportError:
+        return
+    for n in sizes:
+        if n > FIGURE_MAX_POINTS:
+            continue
+        x, y = synthetic(max(n, 3))
+        results = calculate_calibration(x, y)
+        yield {'name': 'calibration_figure', 'size': n,
+               'seconds': timeit(lambda: calibration_figure(x, y, results).to_json(),
+                                 max_repeat=5)}
+
+
+def case_key(case):
+    return f"{case['name']}[size={case.get('size')},curves={case.get('curves', 1)}]"
+
+
+def compare(results, baseline, threshold):
+    """Bandingkan dengan baseline; kembalikan daftar kasus yang melambat"""
+    previous = {case_key(case): case['seconds'] for case in baseline['cases']}
+    regressions = []
+    for case in results['cases']:
+        key = case_key(case)
+        if key not in previous or previous[key] <= 0:
+            continue
+        ratio = case['seconds'] / previous[key]
+        case['baseline_seconds'] = previous[key]
+        case['ratio'] = ratio
+        if ratio > 1 + threshold and case['seconds'] - previous[key] > MIN_DELTA_SECONDS:
+            regressions.append((key, ratio))
+    return regressions
+
+
+def environment():
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="NanoCalibrate benchmark suite")
+    parser.add_argument('--quick', action='store_true', help="Skip the 10^7-point / 10k-curve cases")
+    parser.add_argument('--output', default='bench_results.json')
+    parser.add_argument('--baseline', default=None, help="Saved results JSON to compare against")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="Allowed slowdown vs baseline (0.25 = 25%%)")
+    parser.add_argument('--only', default=None,
+                        help="Comma-separated groups: fit,batch,predict,ingest,artifacts,"
+                             "validation,report,figure")
+    args = parser.parse_args(argv)
+
+    sizes = QUICK_SIZES if args.quick else FULL_SIZES
+    curves = QUICK_CURVES if args.quick else FULL_CURVES
+    groups = (set(args.only.split(',')) if args.only
+              else {'fit', 'batch', 'predict', 'ingest', 'artifacts', 'validation', 'report',
+                    'figure'})
+
+    results = {'environment': environment(), 'quick': args.quick, 'cases': []}
+    with tempfile.TemporaryDirectory() as workdir:
+        suites = {
+            'fit': lambda: bench_fit(sizes),
+            'batch': lambda: bench_batch(curves),
+            'predict': lambda: bench_predict(sizes),
+            'ingest': lambda: bench_ingest(sizes, workdir),
+            'artifacts': lambda: bench_artifacts(curves, workdir),
+            'validation': lambda: bench_validation(sizes),
+            'report': lambda: bench_report(sizes, curves),
+            'figure': lambda: bench_figure(sizes),
+        }
+        for group, suite in suites.items():
+            if group not in groups:
+                continue
+            for case in suite():
+                case['group'] = group
+                results['cases'].append(case)
+                print(f"{case_key(case):60s} {case['seconds'] * 1e3:12.3f} ms", flush=True)
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        for key, ratio in regressions:
+            print(f"REGRESSION {key}: {ratio:.2f}x baseline")
+        if regressions:
+            status = 1
+        else:
+            print(f"No regressions beyond {args.threshold:.0%} of baseline.")
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.output}")
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,168 @@
+"""Load test untuk layanan HTTP prediksi (`python -m nanocalibrate serve`).
+
+Contoh:
+    python benchmarks/loadtest.py --spawn --concurrency 32 --requests 5000 --batch 100
+    python benchmarks/loadtest.py --url http://127.0.0.1:8765 --model plate1
+
+Setiap worker memakai satu koneksi keep-alive dan mengirim request
+POST /models/<id>/predict berturut-turut. Hasilnya latensi p50/p90/p99,
+request per detik dan respons (sampel) per detik. Dengan `--spawn`, satu
+instance server dijalankan di port bebas dan satu model contoh didaftarkan.
+"""
+import argparse
+import asyncio
+import json
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+
+EXAMPLE_MODEL = {
+    'model_id': 'example',
+    'x': [0, 0.5, 1.0, 2.0, 5.0, 10.0],
+    'y': [0.01, 0.15, 0.32, 0.61, 1.52, 3.01],
+}
+
+
+async def _request(reader, writer, host, method, path, body=b'', content_type='application/json'):
+    writer.write((f"{method} {path} HTTP/1.1\r\nHost: {host}\r\n"
+                  f"Content-Type: {content_type}\r\nContent-Length: {len(body)}\r\n\r\n"
+                  ).encode('latin-1') + body)
+    await writer.drain()
+    head = await reader.readuntil(b'\r\n\r\n')
+    lines = head.decode('latin-1').split('\r\n')
+    status = int(lines[0].split(' ', 2)[1])
+    length = 0
+    for line in lines[1:]:
+        if line.lower().startswith('content-length:'):
+            length = int(line.split(':', 1)[1])
+    payload = await reader.readexactly(length) if length else b''
+    return status, payload
+
+
+async def _worker(host, port, path, bodies, deadline, latencies, errors, counter, total):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while counter[0] < total and time.perf_counter() < deadline:
+            body = bodies[counter[0] % len(bodies)]
+            counter[0] += 1
+            start = time.perf_counter()
+            status, _ = await _request(reader, writer, host, 'POST', path, body)
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                errors[0] += 1
+    finally:
+        writer.close()
+
+
+async def run_load(url, model_id, concurrency, total, batch, duration, seed=0):
+    parts = urlsplit(url)
+    host, port = parts.hostname, parts.port or 80
+    rng = np.random.default_rng(seed)
+    # Beberapa body berbeda yang dipakai bergiliran (dibuat sebelum pengukuran)
+    bodies = [json.dumps({'responses': rng.uniform(0, 3, batch).round(5).tolist()}).encode()
+              for _ in range(16)]
+    path = f"/models/{model_id}/predict"
+    latencies, errors, counter = [], [0], [0]
+    deadline = time.perf_counter() + duration if duration else float('inf')
+    start = time.perf_counter()
+    await asyncio.gather(*(_worker(host, port, path, bodies, deadline, latencies, errors,
+                                   counter, total) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    lat = np.array(latencies) * 1e3
+    return {
+        'requests': len(lat),
+        'errors': errors[0],
+        'concurrency': concurrency,
+        'batch': batch,
+        'seconds': elapsed,
+        'requests_per_second': len(lat) / elapsed,
+        'responses_per_second': len(lat) * batch / elapsed,
+        'p50_ms': float(np.percentile(lat, 50)),
+        'p90_ms': float(np.percentile(lat, 90)),
+        'p99_ms': float(np.percentile(lat, 99)),
+        'max_ms': float(lat.max()),
+    }
+
+
+async def register_example(url):
+    parts = urlsplit(url)
+    reader, writer = await asyncio.open_connection(parts.hostname, parts.port or 80)
+    try:
+        status, payload = await _request(reader, writer, parts.hostname, 'POST', '/models',
+                                         json.dumps(EXAMPLE_MODEL).encode())
+    finally:
+        writer.close()
+    if status != 201:
+        raise RuntimeError(f"Registering example model failed: {payload.decode()}")
+    return EXAMPLE_MODEL['model_id']
+
+
+def spawn_server(timeout=60):
+    """Jalankan `python -m nanocalibrate serve` di port bebas; kembalikan (proses, url)"""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    proc = subprocess.Popen([sys.executable, '-m', 'nanocalibrate', 'serve', '--port', str(port)],
+                            cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    start = time.perf_counter()
+    while time.perf_counter() - start < timeout:
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=0.5):
+                return proc, f"http://127.0.0.1:{port}"
+        except OSError:
+            time.sleep(0.05)
+    proc.terminate()
+    raise TimeoutError("Prediction service did not start")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the NanoCalibrate prediction service")
+    parser.add_argument('--url', default='http://127.0.0.1:8765')
+    parser.add_argument('--spawn', action='store_true',
+                        help="Start a local service and register an example model")
+    parser.add_argument('--model', default=None, help="Model ID to predict with")
+    parser.add_argument('--concurrency', type=int, default=32, help="Parallel connections")
+    parser.add_argument('--requests', type=int, default=5000, help="Total requests")
+    parser.add_argument('--duration', type=float, default=None,
+                        help="Stop after this many seconds instead")
+    parser.add_argument('--batch', type=int, default=100, help="Responses per request")
+    parser.add_argument('--output', default=None, help="Write the summary as JSON")
+    args = parser.parse_args(argv)
+
+    proc = None
+    url = args.url
+    try:
+        if args.spawn:
+            proc, url = spawn_server()
+        model_id = args.model
+        if model_id is None:
+            model_id = asyncio.run(register_example(url))
+        total = args.requests if args.duration is None else float('inf')
+        result = asyncio.run(run_load(url, model_id, args.concurrency, total, args.batch,
+                                      args.duration))
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+
+    print(f"{result['requests']} requests ({result['errors']} errors) in {result['seconds']:.2f} s "
+          f"with {result['concurrency']} connections, {result['batch']} responses/request")
+    print(f"  {result['requests_per_second']:.0f} req/s, "
+          f"{result['responses_per_second']:.0f} responses/s")
+    print(f"  latency p50 {result['p50_ms']:.2f} ms | p90 {result['p90_ms']:.2f} ms | "
+          f"p99 {result['p99_ms']:.2f} ms | max {result['max_ms']:.2f} ms")
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(result, f, indent=2)
+    return 1 if result['errors'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
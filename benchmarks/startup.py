@@ -0,0 +1,163 @@
+"""Benchmark cold start: waktu import modul dan waktu render pertama tiap halaman.
+
+Contoh:
+    python benchmarks/startup.py --output startup_results.json
+    python benchmarks/startup.py --baseline benchmarks/startup_baseline.json --server
+
+Setiap pengukuran dijalankan di proses Python baru (seperti container yang
+baru menyala) dan diulang `--repeat` kali; yang dicatat waktu terbaik.
+`first_render` menjalankan script lewat `streamlit.testing` sampai semua
+elemen halaman selesai dibuat; halaman selain Data Input dibuka sebagai
+navigasi pertama setelah halaman awal, sehingga import modulnya ikut
+terukur. Dengan `--server`, waktu sampai server `streamlit run` siap
+menerima koneksi juga diukur.
+"""
+import argparse
+import json
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+from bench import case_key, compare, environment
+
+ROOT = Path(__file__).resolve().parent.parent
+APP = ROOT / "streamlit_app.py"
+
+IMPORT_MODULES = (
+    'streamlit', 'pandas', 'scipy.special', 'plotly.graph_objects', 'nanocalibrate',
+    'nanocalibrate.calibration', 'nanocalibrate.plotting', 'app_pages.data_input',
+    'app_pages.calibration_curve', 'app_pages.sample_prediction', 'app_pages.method_validation',
+)
+PAGES = ("📥 Data Input", "📈 Calibration Curve", "🔍 Sample Prediction", "📊 Method Validation")
+
+_IMPORT_SNIPPET = """
+import time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+"""
+
+_RENDER_SNIPPET = """
+import time
+start = time.perf_counter()
+import pandas as pd
+from streamlit.testing.v1 import AppTest
+from nanocalibrate import dataset_store
+at = AppTest.from_file({app!r}, default_timeout=120)
+at.run()
+first = time.perf_counter() - start
+if {page!r} != {home!r}:
+    at.session_state['calibration_data'] = dataset_store.put(pd.DataFrame({{
+        'Concentration': [0, 0.5, 1.0, 2.0, 5.0, 10.0],
+        'Response': [0.01, 0.15, 0.32, 0.61, 1.52, 3.01]}}))
+    start = time.perf_counter()
+    at.sidebar.radio[0].set_value({page!r}).run()
+    first = time.perf_counter() - start
+assert not at.exception, at.exception
+print(first)
+"""
+
+
+def run_child(code):
+    """Jalankan `code` di interpreter baru; kembalikan (angka terakhir di stdout, durasi proses)"""
+    start = time.perf_counter()
+    out = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True,
+                         text=True, check=True)
+    wall = time.perf_counter() - start
+    return float(out.stdout.strip().splitlines()[-1]), wall
+
+
+def best_of(repeat, func):
+    return min((func() for _ in range(repeat)), key=lambda result: result[0])
+
+
+def bench_imports(repeat):
+    for module in IMPORT_MODULES:
+        seconds, wall = best_of(repeat, lambda: run_child(_IMPORT_SNIPPET.format(module=module)))
+        yield {'name': 'import', 'size': module, 'seconds': seconds, 'process_seconds': wall}
+
+
+def bench_first_render(repeat):
+    for page in PAGES:
+        code = _RENDER_SNIPPET.format(app=str(APP), page=page, home=PAGES[0])
+        seconds, wall = best_of(repeat, lambda: run_child(code))
+        yield {'name': 'first_render', 'size': page, 'seconds': seconds, 'process_seconds': wall}
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def bench_server(repeat, timeout=120):
+    """Waktu dari `streamlit run` sampai /_stcore/health menjawab"""
+    best = None
+    for _ in range(repeat):
+        port = _free_port()
+        start = time.perf_counter()
+        proc = subprocess.Popen(
+            [sys.executable, '-m', 'streamlit', 'run', str(APP), '--server.headless', 'true',
+             '--server.port', str(port), '--browser.gatherUsageStats', 'false'],
+            cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            while time.perf_counter() - start < timeout:
+                try:
+                    with urllib.request.urlopen(f'http://127.0.0.1:{port}/_stcore/health',
+                                                timeout=1) as response:
+                        if response.status == 200:
+                            break
+                except OSError:
+                    time.sleep(0.05)
+            else:
+                raise TimeoutError("Streamlit server did not become ready")
+            elapsed = time.perf_counter() - start
+        finally:
+            proc.terminate()
+            proc.wait()
+        best = elapsed if best is None else min(best, elapsed)
+    yield {'name': 'server_ready', 'size': 'streamlit run', 'seconds': best}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="NanoCalibrate cold-start benchmark")
+    parser.add_argument('--repeat', type=int, default=3, help="Fresh processes per measurement")
+    parser.add_argument('--server', action='store_true', help="Also time `streamlit run` readiness")
+    parser.add_argument('--output', default='startup_results.json')
+    parser.add_argument('--baseline', default=None, help="Saved results JSON to compare against")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="Allowed slowdown vs baseline (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    suites = [bench_imports(args.repeat), bench_first_render(args.repeat)]
+    if args.server:
+        suites.append(bench_server(args.repeat))
+    results = {'environment': environment(), 'cases': []}
+    for suite in suites:
+        for case in suite:
+            results['cases'].append(case)
+            print(f"{case_key(case):70s} {case['seconds'] * 1e3:10.1f} ms", flush=True)
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        for key, ratio in regressions:
+            print(f"REGRESSION {key}: {ratio:.2f}x baseline")
+        if regressions:
+            status = 1
+        else:
+            print(f"No regressions beyond {args.threshold:.0%} of baseline.")
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.output}")
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
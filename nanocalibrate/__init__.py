@@ -0,0 +1,67 @@
+"""NanoCalibrate: perhitungan kalibrasi analitik yang dipakai aplikasi Streamlit
+
+Submodul baru di-import saat salah satu namanya pertama kali dipakai
+(PEP 562), jadi `import nanocalibrate` tidak langsung memuat pandas,
+scipy atau plotly.
+"""
+
+import importlib
+
+# Nama publik -> submodul asalnya
+_EXPORTS = {
+    'MODEL_FORMAT_VERSION': 'artifacts', 'ModelCache': 'artifacts', 'dump_models': 'artifacts',
+    'load_model': 'artifacts', 'parse_models': 'artifacts',
+    'load_models': 'artifacts', 'model_cache': 'artifacts', 'model_records': 'artifacts',
+    'model_results': 'artifacts', 'save_model': 'artifacts', 'save_models': 'artifacts',
+    'LRUCache': 'cache', 'array_hash': 'cache', 'cached_calibration': 'cache',
+    'fit_cache': 'cache',
+    'FIT_KEYS': 'calibration', 'calculate_calibration': 'calibration',
+    'calibrate_frame': 'calibration', 'fit_batch': 'calibration',
+    'fit_from_stats': 'calibration',
+    'influence_diagnostics': 'diagnostics', 'influence_frame': 'diagnostics',
+    'EXPORT_FORMATS': 'export', 'available_formats': 'export', 'cached_export': 'export',
+    'cached_text': 'export', 'export_bytes': 'export', 'export_cache': 'export',
+    'export_file_name': 'export', 'export_mime': 'export', 'frame_hash': 'export',
+    'lazy_export': 'export',
+    'StreamSummary': 'ingest', 'iter_response_chunks': 'ingest', 'read_columns': 'ingest',
+    'read_responses': 'ingest', 'read_samples': 'ingest', 'read_table': 'ingest',
+    'stream_predictions': 'ingest',
+    'find_linear_range': 'linear_range', 'linear_range_frame': 'linear_range',
+    'CalibrationModel': 'online',
+    'PREDICTION_COLUMNS': 'prediction', 'predict_concentrations': 'prediction',
+    'prediction_frame': 'prediction', 'prediction_interval': 'prediction',
+    'RunProfiler': 'profiling', 'read_log': 'profiling', 'span_totals': 'profiling',
+    'DEFAULT_TOLERANCE': 'replicates', 'cluster_responses': 'replicates',
+    'group_replicates': 'replicates', 'replicate_interval': 'replicates',
+    'replicate_summary': 'replicates',
+    'SampleQueue': 'samples',
+    'REPORT_FORMATS': 'report', 'REPORT_MAX_ROWS': 'report', 'ReportPool': 'report',
+    'cached_report': 'report', 'calibration_report': 'report', 'render_report': 'report',
+    'report_cache': 'report', 'report_formats': 'report', 'report_html': 'report',
+    'report_pool': 'report',
+    'ModelRegistry': 'service', 'PredictionServer': 'service', 'PredictionService': 'service',
+    'DatasetHandle': 'store', 'DatasetStore': 'store', 'dataset_store': 'store',
+    'DEFAULT_PAGE_SIZE': 'tables', 'format_page': 'tables', 'page_count': 'tables',
+    'table_page': 'tables', 'table_view': 'tables',
+    'bootstrap_calibration': 'uncertainty', 'bootstrap_predictions': 'uncertainty',
+    'accuracy_table': 'validation', 'lack_of_fit_anova': 'validation', 'mandel_test': 'validation',
+    'precision_table': 'validation', 'validate_method': 'validation',
+    'DEFAULT_WATCH_ROOT': 'watch', 'FolderWatcher': 'watch', 'resolve_under': 'watch',
+    'calibrate_workbook': 'workbook', 'read_workbook': 'workbook', 'sheet_names': 'workbook',
+    'workbook_cache': 'workbook',
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{_EXPORTS[name]}', __name__), name)
+    # Simpan di namespace paket agar akses berikutnya tidak lewat __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,262 @@
+import os
+import shutil
+import stat
+import threading
+import time
+import uuid
+
+import numpy as np
+
+from .calibration import FIT_KEYS, calculate_calibration
+
+# Format file model: header (magic, versi, jumlah record) + record biner berukuran tetap
+MODEL_MAGIC = b'NCALMDL\0'
+MODEL_FORMAT_VERSION = 1
+MODEL_SUFFIX = '.ncal'
+_HEADER = np.dtype([('magic', 'S8'), ('version', '<u4'), ('reserved', '<u4'), ('count', '<u8')])
+
+# Satu record per model: identitas, statistik cukup dan parameter hasil fit
+MODEL_DTYPE = np.dtype(
+    [('model_id', 'S64'), ('data_hash', 'S32'), ('created', '<f8'), ('confidence', '<f8')]
+    + [(key, '<i8' if key == 'n' else '<f8') for key in FIT_KEYS]
+)
+# dtype record per versi format (versi lama tetap bisa dibaca)
+_RECORD_DTYPES = {1: MODEL_DTYPE}
+
+# Folder cache model di disk (opsional, harus privat); tanpa ini cache dimatikan
+DEFAULT_MODEL_CACHE_DIR = os.environ.get('NANOCALIBRATE_MODEL_CACHE') or None
+# Jumlah maksimum file model di cache; file terlama dihapus di atas batas ini
+DEFAULT_MODEL_CACHE_ENTRIES = int(os.environ.get('NANOCALIBRATE_MODEL_CACHE_ENTRIES', 10000))
+
+
+def model_records(fits, model_ids=None, data_hashes=None, confidence=0.95):
+    """Array record model dari hasil fit.
+
+    `fits` berupa dict hasil `calculate_calibration` (satu model), list
+    dict tersebut, atau dict array dari `fit_batch` (banyak model sekaligus,
+    tanpa loop Python).
+    """
+    if isinstance(fits, dict):
+        columns = {key: np.atleast_1d(np.asarray(fits[key])).ravel() for key in FIT_KEYS}
+    else:
+        columns = {key: np.array([fit[key] for fit in fits]) for key in FIT_KEYS}
+    count = len(columns['slope'])
+    records = np.zeros(count, dtype=MODEL_DTYPE)
+    for key, values in columns.items():
+        records[key] = values
+    records['model_id'] = [str(i).encode() for i in model_ids] if model_ids is not None else b''
+    records['data_hash'] = [str(h).encode() for h in data_hashes] if data_hashes is not None else b''
+    records['created'] = time.time()
+    records['confidence'] = confidence
+    return records
+
+
+def model_results(records):
+    """List dict parameter (seperti `calculate_calibration`, tanpa y_pred/residuals).
+
+    Konversi per kolom (`tolist`), bukan per field per record, agar ribuan
+    model bisa dibaca dalam hitungan milidetik.
+    """
+    columns = {key: records[key].tolist() for key in FIT_KEYS}
+    columns['model_id'] = [v.decode() for v in records['model_id'].tolist()]
+    columns['data_hash'] = [v.decode() for v in records['data_hash'].tolist()]
+    columns['confidence'] = records['confidence'].tolist()
+    names = list(columns)
+    results = []
+    for values in zip(*columns.values()):
+        fit = dict(zip(names, values))
+        fit['equation'] = f"y = {fit['slope']:.4f}x + {fit['intercept']:.4f}"
+        results.append(fit)
+    return results
+
+
+def check_private_dir(path, label):
+    """Buat `path` (mode 0700) jika belum ada; tolak folder milik user lain atau yang bisa ditulis user lain"""
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    info = os.stat(path)
+    if hasattr(os, 'getuid') and info.st_uid != os.getuid():
+        raise PermissionError(f"{label} folder {path} is owned by another user")
+    if info.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        raise PermissionError(f"{label} folder {path} is writable by other users")
+    return path
+
+
+def _atomic_write(path, data):
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp = os.path.join(directory, f'.{os.path.basename(path)}.{uuid.uuid4().hex}.tmp')
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def dump_models(records):
+    """Isi file `.ncal` (bytes) untuk array record model"""
+    records = np.asarray(records, dtype=MODEL_DTYPE)
+    header = np.zeros(1, dtype=_HEADER)
+    header['magic'] = MODEL_MAGIC
+    header['version'] = MODEL_FORMAT_VERSION
+    header['count'] = len(records)
+    return header.tobytes() + records.tobytes()
+
+
+def parse_models(data):
+    """Array record model dari isi file `.ncal` (satu `np.frombuffer`, tanpa parsing per model)"""
+    if len(data) < _HEADER.itemsize:
+        raise ValueError("Not a NanoCalibrate model file")
+    header = np.frombuffer(data, dtype=_HEADER, count=1)[0]
+    if header['magic'] != MODEL_MAGIC.rstrip(b'\0'):
+        raise ValueError("Not a NanoCalibrate model file")
+    version = int(header['version'])
+    if version not in _RECORD_DTYPES:
+        raise ValueError(f"Unsupported model file version {version}")
+    return np.frombuffer(data, dtype=_RECORD_DTYPES[version], count=int(header['count']),
+                         offset=_HEADER.itemsize)
+
+
+def save_models(path, records):
+    """Tulis banyak record model ke satu file (ditulis atomik)"""
+    _atomic_write(path, dump_models(records))
+
+
+def load_models(path):
+    with open(path, 'rb') as f:
+        return parse_models(f.read())
+
+
+def save_model(path, results, model_id='', data_hash='', confidence=0.95):
+    save_models(path, model_records(results, [model_id], [data_hash], confidence))
+
+
+def load_model(path):
+    """Parameter satu model dari file `.ncal`"""
+    records = load_models(path)
+    if len(records) != 1:
+        raise ValueError(f"{path} holds {len(records)} models; use load_models")
+    return model_results(records)[0]
+
+
+class ModelCache:
+    """Cache hasil fit di disk, satu file `.ncal` per hash data.
+
+    Kunci sama dengan `fit_cache` (hash x, y dan opsi fit), sehingga
+    dataset yang pernah di-fit - di sesi, proses atau hari lain - tidak
+    di-fit ulang; cukup membaca satu record lalu menghitung y_pred dan
+    residual dari data yang sudah ada di tangan.
+
+    Cache hanya aktif jika `root` diberikan. Folder harus milik user ini
+    dan tidak bisa ditulis user lain; record dipakai hanya jika hash,
+    confidence, n dan rata-rata x/y cocok dengan data yang diminta.
+    Di atas `max_entries` file terlama dihapus.
+    """
+
+    def __init__(self, root=DEFAULT_MODEL_CACHE_DIR, max_entries=DEFAULT_MODEL_CACHE_ENTRIES):
+        self.root = root
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._count = None
+        self.hits = 0
+        self.misses = 0
+
+    def _ready(self):
+        """Periksa folder dan hitung isinya sekali (selanjutnya dicatat lewat `put`)"""
+        if self._count is None:
+            check_private_dir(self.root, "Model cache")
+            self._count = sum(len(files) for _, _, files in os.walk(self.root))
+
+    def path(self, key):
+        return os.path.join(self.root, key[:2], key + MODEL_SUFFIX)
+
+    def get(self, key, check=None):
+        """Record untuk `key`, atau None jika tidak ada atau `check(record)` menolaknya"""
+        try:
+            results = load_model(self.path(key))
+        except (OSError, ValueError):
+            results = None
+        if results is not None and check is not None and not check(results):
+            results = None
+        with self._lock:
+            if results is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return results
+
+    def put(self, key, results, confidence=0.95):
+        path = self.path(key)
+        with self._lock:
+            self._ready()
+            new = not os.path.exists(path)
+            save_model(path, results, data_hash=key, confidence=confidence)
+            if new:
+                self._count += 1
+            if self._count > self.max_entries:
+                self._evict()
+
+    def _evict(self):
+        """Hapus file terlama sampai tersisa 90% `max_entries`"""
+        files = []
+        for directory, _, names in os.walk(self.root):
+            for name in names:
+                path = os.path.join(directory, name)
+                try:
+                    files.append((os.stat(path).st_mtime, path))
+                except OSError:
+                    pass
+        files.sort()
+        excess = len(files) - int(self.max_entries * 0.9)
+        for _, path in files[:max(excess, 0)]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._count = len(files) - max(excess, 0)
+
+    @staticmethod
+    def _matches(results, key, x, y, confidence):
+        """Apakah record di disk benar-benar hasil fit data ini"""
+        return (results['data_hash'] == key and results['confidence'] == confidence
+                and results['n'] == len(x) and len(x) > 0
+                and np.isclose(results['x_mean'], x.mean()) and np.isclose(results['y_mean'], y.mean()))
+
+    def calibrate(self, key, x, y, confidence=0.95):
+        """`calculate_calibration(x, y)` dengan cache di disk untuk kunci `key`"""
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        if not self.root:
+            return calculate_calibration(x, y, confidence=confidence)
+        with self._lock:
+            self._ready()
+        results = self.get(key, lambda record: self._matches(record, key, x, y, confidence))
+        if results is None:
+            results = calculate_calibration(x, y, confidence=confidence)
+            if results is not None:
+                self.put(key, results, confidence)
+            return results
+        for meta in ('model_id', 'data_hash', 'confidence'):
+            del results[meta]
+        results['y_pred'] = results['intercept'] + results['slope'] * x
+        results['residuals'] = y - results['y_pred']
+        return results
+
+    def clear(self):
+        with self._lock:
+            if self.root and os.path.isdir(self.root):
+                for name in os.listdir(self.root):
+                    shutil.rmtree(os.path.join(self.root, name), ignore_errors=True)
+            self._count = None if self.root else 0
+            self.hits = self.misses = 0
+
+    def __len__(self):
+        if not self.root:
+            return 0
+        with self._lock:
+            self._ready()
+            return self._count
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self)}
+
+
+# Cache model di disk yang dipakai `cached_calibration` (aktif jika NANOCALIBRATE_MODEL_CACHE di-set)
+model_cache = ModelCache()
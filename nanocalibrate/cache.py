@@ -0,0 +1,133 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from .artifacts import model_cache
+
+
+def array_hash(*arrays, **options):
+    """Hash isi array (dtype, shape, bytes) beserta opsi perhitungan"""
+    h = hashlib.blake2b(digest_size=16)
+    for arr in arrays:
+        arr = np.ascontiguousarray(arr)
+        h.update(str(arr.dtype).encode())
+        h.update(str(arr.shape).encode())
+        if arr.dtype == object:
+            h.update(repr(arr.tolist()).encode())
+        else:
+            h.update(arr.tobytes())
+    for key in sorted(options):
+        h.update(f"{key}={options[key]!r};".encode())
+    return h.hexdigest()
+
+
+class LRUCache:
+    """Cache LRU thread-safe dengan penghitung hit/miss.
+
+    Satu instance di level modul dipakai bersama oleh semua sesi Streamlit
+    dalam proses yang sama, karena modul yang di-import tidak dieksekusi
+    ulang saat script rerun. Dengan `maxbytes`, total ukuran nilai bytes
+    juga dibatasi; nilai yang lebih besar dari `maxbytes` tidak disimpan.
+    """
+
+    def __init__(self, maxsize=128, maxbytes=None):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.nbytes = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        size = _nbytes(value) if self.maxbytes is not None else 0
+        with self._lock:
+            if key in self._data:
+                self.nbytes -= _nbytes(self._data.pop(key)) if self.maxbytes is not None else 0
+            if self.maxbytes is not None and size > self.maxbytes:
+                return
+            self._data[key] = value
+            self.nbytes += size
+            while len(self._data) > self.maxsize or (
+                    self.maxbytes is not None and self.nbytes > self.maxbytes):
+                _, evicted = self._data.popitem(last=False)
+                self.nbytes -= _nbytes(evicted) if self.maxbytes is not None else 0
+                self.evictions += 1
+
+    def get_or_compute(self, key, func):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = func()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.nbytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._data),
+            'maxsize': self.maxsize,
+            'nbytes': self.nbytes,
+            'hit_rate': self.hits / total if total else 0.0,
+        }
+
+
+_MISSING = object()
+
+
+def _nbytes(value):
+    """Ukuran nilai cache dalam byte (hanya bytes/array yang dihitung)"""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    return getattr(value, 'nbytes', 0)
+
+# Cache hasil fit yang dipakai bersama semua halaman dan sesi
+fit_cache = LRUCache(maxsize=256)
+
+
+def _freeze(results):
+    """Jadikan array di hasil fit read-only agar aman dipakai bersama"""
+    if results is not None:
+        for value in results.values():
+            if isinstance(value, np.ndarray):
+                value.setflags(write=False)
+    return results
+
+
+def cached_calibration(x, y, confidence=0.95):
+    """calculate_calibration dengan memoization berdasarkan hash data.
+
+    Urutan pencarian: LRU di memori, lalu file model di `model_cache`
+    (disk, bertahan antar proses), baru fit ulang jika keduanya kosong.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    key = array_hash(x, y, func='calculate_calibration', confidence=confidence)
+    return fit_cache.get_or_compute(
+        key, lambda: _freeze(model_cache.calibrate(key, x, y, confidence=confidence)))
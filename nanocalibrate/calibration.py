@@ -0,0 +1,185 @@
+import numpy as np
+import pandas as pd
+# Distribusi t lewat scipy.special (stdtr = CDF, stdtrit = inverse CDF):
+# import-nya jauh lebih ringan daripada scipy.stats
+from scipy import special
+
+# Nama parameter yang dihasilkan engine batch (semua berupa array)
+FIT_KEYS = (
+    'n', 'slope', 'intercept', 'r_value', 'r_squared', 'p_value', 's_res',
+    'LOD', 'LOQ', 'se_slope', 'se_intercept', 't_val', 'ci_slope',
+    'ci_intercept', 'x_mean', 'y_mean', 'Sxx', 'Syy', 'Sxy', 'x_min', 'x_max'
+)
+
+
+def _group_sum(values, order, starts):
+    """Jumlahkan baris per grup (baris sudah diurutkan per grup)"""
+    return np.add.reduceat(values[order], starts, axis=0)
+
+
+def fit_from_stats(n, x_mean, y_mean, Sxx, Syy, Sxy, x_min, x_max, confidence=0.95):
+    """Parameter kalibrasi dari statistik cukup (skalar atau array).
+
+    Sxx, Syy dan Sxy adalah jumlah kuadrat/hasil kali terpusat. Dipakai
+    bersama oleh `fit_batch` dan model inkremental agar rumusnya identik.
+    """
+    n = np.asarray(n)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        slope = np.where(Sxx > 0, Sxy / Sxx, np.nan)
+        intercept = y_mean - slope * x_mean
+
+        # R-value (sama dengan stats.linregress)
+        r_value = np.clip(Sxy / np.sqrt(Sxx * Syy), -1.0, 1.0)
+        r_value = np.where(Syy > 0, r_value, np.nan)
+        r_squared = r_value ** 2
+
+        # Standard deviation of residuals (ddof=2)
+        df_res = n - 2
+        sse = np.maximum(Syy - slope * Sxy, 0.0)
+        s_res = np.where(df_res > 0, np.sqrt(sse / df_res), 0.0)
+
+        # p-value untuk slope != 0
+        tiny = 1.0e-20
+        t_stat = r_value * np.sqrt(df_res / ((1.0 - r_value + tiny) * (1.0 + r_value + tiny)))
+        p_value = np.where(df_res > 0,
+                           2 * special.stdtr(np.maximum(df_res, 1), -np.abs(t_stat)),
+                           np.where(Syy > 0, 0.0, 1.0))
+
+        # LOD dan LOQ (3.3*sigma/slope dan 10*sigma/slope)
+        nonzero = np.isfinite(slope) & (slope != 0)
+        LOD = np.where(nonzero, 3.3 * s_res / np.abs(slope), 0.0)
+        LOQ = np.where(nonzero, 10 * s_res / np.abs(slope), 0.0)
+
+        # Standard error of slope dan intercept
+        se_slope = np.where(Sxx > 0, s_res / np.sqrt(Sxx), 0.0)
+        se_intercept = np.where(Sxx > 0, s_res * np.sqrt(1 / n + x_mean ** 2 / Sxx), 0.0)
+
+    # Confidence intervals
+    t_val = np.where(df_res > 0,
+                     special.stdtrit(np.maximum(df_res, 1), 0.5 + confidence / 2),
+                     0.0)
+
+    return {
+        'n': n.astype(int), 'slope': slope, 'intercept': intercept,
+        'r_value': r_value, 'r_squared': r_squared, 'p_value': p_value,
+        's_res': s_res, 'LOD': LOD, 'LOQ': LOQ, 'se_slope': se_slope,
+        'se_intercept': se_intercept, 't_val': t_val,
+        'ci_slope': t_val * se_slope, 'ci_intercept': t_val * se_intercept,
+        'x_mean': x_mean, 'y_mean': y_mean, 'Sxx': Sxx, 'Syy': Syy, 'Sxy': Sxy,
+        'x_min': x_min, 'x_max': x_max,
+    }
+
+
+def fit_batch(x, Y, groups=None, confidence=0.95):
+    """Regresi linear untuk banyak kurva sekaligus.
+
+    `x` berukuran (n,) atau (n, m), `Y` berukuran (n,) atau (n, m) dengan
+    satu kolom respons per kurva. Jika `groups` (n,) diberikan, setiap
+    kombinasi grup (run/batch) x kolom dihitung sebagai kurva terpisah.
+    Nilai NaN diabaikan per kurva. Hasilnya dict berisi array berbentuk
+    (m,) atau (k, m) untuk k grup, dihitung dari statistik cukup
+    (n, mean, Sxx, Syy, Sxy) tanpa loop Python per kurva.
+    """
+    Y = np.asarray(Y, dtype=float)
+    squeeze = Y.ndim == 1
+    if squeeze:
+        Y = Y[:, None]
+    x = np.asarray(x, dtype=float)
+    if x.ndim == 1:
+        x = x[:, None]
+    x, Y = np.broadcast_arrays(x, Y)
+
+    # Bobot 0/1 untuk mengabaikan data kosong
+    w = np.isfinite(x) & np.isfinite(Y)
+    xw = np.where(w, x, 0.0)
+    yw = np.where(w, Y, 0.0)
+    w = w.astype(float)
+
+    if groups is None:
+        labels = None
+        n = w.sum(axis=0)[None, :]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            x_mean = xw.sum(axis=0)[None, :] / n
+            y_mean = yw.sum(axis=0)[None, :] / n
+        dx = (xw - x_mean) * w
+        dy = (yw - y_mean) * w
+        Sxx = np.einsum('ij,ij->j', dx, dx)[None, :]
+        Syy = np.einsum('ij,ij->j', dy, dy)[None, :]
+        Sxy = np.einsum('ij,ij->j', dx, dy)[None, :]
+        x_min = np.where(w > 0, x, np.inf).min(axis=0)[None, :]
+        x_max = np.where(w > 0, x, -np.inf).max(axis=0)[None, :]
+    else:
+        labels, inverse = np.unique(np.asarray(groups), return_inverse=True)
+        inverse = inverse.ravel()
+        order = np.argsort(inverse, kind='stable')
+        starts = np.searchsorted(inverse[order], np.arange(len(labels)))
+        n = _group_sum(w, order, starts)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            x_mean = _group_sum(xw, order, starts) / n
+            y_mean = _group_sum(yw, order, starts) / n
+        # Pusatkan data terhadap rata-rata grupnya (stabil secara numerik)
+        dx = (xw - x_mean[inverse]) * w
+        dy = (yw - y_mean[inverse]) * w
+        Sxx = _group_sum(dx * dx, order, starts)
+        Syy = _group_sum(dy * dy, order, starts)
+        Sxy = _group_sum(dx * dy, order, starts)
+        x_min = np.minimum.reduceat(np.where(w > 0, x, np.inf)[order], starts, axis=0)
+        x_max = np.maximum.reduceat(np.where(w > 0, x, -np.inf)[order], starts, axis=0)
+
+    out = fit_from_stats(n, x_mean, y_mean, Sxx, Syy, Sxy, x_min, x_max, confidence)
+    if labels is None:
+        out = {k: v[0] for k, v in out.items()}
+        if squeeze:
+            out = {k: v[0] for k, v in out.items()}
+    else:
+        if squeeze:
+            out = {k: v[:, 0] for k, v in out.items()}
+        out['groups'] = labels
+    return out
+
+
+def calibrate_frame(df, x_col, y_cols=None, group_col=None, confidence=0.95):
+    """Kalibrasi semua kolom respons dalam DataFrame, hasil berupa tabel"""
+    if y_cols is None:
+        y_cols = [c for c in df.select_dtypes('number').columns
+                  if c not in (x_col, group_col)]
+    y_cols = list(y_cols)
+    groups = df[group_col].values if group_col is not None else None
+    fit = fit_batch(df[x_col].values, df[y_cols].to_numpy(dtype=float),
+                    groups=groups, confidence=confidence)
+
+    if group_col is None:
+        table = pd.DataFrame({k: fit[k] for k in FIT_KEYS})
+        table.insert(0, 'Analyte', y_cols)
+    else:
+        k, m = fit['slope'].shape
+        table = pd.DataFrame({key: fit[key].ravel() for key in FIT_KEYS})
+        table.insert(0, 'Analyte', np.tile(y_cols, k))
+        table.insert(0, group_col, np.repeat(fit['groups'], m))
+        table = table[table['n'] > 0].reset_index(drop=True)
+    return table
+
+
+def calculate_calibration(x, y, confidence=0.95):
+    """Hitung parameter kalibrasi"""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if len(x) < 2:
+        return None
+
+    fit = {k: v.item() for k, v in fit_batch(x, y, confidence=confidence).items()}
+    if fit['Sxx'] <= 0:
+        return None
+
+    slope, intercept = fit['slope'], fit['intercept']
+
+    # Prediksi y values dan residuals
+    y_pred = intercept + slope * x
+    residuals = y - y_pred
+
+    fit.update({
+        'y_pred': y_pred,
+        'residuals': residuals,
+        'equation': f"y = {slope:.4f}x + {intercept:.4f}"
+    })
+    return fit
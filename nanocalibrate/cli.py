@@ -0,0 +1,258 @@
+"""Perintah tanpa browser: kalibrasi batch satu folder file dan layanan HTTP prediksi.
+
+Contoh:
+    python -m nanocalibrate batch data/ --out hasil/ --workers 8
+    python -m nanocalibrate serve --port 8765 --model plate1=data/plate1.csv
+    python -m nanocalibrate serve --artifacts hasil/models.ncal
+    python -m nanocalibrate watch /data/spectro --model plate1.ncal --out live.csv
+
+Pada mode batch, setiap file kalibrasi (`.csv`, `.xlsx`, `.xls`) adalah
+satu run; workbook dengan beberapa sheet menjadi satu run per sheet
+(`<nama>_<sheet>`). Respons sampel untuk run `<nama>` dibaca dari
+`<nama>_samples.txt` atau `<nama>_samples.csv` jika ada.
+
+Mode watch mengikuti file sampel yang bertambah di satu folder dan
+memprediksi hanya baris baru (lihat `watch.py`).
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+from .artifacts import MODEL_SUFFIX, load_model, model_records, save_models
+from .cache import cached_calibration
+from .calibration import FIT_KEYS
+from .diagnostics import influence_diagnostics
+from .ingest import read_table, stream_predictions
+from .report import REPORT_FORMATS, REPORT_MAX_ROWS, calibration_report, render_report
+from .workbook import sheet_names
+
+CALIBRATION_SUFFIXES = ('.csv', '.xlsx', '.xls')
+SAMPLE_TAG = '_samples'
+SAMPLE_SUFFIXES = ('.txt', '.csv')
+
+# Kolom ringkasan per run di file hasil gabungan
+SUMMARY_KEYS = ('n', 'slope', 'intercept', 'r_squared', 'r_value', 'p_value', 's_res',
+                'LOD', 'LOQ', 'se_slope', 'se_intercept', 'ci_slope', 'ci_intercept',
+                'x_min', 'x_max')
+
+
+def _find_sample(directory, run):
+    for suffix in SAMPLE_SUFFIXES:
+        candidate = directory / f"{run}{SAMPLE_TAG}{suffix}"
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def find_runs(directory):
+    """Pasangkan setiap file kalibrasi dengan file sampelnya (jika ada).
+
+    Workbook Excel dengan beberapa sheet menghasilkan satu run per sheet
+    (`<nama>_<sheet>`); selain itu sheet-nya None (sheet pertama).
+    Mengembalikan list `(path, sample, sheet)`.
+    """
+    directory = Path(directory)
+    runs = []
+    for path in sorted(directory.iterdir()):
+        if path.suffix.lower() not in CALIBRATION_SUFFIXES or path.stem.endswith(SAMPLE_TAG):
+            continue
+        sheets = sheet_names(path) if path.suffix.lower() != '.csv' else []
+        if len(sheets) > 1:
+            for sheet in sheets:
+                runs.append((path, _find_sample(directory, f"{path.stem}_{sheet}"), sheet))
+        else:
+            runs.append((path, _find_sample(directory, path.stem), None))
+    return runs
+
+
+def run_calibration(cal_path, sample_path=None, out_dir=None, x_col=None, y_col=None,
+                    confidence=0.95, sheet=None, report_format=None):
+    """Fit satu file kalibrasi (atau satu sheet), tulis report dan prediksi, kembalikan ringkasan.
+
+    Dengan `report_format` ('HTML'/'PDF') juga ditulis report lengkap
+    dengan grafik dan tabel (`<run>_report.html`/`.pdf`).
+    """
+    cal_path = Path(cal_path)
+    run = cal_path.stem if sheet is None else f"{cal_path.stem}_{sheet}"
+    row = {'run': run, 'calibration_file': cal_path.name,
+           'sample_file': Path(sample_path).name if sample_path else None}
+    try:
+        df = read_table(str(cal_path), sheet_name=sheet)
+        xc = x_col if x_col is not None else df.columns[0]
+        yc = y_col if y_col is not None else df.columns[1 if len(df.columns) > 1 else 0]
+        results = cached_calibration(df[xc].values, df[yc].values, confidence=confidence)
+        if results is None:
+            raise ValueError("Not enough data points for calibration")
+        row.update({key: results[key] for key in SUMMARY_KEYS})
+        row['model'] = {key: results[key] for key in FIT_KEYS}
+        if results['n'] > 3:
+            valid = df[[xc, yc]].dropna()
+            diag = influence_diagnostics(valid[xc].values, valid[yc].values, confidence)
+            row['influential_standards'] = int(diag['influential'].sum())
+
+        if out_dir is not None:
+            out_dir = Path(out_dir)
+            (out_dir / f"{run}_report.txt").write_text(
+                calibration_report(results), encoding='utf-8')
+
+        summary = predictions = None
+        if sample_path is not None:
+            out = out_dir / f"{run}_predictions.csv" if out_dir is not None else None
+            summary = stream_predictions(str(sample_path), results, confidence=confidence,
+                                         out=out).as_dict()
+            row.update({f"sample_{key}": value for key, value in summary.items()})
+            if report_format is not None and out is not None:
+                predictions = pd.read_csv(out, nrows=REPORT_MAX_ROWS)
+
+        if report_format is not None and out_dir is not None:
+            (out_dir / f"{run}_report{REPORT_FORMATS[report_format][0]}").write_bytes(
+                render_report(df[xc].values, df[yc].values, results, predictions, summary,
+                              fmt=report_format, title=f"Calibration Report: {run}"))
+    except Exception as e:
+        row['error'] = f"{type(e).__name__}: {e}"
+    return row
+
+
+def _run_task(task):
+    return run_calibration(*task)
+
+
+def run_batch(directory, out_dir, workers=None, x_col=None, y_col=None, confidence=0.95,
+              report_format=None):
+    """Jalankan semua run di folder secara paralel (ProcessPoolExecutor).
+
+    Parameter semua model ditulis ke `models.ncal` di `out_dir`; report
+    HTML/PDF (opsional) dibuat di proses worker yang sama dengan run-nya.
+    Mengembalikan `(tabel_hasil, detik)`.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    tasks = [(cal, sample, out_dir, x_col, y_col, confidence, sheet, report_format)
+             for cal, sample, sheet in find_runs(directory)]
+    workers = workers or os.cpu_count() or 1
+
+    start = time.perf_counter()
+    if workers == 1 or len(tasks) <= 1:
+        rows = [_run_task(task) for task in tasks]
+    else:
+        chunksize = max(1, len(tasks) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            rows = list(pool.map(_run_task, tasks, chunksize=chunksize))
+    elapsed = time.perf_counter() - start
+
+    # Semua model yang berhasil di-fit disimpan ke satu file untuk `serve --artifacts`
+    fitted = [(row['run'], row.pop('model')) for row in rows if 'model' in row]
+    if fitted:
+        ids, fits = zip(*fitted)
+        save_models(out_dir / "models.ncal", model_records(fits, ids, confidence=confidence))
+
+    table = pd.DataFrame(rows)
+    if 'error' in table:
+        table = table[[c for c in table.columns if c != 'error'] + ['error']]
+    table.to_csv(out_dir / "batch_results.csv", index=False)
+    return table, elapsed
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='nanocalibrate',
+                                     description="NanoCalibrate headless tools")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    batch = sub.add_parser('batch', help="Calibrate and predict every run in a directory")
+    batch.add_argument('directory', help="Folder with calibration and *_samples files")
+    batch.add_argument('--out', default='nanocalibrate_results', help="Output folder")
+    batch.add_argument('--workers', type=int, default=None,
+                       help="Worker processes (default: all cores)")
+    batch.add_argument('--x-col', default=None, help="Concentration column (default: first)")
+    batch.add_argument('--y-col', default=None, help="Response column (default: second)")
+    batch.add_argument('--confidence', type=float, default=0.95)
+    batch.add_argument('--report', default=None, choices=['html', 'pdf'],
+                       help="Also write a full report with plots and tables per run")
+
+    serve = sub.add_parser('serve', help="Run the HTTP prediction service")
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=8765)
+    serve.add_argument('--model', action='append', default=[], metavar='ID=PATH',
+                       help="Fit a calibration file or load a .ncal model at startup (repeatable)")
+    serve.add_argument('--artifacts', action='append', default=[], metavar='FILE',
+                       help="Load every model in a .ncal model file (repeatable)")
+    serve.add_argument('--x-col', default=None, help="Concentration column (default: first)")
+    serve.add_argument('--y-col', default=None, help="Response column (default: second)")
+    serve.add_argument('--confidence', type=float, default=0.95)
+
+    watch = sub.add_parser('watch', help="Predict new readings appended to files in a directory")
+    watch.add_argument('directory', help="Folder the instrument writes sample files to")
+    watch.add_argument('--model', required=True, metavar='PATH',
+                       help="Calibration file (CSV/Excel) or .ncal model")
+    watch.add_argument('--out', default=None, help="CSV file the predictions are appended to")
+    watch.add_argument('--pattern', action='append', default=[],
+                       help="File name pattern to follow (repeatable, default: *.txt and *.csv)")
+    watch.add_argument('--column', default=None, help="Response column in CSV files "
+                                                      "(default: first)")
+    watch.add_argument('--interval', type=float, default=1.0, help="Seconds between polls")
+    watch.add_argument('--skip-existing', action='store_true',
+                       help="Ignore rows already in the files at startup")
+    watch.add_argument('--x-col', default=None, help="Concentration column (default: first)")
+    watch.add_argument('--y-col', default=None, help="Response column (default: second)")
+    watch.add_argument('--confidence', type=float, default=0.95)
+    return parser
+
+
+def load_calibration_model(path, x_col=None, y_col=None, confidence=0.95):
+    """Model dari file `.ncal`, atau fit dari file kalibrasi CSV/Excel"""
+    if str(path).endswith(MODEL_SUFFIX):
+        return load_model(path)
+    df = read_table(str(path))
+    xc = x_col if x_col is not None else df.columns[0]
+    yc = y_col if y_col is not None else df.columns[1 if len(df.columns) > 1 else 0]
+    results = cached_calibration(df[xc].values, df[yc].values, confidence=confidence)
+    if results is None:
+        raise ValueError("Not enough data points for calibration")
+    return results
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    if args.command == 'batch':
+        table, elapsed = run_batch(args.directory, args.out, workers=args.workers,
+                                   x_col=args.x_col, y_col=args.y_col,
+                                   confidence=args.confidence,
+                                   report_format=args.report.upper() if args.report else None)
+        n_files = len(table)
+        n_errors = int(table['error'].notna().sum()) if 'error' in table else 0
+        rate = n_files / elapsed if elapsed > 0 else float('inf')
+        print(f"Processed {n_files} run(s) in {elapsed:.2f} s ({rate:.1f} files/s), "
+              f"{n_errors} error(s). Results: {Path(args.out) / 'batch_results.csv'}")
+        return 1 if n_errors else 0
+    if args.command == 'serve':
+        from .service import serve
+        serve(args.host, args.port, models=args.model, x_col=args.x_col, y_col=args.y_col,
+              confidence=args.confidence, artifacts=args.artifacts)
+    if args.command == 'watch':
+        from .watch import DEFAULT_PATTERNS, FolderWatcher
+        model = load_calibration_model(args.model, args.x_col, args.y_col, args.confidence)
+        watcher = FolderWatcher(args.directory, model, patterns=args.pattern or DEFAULT_PATTERNS,
+                                column=args.column, output=args.out,
+                                confidence=args.confidence, skip_existing=args.skip_existing)
+
+        def report(new_rows, watcher):
+            stats = watcher.stats()
+            print(f"+{watcher.last_poll_rows} reading(s), {stats['rows']} total from {stats['files']} "
+                  f"file(s), mean concentration {stats['summary']['mean']:.6g}", flush=True)
+
+        print(f"Watching {args.directory} with {model['equation']}", flush=True)
+        try:
+            watcher.run(args.interval, callback=report)
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
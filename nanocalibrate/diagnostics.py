@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+
+from .calibration import fit_batch, fit_from_stats
+
+# Batas untuk menandai standar yang berpengaruh
+STUDENTIZED_LIMIT = 3.0
+COOKS_LIMIT = 1.0
+
+
+def influence_diagnostics(x, Y, confidence=0.95):
+    """Diagnostik outlier/pengaruh setiap standar tanpa fit ulang n kali.
+
+    Leverage, residual terstudentisasi (internal dan eksternal), Cook's
+    distance, DFFITS serta slope/intercept/LOD/LOQ leave-one-out dihitung
+    dari identitas hat-matrix: statistik cukup tiap fit leave-one-out
+    diperoleh dengan mengurangkan satu titik dari statistik penuh, jadi
+    totalnya O(n). `Y` boleh berukuran (n,) atau (n, m) untuk m kurva
+    sekaligus; data harus lengkap (tanpa NaN).
+    """
+    x = np.asarray(x, dtype=float)
+    Y = np.asarray(Y, dtype=float)
+    if x.ndim == 1 and Y.ndim == 2:
+        x = x[:, None]
+    x, Y = np.broadcast_arrays(x, Y)
+    fit = fit_batch(x, Y, confidence=confidence)
+    n = fit['n']
+    x_mean, y_mean = fit['x_mean'], fit['y_mean']
+    Sxx, Syy, Sxy = fit['Sxx'], fit['Syy'], fit['Sxy']
+    s_res = fit['s_res']
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        residual = Y - (fit['intercept'] + fit['slope'] * x)
+        leverage = 1 / n + (x - x_mean) ** 2 / Sxx
+        one_minus_h = 1 - leverage
+
+        # Residual terstudentisasi internal dan eksternal (deleted)
+        studentized = residual / (s_res * np.sqrt(one_minus_h))
+        s_loo = np.sqrt(np.maximum((n - 2) * s_res ** 2 - residual ** 2 / one_minus_h, 0.0)
+                        / (n - 3))
+        studentized_deleted = residual / (s_loo * np.sqrt(one_minus_h))
+
+        cooks_d = studentized ** 2 * leverage / (2 * one_minus_h)
+        dffits = studentized_deleted * np.sqrt(leverage / one_minus_h)
+
+        # Statistik cukup tanpa titik ke-i (downdate seperti model inkremental)
+        n_loo = n - 1
+        x_mean_loo = (n * x_mean - x) / n_loo
+        y_mean_loo = (n * y_mean - Y) / n_loo
+        Sxx_loo = np.maximum(Sxx - (x - x_mean_loo) * (x - x_mean), 0.0)
+        Syy_loo = np.maximum(Syy - (Y - y_mean_loo) * (Y - y_mean), 0.0)
+        Sxy_loo = Sxy - (x - x_mean_loo) * (Y - y_mean)
+
+    # Rentang x tanpa titik ke-i (cukup dua nilai terkecil/terbesar)
+    x_sorted = np.sort(x, axis=0)
+    x_min_loo = np.where(x == x_sorted[:1], x_sorted[1:2], x_sorted[:1])
+    x_max_loo = np.where(x == x_sorted[-1:], x_sorted[-2:-1], x_sorted[-1:])
+
+    loo = fit_from_stats(n_loo, x_mean_loo, y_mean_loo, Sxx_loo, Syy_loo, Sxy_loo,
+                         x_min_loo, x_max_loo, confidence)
+
+    influential = np.abs(studentized_deleted) > STUDENTIZED_LIMIT
+    influential |= cooks_d > COOKS_LIMIT
+
+    return {
+        'leverage': leverage,
+        'residual': residual,
+        'studentized': studentized,
+        'studentized_deleted': studentized_deleted,
+        'cooks_d': cooks_d,
+        'dffits': dffits,
+        'loo_slope': loo['slope'],
+        'loo_intercept': loo['intercept'],
+        'loo_s_res': loo['s_res'],
+        'loo_LOD': loo['LOD'],
+        'loo_LOQ': loo['LOQ'],
+        'influential': influential,
+    }
+
+
+def influence_frame(x, y, confidence=0.95):
+    """Tabel diagnostik per standar untuk satu kurva"""
+    diag = influence_diagnostics(x, y, confidence=confidence)
+    return pd.DataFrame({
+        'Concentration (x)': np.asarray(x, dtype=float),
+        'Leverage': diag['leverage'],
+        'Studentized Residual': diag['studentized'],
+        'Deleted Studentized': diag['studentized_deleted'],
+        "Cook's D": diag['cooks_d'],
+        'DFFITS': diag['dffits'],
+        'LOO Slope': diag['loo_slope'],
+        'LOO Intercept': diag['loo_intercept'],
+        'LOO LOD': diag['loo_LOD'],
+        'LOO LOQ': diag['loo_LOQ'],
+        'Influential': diag['influential'],
+    })
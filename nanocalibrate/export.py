@@ -0,0 +1,106 @@
+import gzip
+import hashlib
+import io
+
+import pandas as pd
+
+from .cache import LRUCache
+
+# Format export: label -> (ekstensi, MIME type)
+EXPORT_FORMATS = {
+    'CSV': ('.csv', 'text/csv'),
+    'CSV (gzip)': ('.csv.gz', 'application/gzip'),
+    'Parquet': ('.parquet', 'application/vnd.apache.parquet'),
+}
+# Jumlah baris per chunk saat menulis CSV
+EXPORT_CHUNK_ROWS = 100_000
+
+# Batas total ukuran file export di cache (file dibuat utuh di memori sebelum diunduh)
+EXPORT_CACHE_BYTES = 256 * 2**20
+
+# File export yang sudah dibuat, dipakai bersama semua sesi
+export_cache = LRUCache(maxsize=32, maxbytes=EXPORT_CACHE_BYTES)
+
+
+def frame_hash(df):
+    """Hash isi DataFrame (nilai, index dan nama kolom)"""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr(list(df.columns)).encode())
+    h.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def iter_csv_chunks(df, chunk_rows=EXPORT_CHUNK_ROWS, float_format=None):
+    """CSV per blok baris sebagai bytes, agar pandas tidak membuat satu string raksasa.
+
+    File lengkap tetap dirakit di memori oleh `export_bytes` (download
+    Streamlit butuh isi utuh); yang dihindari hanya salinan string ganda.
+    """
+    for start in range(0, max(len(df), 1), chunk_rows):
+        chunk = df.iloc[start:start + chunk_rows]
+        yield chunk.to_csv(index=False, header=start == 0,
+                           float_format=float_format).encode('utf-8')
+
+
+def export_bytes(df, fmt='CSV', chunk_rows=EXPORT_CHUNK_ROWS):
+    """Isi file export untuk `df` dalam format `fmt`"""
+    if fmt == 'CSV':
+        buffer = io.BytesIO()
+        for part in iter_csv_chunks(df, chunk_rows):
+            buffer.write(part)
+        return buffer.getvalue()
+    if fmt == 'CSV (gzip)':
+        buffer = io.BytesIO()
+        with gzip.GzipFile(fileobj=buffer, mode='wb', compresslevel=6, mtime=0) as gz:
+            for part in iter_csv_chunks(df, chunk_rows):
+                gz.write(part)
+        return buffer.getvalue()
+    if fmt == 'Parquet':
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as e:
+            raise RuntimeError("Parquet export needs the 'pyarrow' package") from e
+        buffer = io.BytesIO()
+        df.to_parquet(buffer, index=False, compression='zstd')
+        return buffer.getvalue()
+    raise ValueError(f"Unknown export format {fmt!r}")
+
+
+def cached_export(df, fmt='CSV'):
+    """export_bytes dengan cache berdasarkan hash isi DataFrame"""
+    key = (frame_hash(df), fmt)
+    return export_cache.get_or_compute(key, lambda: export_bytes(df, fmt))
+
+
+def cached_text(text):
+    """Encode teks (mis. report) dengan cache berdasarkan hash isi"""
+    key = ('text', hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest())
+    return export_cache.get_or_compute(key, lambda: text.encode('utf-8'))
+
+
+def lazy_export(df, fmt='CSV'):
+    """Callable tanpa argumen yang membuat file export hanya saat dipanggil.
+
+    Cocok untuk `st.download_button(data=...)`: file baru dibuat saat
+    tombol diklik, bukan di setiap rerun.
+    """
+    return lambda: cached_export(df, fmt)
+
+
+def export_file_name(stem, fmt):
+    return f"{stem}{EXPORT_FORMATS[fmt][0]}"
+
+
+def export_mime(fmt):
+    return EXPORT_FORMATS[fmt][1]
+
+
+def available_formats():
+    """Format yang bisa dipakai di lingkungan ini (Parquet butuh pyarrow)"""
+    formats = ['CSV', 'CSV (gzip)']
+    try:
+        import pyarrow  # noqa: F401
+        formats.append('Parquet')
+    except ImportError:
+        pass
+    return formats
@@ -0,0 +1,218 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from .prediction import predict_concentrations, prediction_frame
+from .workbook import read_workbook, sheet_names
+
+# Jumlah baris per chunk saat membaca file besar
+DEFAULT_CHUNKSIZE = 200_000
+
+
+def _is_text_file(name):
+    return str(name).lower().endswith('.txt')
+
+
+def _source_name(source):
+    return getattr(source, 'name', source if isinstance(source, (str, os.PathLike)) else '')
+
+
+def _source_size(source):
+    """Ukuran file dalam byte (untuk progress), None jika tidak diketahui"""
+    if isinstance(source, (str, os.PathLike)):
+        return os.path.getsize(source)
+    size = getattr(source, 'size', None)
+    if size is None and hasattr(source, 'getbuffer'):
+        size = source.getbuffer().nbytes
+    return size
+
+
+def _rewind(source):
+    if hasattr(source, 'seek'):
+        source.seek(0)
+
+
+def read_columns(source):
+    """Baca hanya header CSV untuk memilih kolom"""
+    _rewind(source)
+    columns = list(pd.read_csv(source, nrows=0).columns)
+    _rewind(source)
+    return columns
+
+
+def read_table(source, usecols=None, dtype=None, chunksize=DEFAULT_CHUNKSIZE, sheet_name=None):
+    """Baca tabel kalibrasi (CSV/Excel) hanya untuk kolom yang dipilih.
+
+    CSV dibaca per chunk dengan dtype yang sudah ditentukan sehingga pandas
+    tidak perlu menebak tipe kolom di seluruh file. Excel dibaca lewat
+    `read_workbook` (sheet pertama jika `sheet_name` tidak diisi).
+    """
+    name = str(_source_name(source)).lower()
+    _rewind(source)
+    if name.endswith(('.xlsx', '.xls')):
+        sheets = [sheet_name] if sheet_name is not None else sheet_names(source)[:1]
+        # Salinan dangkal: DataFrame di cache workbook dipakai bersama
+        df = read_workbook(source, sheets)[sheets[0]].copy(deep=False)
+        if usecols is not None:
+            df = df[list(usecols)]
+        return df.astype(dtype) if dtype is not None else df
+    chunks = pd.read_csv(source, usecols=usecols, dtype=dtype, chunksize=chunksize)
+    return pd.concat(chunks, ignore_index=True)
+
+
+def iter_response_chunks(source, column=None, chunksize=DEFAULT_CHUNKSIZE, dtype=np.float64):
+    """Baca respons sampel per chunk sebagai array NumPy.
+
+    File `.txt` berisi satu nilai per baris (baris kosong diabaikan);
+    file CSV dibaca hanya pada `column` (nama atau indeks, default kolom
+    pertama). Setiap iterasi menghasilkan `(values, fraction)` dengan
+    `fraction` perkiraan bagian file yang sudah dibaca (0-1) atau None.
+    """
+    size = _source_size(source)
+    _rewind(source)
+    if _is_text_file(_source_name(source)):
+        reader = pd.read_csv(source, header=None, usecols=[0], names=['Response'],
+                             dtype={'Response': dtype}, chunksize=chunksize)
+        column = 'Response'
+    else:
+        if column is None or isinstance(column, int):
+            columns = read_columns(source)
+            column = columns[column or 0]
+        reader = pd.read_csv(source, usecols=[column], dtype={column: dtype},
+                             chunksize=chunksize)
+
+    handle = reader.handles.handle if hasattr(reader, 'handles') else None
+    with reader:
+        for chunk in reader:
+            values = chunk[column].to_numpy(dtype=dtype)
+            values = values[np.isfinite(values)]
+            fraction = None
+            if size and handle is not None and hasattr(handle, 'tell'):
+                try:
+                    fraction = min(handle.tell() / size, 1.0)
+                except (OSError, ValueError):
+                    fraction = None
+            yield values, fraction
+
+
+def read_responses(source, column=None, chunksize=DEFAULT_CHUNKSIZE, dtype=np.float64,
+                   progress=None):
+    """Baca semua respons ke satu array (memori 8 byte per nilai)"""
+    parts = []
+    for values, fraction in iter_response_chunks(source, column, chunksize, dtype):
+        parts.append(values)
+        if progress is not None and fraction is not None:
+            progress(fraction)
+    if not parts:
+        return np.empty(0, dtype=dtype)
+    return np.concatenate(parts)
+
+
+def read_samples(source, column=None, id_column=None, chunksize=DEFAULT_CHUNKSIZE,
+                 dtype=np.float64, progress=None):
+    """Baca respons beserta ID sampel dari CSV: `(responses, sample_ids)`.
+
+    Tanpa `id_column` (atau untuk file `.txt`) sama dengan `read_responses`
+    dan `sample_ids` bernilai None. Baris dengan respons tidak valid
+    dibuang dari kedua array.
+    """
+    if id_column is None or _is_text_file(_source_name(source)):
+        return read_responses(source, column, chunksize, dtype, progress), None
+    size = _source_size(source)
+    _rewind(source)
+    if column is None or isinstance(column, int):
+        column = read_columns(source)[column or 0]
+    reader = pd.read_csv(source, usecols=[column, id_column],
+                         dtype={column: dtype, id_column: str}, chunksize=chunksize)
+    handle = reader.handles.handle if hasattr(reader, 'handles') else None
+    values, ids = [], []
+    with reader:
+        for chunk in reader:
+            chunk_values = chunk[column].to_numpy(dtype=dtype)
+            valid = np.isfinite(chunk_values)
+            values.append(chunk_values[valid])
+            ids.append(chunk[id_column].to_numpy(dtype=object)[valid])
+            if progress is not None and size and handle is not None and hasattr(handle, 'tell'):
+                try:
+                    progress(min(handle.tell() / size, 1.0))
+                except (OSError, ValueError):
+                    pass
+    if not values:
+        return np.empty(0, dtype=dtype), np.empty(0, dtype=object)
+    return np.concatenate(values), np.concatenate(ids)
+
+
+class StreamSummary:
+    """Ringkasan berjalan hasil prediksi (jumlah, mean, SD, flag) dengan memori konstan"""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = np.inf
+        self.maximum = -np.inf
+        self.below_lod = 0
+        self.below_loq = 0
+        self.above_range = 0
+
+    def update(self, prediction):
+        conc = prediction['concentration']
+        k = len(conc)
+        if k == 0:
+            return
+        # Gabungkan mean dan M2 antar chunk (Chan et al.)
+        chunk_mean = float(np.mean(conc, dtype=np.float64))
+        chunk_m2 = float(np.sum((conc - chunk_mean) ** 2, dtype=np.float64))
+        total = self.count + k
+        delta = chunk_mean - self.mean
+        self.mean += delta * k / total
+        self.m2 += chunk_m2 + delta ** 2 * self.count * k / total
+        self.count = total
+        self.minimum = min(self.minimum, float(conc.min()))
+        self.maximum = max(self.maximum, float(conc.max()))
+        self.below_lod += int(prediction['below_lod'].sum())
+        self.below_loq += int(prediction['below_loq'].sum())
+        self.above_range += int(prediction['above_range'].sum())
+
+    @property
+    def std(self):
+        return (self.m2 / (self.count - 1)) ** 0.5 if self.count > 1 else 0.0
+
+    @property
+    def cv(self):
+        return self.std / self.mean * 100 if self.mean != 0 else 0.0
+
+    def as_dict(self):
+        return {
+            'count': self.count, 'mean': self.mean, 'std': self.std, 'cv': self.cv,
+            'min': self.minimum if self.count else None,
+            'max': self.maximum if self.count else None,
+            'below_lod': self.below_lod, 'below_loq': self.below_loq,
+            'above_range': self.above_range,
+        }
+
+
+def stream_predictions(source, model, column=None, confidence=0.95, out=None,
+                       chunksize=DEFAULT_CHUNKSIZE, dtype=np.float64, progress=None):
+    """Prediksi konsentrasi dari file besar per chunk dengan memori konstan.
+
+    Hasil per baris ditulis ke `out` (path atau file-like, CSV) jika
+    diberikan; yang disimpan di memori hanya ringkasan berjalan.
+    """
+    summary = StreamSummary()
+    handle = open(out, 'w', newline='') if isinstance(out, (str, os.PathLike)) else out
+    try:
+        header = True
+        for values, fraction in iter_response_chunks(source, column, chunksize, dtype):
+            prediction = predict_concentrations(values, model, confidence=confidence, dtype=dtype)
+            summary.update(prediction)
+            if handle is not None:
+                prediction_frame(prediction, confidence).to_csv(handle, header=header, index=False)
+                header = False
+            if progress is not None and fraction is not None:
+                progress(fraction)
+    finally:
+        if handle is not None and handle is not out:
+            handle.close()
+    return summary
@@ -0,0 +1,129 @@
+import numpy as np
+import pandas as pd
+
+# Jumlah level awal yang diproses per blok (membatasi memori matriks L x L)
+BLOCK_SIZE = 512
+# Jumlah sel (kandidat x titik) per langkah verifikasi residual
+VERIFY_CELLS = 2_000_000
+
+
+def _window_fit(cum, start, stop):
+    """Slope, intercept dan R² untuk jendela [start, stop) dari prefix sum"""
+    n = cum['n'][stop] - cum['n'][start]
+    sx = cum['x'][stop] - cum['x'][start]
+    sy = cum['y'][stop] - cum['y'][start]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        sxx = cum['xx'][stop] - cum['xx'][start] - sx * sx / n
+        syy = cum['yy'][stop] - cum['yy'][start] - sy * sy / n
+        sxy = cum['xy'][stop] - cum['xy'][start] - sx * sy / n
+        slope = sxy / sxx
+        intercept = (sy - slope * sx) / n
+        r_squared = np.where((sxx > 0) & (syy > 0), sxy * sxy / (sxx * syy), 0.0)
+    return n, slope, intercept, r_squared
+
+
+def _max_residual_pct(x, y, slope, intercept, start, stop):
+    """Deviasi maksimum konsentrasi back-calculated (%) per jendela [start, stop).
+
+    `slope`, `intercept`, `start`, `stop` berupa array (satu per jendela);
+    titik dengan x = 0 (blanko) tidak ikut dihitung.
+    """
+    idx = np.arange(len(x))
+    inside = (idx >= start[:, None]) & (idx < stop[:, None]) & (x != 0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        back = (y - intercept[:, None]) / slope[:, None]
+        dev = np.abs(back - x) / np.abs(x) * 100
+    return np.where(inside, dev, 0.0).max(axis=1)
+
+
+def find_linear_range(x, y, min_r2=0.99, max_residual_pct=None, min_points=5):
+    """Cari rentang konsentrasi kontigu terlebar yang memenuhi kriteria linearitas.
+
+    Data diurutkan menurut x dan batas jendela hanya di antara level
+    konsentrasi yang berbeda (replikat tidak dipisah). R² dan jumlah
+    titik setiap jendela dihitung O(1) dari prefix sum (terpusat pada
+    rata-rata global agar stabil), sehingga semua O(L²) jendela dinilai
+    secara vectorized. Kriteria residual (%) - deviasi konsentrasi
+    back-calculated terhadap nilai nominal - diperiksa hanya pada
+    kandidat yang lolos, mulai dari yang terlebar.
+
+    Jendela terbaik adalah yang mencakup level terbanyak (lalu rentang x
+    terlebar dan R² tertinggi). Mengembalikan dict rentang tersebut atau
+    None jika tidak ada.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    valid = np.isfinite(x) & np.isfinite(y)
+    x, y = x[valid], y[valid]
+    order = np.argsort(x, kind='stable')
+    x, y = x[order], y[order]
+    if len(x) < max(min_points, 2):
+        return None
+
+    # Prefix sum dari data terpusat
+    xc = x - x.mean()
+    yc = y - y.mean()
+    cum = {key: np.concatenate(([0.0], np.cumsum(values))) for key, values in {
+        'n': np.ones_like(xc), 'x': xc, 'y': yc,
+        'xx': xc * xc, 'yy': yc * yc, 'xy': xc * yc}.items()}
+
+    # Batas level: indeks awal setiap level dan indeks akhir (eksklusif)
+    starts = np.flatnonzero(np.r_[True, np.diff(x) != 0])
+    stops = np.r_[starts[1:], len(x)]
+
+    cand_start, cand_stop, cand_levels, cand_r2 = [], [], [], []
+    for b in range(0, len(starts), BLOCK_SIZE):
+        s = starts[b:b + BLOCK_SIZE, None]
+        e = stops[None, :]
+        n, slope, intercept, r2 = _window_fit(cum, s, e)
+        ok = (e > s) & (n >= min_points) & (r2 >= min_r2) & np.isfinite(slope)
+        si, ei = np.nonzero(ok)
+        cand_start.append(starts[b + si])
+        cand_stop.append(stops[ei])
+        cand_levels.append(ei - (b + si) + 1)
+        cand_r2.append(r2[si, ei])
+
+    cand_start = np.concatenate(cand_start)
+    if len(cand_start) == 0:
+        return None
+    cand_stop = np.concatenate(cand_stop)
+    cand_levels = np.concatenate(cand_levels)
+    cand_r2 = np.concatenate(cand_r2)
+
+    # Urutkan: level terbanyak, rentang x terlebar, lalu R² tertinggi
+    span = x[cand_stop - 1] - x[cand_start]
+    ranking = np.lexsort((-cand_r2, -span, -cand_levels))
+
+    # Cek kriteria residual per kelompok kandidat (vectorized), terlebar dulu
+    step = max(1, VERIFY_CELLS // len(x))
+    for b in range(0, len(ranking), step):
+        idx = ranking[b:b + step]
+        s, e = cand_start[idx], cand_stop[idx]
+        _, slope, intercept, r2 = _window_fit(cum, s, e)
+        # Intercept dari prefix sum terpusat -> kembalikan ke skala asli
+        intercept = intercept + y.mean() - slope * x.mean()
+        residual_pct = _max_residual_pct(x, y, slope, intercept, s, e)
+        passed = np.ones(len(idx), dtype=bool) if max_residual_pct is None \
+            else residual_pct <= max_residual_pct
+        if passed.any():
+            k = int(np.argmax(passed))
+            return {
+                'x_low': float(x[s[k]]), 'x_high': float(x[e[k] - 1]), 'n': int(e[k] - s[k]),
+                'levels': int(cand_levels[idx[k]]),
+                'r_squared': float(r2[k]), 'slope': float(slope[k]),
+                'intercept': float(intercept[k]), 'max_residual_pct': float(residual_pct[k]),
+                'start': int(s[k]), 'stop': int(e[k]),
+            }
+    return None
+
+
+def linear_range_frame(df, x_col, y_cols, **criteria):
+    """Rentang linear untuk setiap kolom respons (satu baris per analit)"""
+    rows = []
+    for col in y_cols:
+        found = find_linear_range(df[x_col].values, df[col].values, **criteria)
+        row = {'Analyte': col}
+        if found is not None:
+            row.update({k: v for k, v in found.items() if k not in ('start', 'stop')})
+        rows.append(row)
+    return pd.DataFrame(rows)
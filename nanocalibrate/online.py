@@ -0,0 +1,146 @@
+import itertools
+
+import numpy as np
+
+from .calibration import fit_from_stats
+
+
+class CalibrationModel:
+    """Model kalibrasi inkremental dengan statistik cukup berjalan.
+
+    Menyimpan n, rata-rata x dan y, serta co-moment terpusat (Sxx, Syy,
+    Sxy) yang diperbarui dengan rumus Welford, sehingga menambah,
+    menghapus atau mengganti satu standar cukup O(1) tanpa fit ulang.
+    `results()` menghasilkan dict yang sama dengan `calculate_calibration`.
+    """
+
+    def __init__(self, x=None, y=None, confidence=0.95):
+        self.confidence = confidence
+        self.points = {}
+        self._keys = itertools.count()
+        self.n = 0
+        self.x_mean = self.y_mean = 0.0
+        self.Sxx = self.Syy = self.Sxy = 0.0
+        self._x_min = self._x_max = None
+        # Indeks yang dikecualikan pada `set_excluded` terakhir (None = belum pernah)
+        self._excluded = None
+        if x is not None:
+            for xi, yi in zip(np.asarray(x, dtype=float), np.asarray(y, dtype=float)):
+                self.add(xi, yi)
+
+    def __len__(self):
+        return self.n
+
+    def __contains__(self, key):
+        return key in self.points
+
+    def add(self, x, y, key=None):
+        """Tambahkan satu standar, kembalikan key-nya"""
+        x, y = float(x), float(y)
+        if key is None:
+            key = next(self._keys)
+        elif key in self.points:
+            raise KeyError(f"Standard {key!r} already exists")
+        if not (np.isfinite(x) and np.isfinite(y)):
+            raise ValueError("Standard values must be finite")
+        self.points[key] = (x, y)
+
+        self.n += 1
+        dx = x - self.x_mean
+        dy = y - self.y_mean
+        self.x_mean += dx / self.n
+        self.y_mean += dy / self.n
+        self.Sxx += dx * (x - self.x_mean)
+        self.Syy += dy * (y - self.y_mean)
+        self.Sxy += dx * (y - self.y_mean)
+
+        if self._x_min is not None:
+            self._x_min = min(self._x_min, x)
+            self._x_max = max(self._x_max, x)
+        return key
+
+    def remove(self, key):
+        """Hapus satu standar (kebalikan dari `add`)"""
+        x, y = self.points.pop(key)
+        if self.n == 1:
+            self.n = 0
+            self.x_mean = self.y_mean = 0.0
+            self.Sxx = self.Syy = self.Sxy = 0.0
+        else:
+            old_x_mean, old_y_mean = self.x_mean, self.y_mean
+            self.n -= 1
+            self.x_mean = (old_x_mean * (self.n + 1) - x) / self.n
+            self.y_mean = (old_y_mean * (self.n + 1) - y) / self.n
+            self.Sxx = max(self.Sxx - (x - self.x_mean) * (x - old_x_mean), 0.0)
+            self.Syy = max(self.Syy - (y - self.y_mean) * (y - old_y_mean), 0.0)
+            self.Sxy -= (x - self.x_mean) * (y - old_y_mean)
+
+        # Batas x dihitung ulang hanya jika titik ekstrem yang dihapus
+        if self._x_min is not None and x in (self._x_min, self._x_max):
+            self._x_min = self._x_max = None
+        return x, y
+
+    def replace(self, key, x, y):
+        """Ganti nilai satu standar"""
+        self.remove(key)
+        return self.add(x, y, key=key)
+
+    def set_excluded(self, excluded, x, y):
+        """Sinkronkan standar aktif dengan daftar indeks yang dikecualikan.
+
+        `x` dan `y` adalah data lengkap (selalu data yang sama untuk satu
+        model); key model adalah indeks baris. Panggilan pertama memuat
+        semua baris; berikutnya hanya indeks yang statusnya berubah sejak
+        panggilan sebelumnya yang ditambah/dihapus, jadi satu toggle O(1).
+        Baris dengan nilai kosong dilewati.
+        """
+        excluded = set(excluded)
+        if self._excluded is None:
+            changed = range(len(x))
+        else:
+            changed = excluded ^ self._excluded
+        for i in changed:
+            if i in excluded:
+                if i in self.points:
+                    self.remove(i)
+            elif i not in self.points and np.isfinite(x[i]) and np.isfinite(y[i]):
+                self.add(x[i], y[i], key=i)
+        self._excluded = excluded
+
+    @property
+    def x_min(self):
+        self._update_range()
+        return self._x_min
+
+    @property
+    def x_max(self):
+        self._update_range()
+        return self._x_max
+
+    def _update_range(self):
+        if self._x_min is None and self.points:
+            xs = [p[0] for p in self.points.values()]
+            self._x_min, self._x_max = min(xs), max(xs)
+
+    def arrays(self):
+        """Data standar aktif sebagai array (x, y), urut sesuai key"""
+        if not self.points:
+            return np.empty(0), np.empty(0)
+        data = np.array([self.points[k] for k in sorted(self.points)], dtype=float)
+        return data[:, 0], data[:, 1]
+
+    def results(self, with_residuals=True):
+        """Parameter kalibrasi seperti `calculate_calibration` (None jika belum cukup)"""
+        if self.n < 2 or self.Sxx <= 0:
+            return None
+        fit = fit_from_stats(self.n, self.x_mean, self.y_mean, self.Sxx, self.Syy, self.Sxy,
+                             self.x_min, self.x_max, self.confidence)
+        fit = {k: np.asarray(v).item() for k, v in fit.items()}
+        slope, intercept = fit['slope'], fit['intercept']
+
+        if with_residuals:
+            x, y = self.arrays()
+            fit['y_pred'] = intercept + slope * x
+            fit['residuals'] = y - fit['y_pred']
+        fit['equation'] = f"y = {slope:.4f}x + {intercept:.4f}"
+        return fit
@@ -0,0 +1,180 @@
+import numpy as np
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+# Di atas jumlah titik ini grafik memakai WebGL (Scattergl) dan decimation
+WEBGL_THRESHOLD = 2000
+# Jumlah titik maksimum yang dikirim ke browser per trace
+MAX_PLOT_POINTS = 4000
+
+
+def lttb_indices(x, y, n_out):
+    """Largest-Triangle-Three-Buckets: indeks titik yang mempertahankan bentuk kurva.
+
+    `x` harus sudah terurut. Titik pertama dan terakhir selalu dipilih.
+    Rata-rata tiap bucket dihitung sekaligus dari cumulative sum; yang
+    tersisa hanya satu loop per bucket (bukan per titik).
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    edges[-1] = n - 1
+    # Rata-rata setiap bucket (plus titik terakhir sebagai bucket penutup)
+    cx = np.concatenate(([0.0], np.cumsum(x)))
+    cy = np.concatenate(([0.0], np.cumsum(y)))
+    lo = np.append(edges[:-1], n - 1)
+    hi = np.append(edges[1:], n)
+    counts = np.maximum(hi - lo, 1)
+    avg_x = (cx[hi] - cx[lo]) / counts
+    avg_y = (cy[hi] - cy[lo]) / counts
+
+    out = np.empty(n_out, dtype=int)
+    out[0], out[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], max(edges[i + 1], edges[i] + 1)
+        bx, by = x[start:stop], y[start:stop]
+        area = np.abs((x[a] - avg_x[i + 1]) * (by - y[a])
+                      - (x[a] - bx) * (avg_y[i + 1] - y[a]))
+        a = start + int(np.argmax(area))
+        out[i + 1] = a
+    return np.unique(out)
+
+
+def minmax_indices(y, n_bins):
+    """Ambil titik minimum dan maksimum di setiap bin (decimation cepat)"""
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if 2 * n_bins >= n:
+        return np.arange(n)
+    edges = np.linspace(0, n, n_bins + 1).astype(int)
+    bins = np.repeat(np.arange(n_bins), np.diff(edges))
+    order = np.lexsort((y, bins))
+    first = order[edges[:-1]]
+    last = order[edges[1:] - 1]
+    return np.unique(np.concatenate((first, last)))
+
+
+def decimate(x, y, max_points=MAX_PLOT_POINTS, keep=None, method='lttb'):
+    """Indeks titik yang dikirim ke grafik (terurut menurut x).
+
+    Titik pada mask `keep` (mis. outlier) selalu dipertahankan di luar
+    kuota `max_points`.
+    """
+    x = np.asarray(x, dtype=float)
+    order = np.argsort(x, kind='stable')
+    if len(x) <= max_points:
+        return order
+    ys = np.asarray(y, dtype=float)[order]
+    if method == 'minmax':
+        picked = minmax_indices(ys, max_points // 2)
+    else:
+        picked = lttb_indices(x[order], ys, max_points)
+    idx = order[picked]
+    if keep is not None:
+        idx = np.union1d(idx, np.flatnonzero(keep))
+        idx = idx[np.argsort(x[idx], kind='stable')]
+    return idx
+
+
+def calibration_figure(x, y, results, webgl_threshold=WEBGL_THRESHOLD,
+                       max_points=MAX_PLOT_POINTS):
+    """Grafik kurva kalibrasi dan residual.
+
+    Untuk data besar (> `webgl_threshold` titik) trace memakai Scattergl,
+    titik di-decimate dengan LTTB (outlier |residual| > 3 s_res tetap
+    ditampilkan), dan error bar per titik diganti satu pita ±s_res di
+    sekitar garis regresi.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    residuals = np.asarray(results['residuals'], dtype=float)
+    s_res = results['s_res']
+    large = len(x) > webgl_threshold
+    Scatter = go.Scattergl if large else go.Scatter
+
+    if large:
+        outliers = np.abs(residuals) > 3 * s_res if s_res > 0 else None
+        idx = decimate(x, y, max_points, keep=outliers)
+        x_plot, y_plot, res_plot = x[idx], y[idx], residuals[idx]
+    else:
+        x_plot, y_plot, res_plot = x, y, residuals
+
+    fig = make_subplots(
+        rows=1, cols=2,
+        subplot_titles=("Calibration Curve", "Residual Plot"),
+        column_widths=[0.7, 0.3]
+    )
+
+    # Garis regresi
+    x_line = np.linspace(np.nanmin(x) * 0.9, np.nanmax(x) * 1.1, 100)
+    y_line = results['intercept'] + results['slope'] * x_line
+
+    if large:
+        # Pita ±s_res sebagai satu bentuk, bukan array error per titik
+        fig.add_trace(
+            go.Scatter(
+                x=np.concatenate((x_line, x_line[::-1])),
+                y=np.concatenate((y_line + s_res, (y_line - s_res)[::-1])),
+                fill='toself',
+                fillcolor='rgba(128, 128, 128, 0.2)',
+                line=dict(width=0),
+                name='±S_res',
+                hoverinfo='skip'
+            ),
+            row=1, col=1
+        )
+        error_y = None
+    else:
+        error_y = dict(type='constant', value=s_res, visible=True,
+                       color='gray', thickness=1)
+
+    # Plot kurva kalibrasi
+    fig.add_trace(
+        Scatter(
+            x=x_plot, y=y_plot,
+            mode='markers',
+            name='Data Points' if not large else f'Data Points ({len(x_plot)} of {len(x)})',
+            marker=dict(size=10 if not large else 5, color='#2E86AB'),
+            error_y=error_y
+        ),
+        row=1, col=1
+    )
+
+    fig.add_trace(
+        go.Scatter(
+            x=x_line, y=y_line,
+            mode='lines',
+            name=f"y = {results['slope']:.4f}x + {results['intercept']:.4f}",
+            line=dict(color='#A23B72', width=3),
+            hoverinfo='skip'
+        ),
+        row=1, col=1
+    )
+
+    # Plot residual
+    fig.add_trace(
+        Scatter(
+            x=x_plot, y=res_plot,
+            mode='markers',
+            name='Residuals',
+            marker=dict(size=8 if not large else 4, color='#F18F01'),
+            showlegend=False
+        ),
+        row=1, col=2
+    )
+
+    # Garis horizontal di residual plot
+    fig.add_hline(y=0, line_dash="dash", line_color="gray", row=1, col=2)
+
+    # Update layout
+    fig.update_xaxes(title_text="Concentration", row=1, col=1)
+    fig.update_yaxes(title_text="Response", row=1, col=1)
+    fig.update_xaxes(title_text="Concentration", row=1, col=2)
+    fig.update_yaxes(title_text="Residuals", row=1, col=2)
+    fig.update_layout(height=500, showlegend=True)
+    return fig
@@ -0,0 +1,196 @@
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# File log default (JSON lines, satu baris per rerun)
+DEFAULT_LOG_PATH = os.environ.get('NANOCALIBRATE_PROFILE_LOG', 'nanocalibrate_profile.jsonl')
+
+_NULL_SPAN = contextlib.nullcontext()
+_log_lock = threading.Lock()
+# tracemalloc berlaku untuk seluruh proses; dihitung berapa run yang memakainya
+_trace_lock = threading.Lock()
+_trace_users = 0
+
+
+def _start_tracing():
+    global _trace_users
+    with _trace_lock:
+        if _trace_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        _trace_users += 1
+        tracemalloc.reset_peak()
+
+
+def _stop_tracing():
+    global _trace_users
+    with _trace_lock:
+        peak = tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else None
+        _trace_users -= 1
+        if _trace_users == 0 and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        return peak
+
+
+def _max_rss():
+    """Puncak RSS proses (bytes), atau None jika tidak tersedia"""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux melaporkan KiB, macOS bytes
+    return rss if sys.platform == 'darwin' else rss * 1024
+
+
+class RunProfiler:
+    """Pengukur waktu per tahap untuk satu eksekusi script (rerun).
+
+    `span(name)` adalah context manager yang mencatat durasi tahap;
+    span boleh bersarang. Saat `enabled` False, `span` mengembalikan
+    context manager kosong yang sama setiap kali, jadi biayanya hanya
+    satu pengecekan atribut. `caches` berisi LRUCache yang hit/miss-nya
+    dicatat sebagai selisih selama run (cache dipakai bersama semua
+    sesi, jadi selisih bisa ikut menghitung sesi lain). Puncak memori
+    diukur dengan tracemalloc hanya jika `trace_memory` diminta secara
+    eksplisit: tracemalloc berlaku untuk seluruh proses dan memperlambat
+    semua sesi selama run ini berjalan.
+    """
+
+    def __init__(self, enabled=False, label=None, caches=None, trace_memory=False,
+                 log_path=None):
+        self.enabled = enabled
+        self.configured = enabled
+        self.label = label
+        self.caches = caches or {}
+        self.trace_memory = trace_memory and enabled
+        self.trace_memory_requested = trace_memory
+        self.log_path = log_path
+        self.record = None
+        self.spans = []
+        self.counters = {}
+        self._depth = 0
+        self._start = None
+        self._cache_start = {}
+        if enabled:
+            self._cache_start = {name: cache.stats() for name, cache in self.caches.items()}
+            if self.trace_memory:
+                _start_tracing()
+            self._start = time.perf_counter()
+
+    def span(self, name):
+        if not self.enabled:
+            return _NULL_SPAN
+        return self._span(name)
+
+    @contextlib.contextmanager
+    def _span(self, name):
+        entry = {'name': name, 'depth': self._depth, 'seconds': None}
+        self.spans.append(entry)
+        self._depth += 1
+        start = time.perf_counter()
+        try:
+            yield entry
+        finally:
+            entry['seconds'] = time.perf_counter() - start
+            self._depth -= 1
+
+    @contextlib.contextmanager
+    def fragment(self, name):
+        """Profiler untuk isi fragment Streamlit.
+
+        Saat fragment dijalankan sebagai bagian dari run utama, span-nya
+        masuk ke run ini. Saat fragment rerun sendiri (run utama sudah
+        selesai), dibuat profiler baru dengan pengaturan yang sama dan
+        ditutup di akhir fragment; record-nya ada di `.record`.
+        """
+        if self.enabled or not self.configured:
+            with self.span(name):
+                yield self
+            return
+        profiler = RunProfiler(True, f"{self.label}/{name}", self.caches,
+                               self.trace_memory_requested, self.log_path)
+        try:
+            with profiler.span(name):
+                yield profiler
+        finally:
+            profiler.finish()
+
+    def abort(self):
+        """Hentikan run tanpa membuat record (mis. script berhenti di tengah)"""
+        if self.enabled and self.trace_memory:
+            _stop_tracing()
+        self.enabled = False
+
+    def count(self, name, n=1):
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def finish(self):
+        """Tutup run dan kembalikan record-nya (None jika tidak aktif).
+
+        Jika `log_path` diisi, record ditambahkan sebagai satu baris JSON.
+        """
+        if not self.enabled:
+            return None
+        total = time.perf_counter() - self._start
+        caches = {}
+        for name, cache in self.caches.items():
+            now, before = cache.stats(), self._cache_start[name]
+            caches[name] = {'hits': now['hits'] - before['hits'],
+                            'misses': now['misses'] - before['misses'],
+                            'size': now['size']}
+        record = {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'label': self.label,
+            'total_seconds': total,
+            'spans': self.spans,
+            'counters': self.counters,
+            'caches': caches,
+            'peak_memory_bytes': _stop_tracing() if self.trace_memory else None,
+            'max_rss_bytes': _max_rss(),
+        }
+        self.enabled = False
+        self.record = record
+        if self.log_path:
+            write_log(record, self.log_path)
+        return record
+
+
+def write_log(record, path=DEFAULT_LOG_PATH):
+    """Tambahkan satu record sebagai baris JSON (aman dipakai beberapa thread)"""
+    line = json.dumps(record, default=str) + '\n'
+    with _log_lock:
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(line)
+
+
+def read_log(path=DEFAULT_LOG_PATH, last=None):
+    """Baca record dari file log JSON lines (opsional hanya `last` terakhir)"""
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding='utf-8') as f:
+        lines = f.readlines()
+    if last is not None:
+        lines = lines[-last:]
+    return [json.loads(line) for line in lines if line.strip()]
+
+
+def span_totals(records):
+    """Total, rata-rata dan maksimum durasi per nama span dari beberapa record"""
+    totals = {}
+    for record in records:
+        for span in record['spans']:
+            entry = totals.setdefault(span['name'], {'count': 0, 'total': 0.0, 'max': 0.0})
+            entry['count'] += 1
+            entry['total'] += span['seconds'] or 0.0
+            entry['max'] = max(entry['max'], span['seconds'] or 0.0)
+    for entry in totals.values():
+        entry['mean'] = entry['total'] / entry['count']
+    return totals
@@ -0,0 +1,100 @@
+import numpy as np
+import pandas as pd
+from scipy import special
+
+# Toleransi relatif default untuk mengelompokkan replikat tanpa ID sampel
+DEFAULT_TOLERANCE = 0.05
+
+
+def cluster_responses(responses, tolerance=DEFAULT_TOLERANCE, relative=True):
+    """Kelompokkan respons yang berdekatan sebagai replikat satu sampel.
+
+    Respons diurutkan, lalu kelompok baru dimulai di setiap celah antar
+    nilai berurutan yang lebih besar dari `tolerance` (relatif terhadap
+    nilai yang lebih besar dari pasangan itu jika `relative`, selain itu
+    absolut). O(n log n) dan vectorized. Mengembalikan label grup (0, 1,
+    ... menurut urutan respons) untuk setiap respons dalam urutan aslinya.
+    """
+    responses = np.asarray(responses, dtype=float).ravel()
+    if len(responses) == 0:
+        return np.empty(0, dtype=np.intp)
+    order = np.argsort(responses, kind='stable')
+    sorted_values = responses[order]
+    gaps = np.diff(sorted_values)
+    if relative:
+        limit = tolerance * np.maximum(np.abs(sorted_values[:-1]), np.abs(sorted_values[1:]))
+    else:
+        limit = tolerance
+    new_group = np.concatenate(([0], (gaps > limit).astype(np.intp)))
+    labels = np.empty(len(responses), dtype=np.intp)
+    labels[order] = np.cumsum(new_group)
+    return labels
+
+
+def group_replicates(responses, sample_ids=None, tolerance=DEFAULT_TOLERANCE, relative=True):
+    """Label grup replikat: dari `sample_ids` jika ada, selain itu `cluster_responses`.
+
+    Respons yang ID-nya kosong (None/NaN/'') dikelompokkan dengan
+    `cluster_responses` dan diberi label 'Group k', jadi ID yang ada
+    tetap dipakai walau daftar bercampur dengan input manual. Jika label
+    itu sudah dipakai sebagai ID sampel, ditambahkan '*' sampai unik,
+    agar grup tanpa ID tidak tergabung dengan sampel yang ber-ID.
+    """
+    if sample_ids is None:
+        return cluster_responses(responses, tolerance, relative)
+    sample_ids = np.asarray(sample_ids, dtype=object).ravel()
+    missing = pd.isna(sample_ids) | (sample_ids == '')
+    if not missing.any():
+        return sample_ids
+    responses = np.asarray(responses, dtype=float).ravel()
+    labels = sample_ids.copy()
+    clusters = cluster_responses(responses[missing], tolerance, relative)
+    names = [f'Group {k}' for k in range(1, clusters.max() + 2)]
+    taken = {str(value) for value in pd.unique(sample_ids[~missing])}
+    while taken.intersection(names):
+        names = [name + '*' for name in names]
+    labels[missing] = np.array(names, dtype=object)[clusters]
+    return labels
+
+
+def replicate_interval(mean, sd, n, confidence=0.95):
+    """Batas CI mean replikat (t dengan n-1 derajat bebas); NaN untuk satu replikat"""
+    n = np.asarray(n)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        t_val = np.where(n > 1, special.stdtrit(np.maximum(n - 1, 1), 0.5 + confidence / 2), np.nan)
+        half = t_val * sd / np.sqrt(n)
+    return mean - half, mean + half
+
+
+def replicate_summary(concentrations, groups, confidence=0.95, responses=None):
+    """Mean, SD, CV dan CI konsentrasi per grup replikat dalam satu reduksi grup.
+
+    Grup di-factorize sekali lalu semua statistik dihitung dengan
+    `np.bincount` (jumlah dan jumlah kuadrat deviasi), tanpa loop Python
+    per grup. CI memakai distribusi t dengan n-1 derajat bebas; untuk
+    grup dengan satu replikat SD, CV dan CI berupa NaN. Label kosong
+    (None/NaN) menjadi satu grup sendiri, bukan kode -1.
+    """
+    concentrations = np.asarray(concentrations, dtype=float).ravel()
+    codes, labels = pd.factorize(np.asarray(groups), sort=True, use_na_sentinel=False)
+    k = len(labels)
+    n = np.bincount(codes, minlength=k)
+    mean = np.bincount(codes, weights=concentrations, minlength=k) / n
+    ss = np.bincount(codes, weights=(concentrations - mean[codes]) ** 2, minlength=k)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        sd = np.where(n > 1, np.sqrt(ss / (n - 1)), np.nan)
+        cv = np.where(mean != 0, sd / np.abs(mean) * 100, np.nan)
+    lower, upper = replicate_interval(mean, sd, n, confidence)
+
+    summary = {'Sample': labels, 'Replicates': n}
+    if responses is not None:
+        responses = np.asarray(responses, dtype=float).ravel()
+        summary['Mean Response'] = np.bincount(codes, weights=responses, minlength=k) / n
+    summary.update({
+        'Mean Concentration': mean,
+        'SD': sd,
+        'CV%': cv,
+        f'{confidence:.0%} CI Lower': lower,
+        f'{confidence:.0%} CI Upper': upper,
+    })
+    return pd.DataFrame(summary)
@@ -0,0 +1,351 @@
+import html
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .cache import LRUCache, array_hash
+from .export import frame_hash
+
+# Format report: label -> (ekstensi, MIME type)
+REPORT_FORMATS = {
+    'HTML': ('.html', 'text/html'),
+    'PDF': ('.pdf', 'application/pdf'),
+}
+# Baris tabel (standar, prediksi) maksimum yang ditulis ke report
+REPORT_MAX_ROWS = 1000
+# Titik maksimum per grafik SVG (sama dengan plotting.MAX_PLOT_POINTS)
+REPORT_PLOT_POINTS = 4000
+# Ukuran grafik SVG dalam piksel
+PLOT_WIDTH, PLOT_HEIGHT = 640, 400
+
+# Batas total ukuran report (HTML/PDF utuh) di cache
+REPORT_CACHE_BYTES = 256 * 2**20
+
+# Report yang sudah dibuat (per hash data, model dan opsi), dipakai bersama semua sesi
+report_cache = LRUCache(maxsize=64, maxbytes=REPORT_CACHE_BYTES)
+
+
+def calibration_report(results):
+    """Ringkasan kalibrasi dalam bentuk teks (CALIBRATION REPORT)"""
+    return f"""CALIBRATION REPORT
+========================
+Equation: {results['equation']}
+R²: {results['r_squared']:.6f}
+R: {results['r_value']:.6f}
+p-value: {results['p_value']:.6f}
+
+SLOPE: {results['slope']:.6f} ± {results['se_slope']:.6f}
+95% CI: ±{results['ci_slope']:.6f}
+
+INTERCEPT: {results['intercept']:.6f} ± {results['se_intercept']:.6f}
+95% CI: ±{results['ci_intercept']:.6f}
+
+LOD: {results['LOD']:.6f}
+LOQ: {results['LOQ']:.6f}
+S_res: {results['s_res']:.6f}
+
+Number of points: {results['n']}
+X range: {results['x_min']:.6f} - {results['x_max']:.6f}
+"""
+
+
+def _ticks(lo, hi, target=5):
+    """Posisi tick 'bagus' (1, 2, 5 x 10^k) di antara lo dan hi"""
+    span = hi - lo
+    raw = span / target
+    magnitude = 10 ** np.floor(np.log10(raw))
+    step = magnitude * min((m for m in (1, 2, 5, 10) if m * magnitude >= raw), default=10)
+    # Kelipatan bulat dari step (+ 0.0 agar tidak tertulis '-0')
+    return np.arange(np.ceil(lo / step), np.floor(hi / step) + 1) * step + 0.0
+
+
+def _svg_plot(series, title, x_label, y_label, hline=None, width=PLOT_WIDTH, height=PLOT_HEIGHT):
+    """Grafik scatter/garis sebagai SVG inline (tanpa JavaScript, ikut tercetak ke PDF).
+
+    `series` berisi dict dengan kunci x, y, color dan kind ('markers'
+    atau 'line'). Koordinat piksel dihitung sekaligus dengan NumPy.
+    """
+    left, right, top, bottom = 70, 20, 36, 50
+    xs = np.concatenate([s['x'] for s in series])
+    ys = np.concatenate([s['y'] for s in series] + ([[hline]] if hline is not None else []))
+    x_lo, x_hi = float(xs.min()), float(xs.max())
+    y_lo, y_hi = float(ys.min()), float(ys.max())
+    if x_hi <= x_lo:
+        x_lo, x_hi = x_lo - 1, x_hi + 1
+    if y_hi <= y_lo:
+        y_lo, y_hi = y_lo - 1, y_hi + 1
+    pad = (y_hi - y_lo) * 0.05
+    y_lo, y_hi = y_lo - pad, y_hi + pad
+
+    def px(v):
+        return left + (np.asarray(v) - x_lo) / (x_hi - x_lo) * (width - left - right)
+
+    def py(v):
+        return height - bottom - (np.asarray(v) - y_lo) / (y_hi - y_lo) * (height - top - bottom)
+
+    parts = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+             f'viewBox="0 0 {width} {height}" font-family="sans-serif" font-size="11">',
+             f'<text x="{width / 2}" y="20" text-anchor="middle" font-size="14">'
+             f'{html.escape(title)}</text>']
+    for t in _ticks(x_lo, x_hi):
+        parts.append(f'<line x1="{px(t):.1f}" x2="{px(t):.1f}" y1="{top}" '
+                     f'y2="{height - bottom}" stroke="#eee"/>'
+                     f'<text x="{px(t):.1f}" y="{height - bottom + 15}" '
+                     f'text-anchor="middle">{t:g}</text>')
+    for t in _ticks(y_lo, y_hi):
+        parts.append(f'<line x1="{left}" x2="{width - right}" y1="{py(t):.1f}" '
+                     f'y2="{py(t):.1f}" stroke="#eee"/>'
+                     f'<text x="{left - 6}" y="{py(t) + 4:.1f}" text-anchor="end">{t:g}</text>')
+    parts.append(f'<rect x="{left}" y="{top}" width="{width - left - right}" '
+                 f'height="{height - top - bottom}" fill="none" stroke="#999"/>')
+    if hline is not None:
+        parts.append(f'<line x1="{left}" x2="{width - right}" y1="{py(hline):.1f}" '
+                     f'y2="{py(hline):.1f}" stroke="gray" stroke-dasharray="5,4"/>')
+    for s in series:
+        X, Y = px(s['x']), py(s['y'])
+        if s['kind'] == 'line':
+            points = ' '.join(f'{a:.1f},{b:.1f}' for a, b in zip(X, Y))
+            parts.append(f'<polyline points="{points}" fill="none" stroke="{s["color"]}" '
+                         f'stroke-width="2.5"/>')
+        else:
+            parts.append(f'<g fill="{s["color"]}">' + ''.join(
+                f'<circle cx="{a:.1f}" cy="{b:.1f}" r="3.5"/>' for a, b in zip(X, Y)) + '</g>')
+    parts.append(f'<text x="{(left + width - right) / 2}" y="{height - 12}" '
+                 f'text-anchor="middle">{html.escape(x_label)}</text>'
+                 f'<text transform="translate(16 {(top + height - bottom) / 2}) rotate(-90)" '
+                 f'text-anchor="middle">{html.escape(y_label)}</text></svg>')
+    return ''.join(parts)
+
+
+def report_figures(x, y, results, max_points=REPORT_PLOT_POINTS):
+    """SVG kurva kalibrasi dan residual; data besar di-decimate seperti grafik di aplikasi"""
+    # Import di sini: plotting memuat Plotly, yang tidak perlu untuk report teks
+    from .plotting import decimate
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    residuals = np.asarray(results['residuals'], dtype=float)
+    valid = np.isfinite(x) & np.isfinite(y)
+    x, y, residuals = x[valid], y[valid], residuals[valid]
+    s_res = results['s_res']
+    outliers = np.abs(residuals) > 3 * s_res if s_res > 0 else None
+    idx = decimate(x, y, max_points, keep=outliers)
+    x_line = np.array([x.min(), x.max()])
+    calibration = _svg_plot(
+        [{'x': x[idx], 'y': y[idx], 'color': '#2E86AB', 'kind': 'markers'},
+         {'x': x_line, 'y': results['intercept'] + results['slope'] * x_line,
+          'color': '#A23B72', 'kind': 'line'}],
+        "Calibration Curve", "Concentration", "Response")
+    residual = _svg_plot([{'x': x[idx], 'y': residuals[idx], 'color': '#F18F01',
+                           'kind': 'markers'}],
+                         "Residual Plot", "Concentration", "Residuals", hline=0.0)
+    return calibration, residual
+
+
+def _parameter_table(results):
+    rows = [
+        ("Equation", results['equation']),
+        ("Slope", f"{results['slope']:.6f} ± {results['se_slope']:.6f} "
+                  f"(95% CI ±{results['ci_slope']:.6f})"),
+        ("Intercept", f"{results['intercept']:.6f} ± {results['se_intercept']:.6f} "
+                      f"(95% CI ±{results['ci_intercept']:.6f})"),
+        ("R²", f"{results['r_squared']:.6f}"),
+        ("R", f"{results['r_value']:.6f}"),
+        ("p-value", f"{results['p_value']:.6g}"),
+        ("S_res", f"{results['s_res']:.6f}"),
+        ("LOD", f"{results['LOD']:.6f}"),
+        ("LOQ", f"{results['LOQ']:.6f}"),
+        ("Number of points", f"{results['n']}"),
+        ("X range", f"{results['x_min']:.6f} - {results['x_max']:.6f}"),
+    ]
+    return pd.DataFrame(rows, columns=["Parameter", "Value"])
+
+
+def _format_column(values):
+    """Teks sel satu kolom sekaligus (angka %.6g, sisanya di-escape)"""
+    values = np.asarray(values)
+    if values.dtype.kind in 'iu':
+        return np.char.mod('%d', values)
+    if values.dtype.kind == 'f':
+        return np.where(np.isnan(values), '', np.char.mod('%.6g', values))
+    return np.array([html.escape(str(v)) if v == v and v is not None else ''
+                     for v in values.tolist()], dtype=object)
+
+
+def _table_html(df, max_rows=REPORT_MAX_ROWS, total=None):
+    """Tabel HTML; sel diformat per kolom (DataFrame.to_html memformat sel satu per satu)"""
+    total = len(df) if total is None else total
+    df = df.head(max_rows)
+    header = ''.join(f'<th>{html.escape(str(c))}</th>' for c in df.columns)
+    if len(df.columns) and len(df):
+        cells = [np.char.add(np.char.add('<td>', _format_column(df[c].to_numpy()).astype(str)),
+                             '</td>') for c in df.columns]
+        body = ''.join('<tr>' + ''.join(row) + '</tr>' for row in zip(*cells))
+    else:
+        body = ''
+    note = (f'<p class="note">First {max_rows} of {total} rows.</p>'
+            if total > max_rows else '')
+    return f'<table><thead><tr>{header}</tr></thead><tbody>{body}</tbody></table>{note}'
+
+
+def report_html(x, y, results, predictions=None, summary=None, title="Calibration Report"):
+    """Report HTML mandiri (satu file, tanpa JavaScript atau file eksternal).
+
+    Berisi grafik kalibrasi dan residual (SVG), tabel parameter, tabel
+    standar dan - jika diberikan - tabel prediksi (`predictions`,
+    DataFrame dari `prediction_frame`) beserta ringkasan `summary`
+    (`StreamSummary.as_dict()`). Tabel dipotong di `REPORT_MAX_ROWS`.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    calibration, residual = report_figures(x, y, results)
+    standards = pd.DataFrame({'Concentration': x, 'Response': y,
+                              'Predicted Response': results['y_pred'],
+                              'Residual': results['residuals']})
+    sections = [
+        '<h2>Calibration</h2>', f'<div class="figures">{calibration}{residual}</div>',
+        '<h2>Parameters</h2>', _table_html(_parameter_table(results)),
+        '<h2>Standards</h2>', _table_html(standards),
+    ]
+    if summary is not None:
+        sections += ['<h2>Sample Summary</h2>', _table_html(pd.DataFrame([summary]))]
+    if predictions is not None and len(predictions):
+        total = summary['count'] if summary is not None else None
+        sections += ['<h2>Sample Predictions</h2>', _table_html(predictions, total=total)]
+    return f"""<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8"><title>{html.escape(title)}</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em; color: #222; }}
+h1 {{ color: #1E3A8A; }} h2 {{ color: #2E86AB; border-bottom: 1px solid #ddd; }}
+table {{ border-collapse: collapse; margin: 0.5em 0; font-size: 0.9em; }}
+th, td {{ padding: 3px 10px; border-bottom: 1px solid #eee; text-align: right; }}
+th {{ background: #f4f6fa; }} .figures svg {{ max-width: 100%; height: auto; }}
+.note {{ color: #777; font-size: 0.85em; }}
+</style></head><body>
+<h1>{html.escape(title)}</h1>
+{''.join(sections)}
+</body></html>
+"""
+
+
+def _weasyprint():
+    """Modul weasyprint (opsional, untuk PDF) atau None"""
+    try:
+        import weasyprint
+    except (ImportError, OSError):
+        return None
+    return weasyprint
+
+
+def report_formats():
+    """Format report yang bisa dipakai di lingkungan ini (PDF butuh weasyprint)"""
+    return ['HTML', 'PDF'] if _weasyprint() is not None else ['HTML']
+
+
+def render_report(x, y, results, predictions=None, summary=None, fmt='HTML',
+                  title="Calibration Report"):
+    """Isi file report dalam format `fmt` sebagai bytes"""
+    document = report_html(x, y, results, predictions, summary, title)
+    if fmt == 'HTML':
+        return document.encode('utf-8')
+    if fmt == 'PDF':
+        weasyprint = _weasyprint()
+        if weasyprint is None:
+            raise RuntimeError("PDF reports need the 'weasyprint' package")
+        return weasyprint.HTML(string=document).write_pdf()
+    raise ValueError(f"Unknown report format {fmt!r}")
+
+
+def report_key(x, y, results, predictions=None, summary=None, fmt='HTML',
+               title="Calibration Report"):
+    """Kunci cache report: hash data standar, parameter model, prediksi dan opsi"""
+    model = tuple(sorted((k, v) for k, v in results.items() if np.isscalar(v)))
+    return array_hash(np.asarray(x, dtype=float), np.asarray(y, dtype=float), model=model,
+                      predictions=frame_hash(predictions) if predictions is not None else None,
+                      summary=summary, fmt=fmt, title=title)
+
+
+def cached_report(x, y, results, predictions=None, summary=None, fmt='HTML',
+                  title="Calibration Report"):
+    """render_report dengan cache berdasarkan hash data dan model"""
+    key = report_key(x, y, results, predictions, summary, fmt, title)
+    return report_cache.get_or_compute(
+        key, lambda: render_report(x, y, results, predictions, summary, fmt, title))
+
+
+def _render_task(task):
+    return render_report(*task)
+
+
+class ReportPool:
+    """Pembuatan report di background (ProcessPoolExecutor) dengan cache hasil.
+
+    `submit` langsung mengembalikan Future: selesai seketika jika report
+    sudah ada di `report_cache`, Future yang sama jika report dengan kunci
+    itu sedang dibuat, atau task baru di pool. UI cukup memeriksa
+    `future.done()` tanpa pernah menunggu rendering. Pool proses dibuat
+    saat pertama dipakai.
+    """
+
+    def __init__(self, workers=None, cache=report_cache):
+        self.workers = workers or min(os.cpu_count() or 1, 4)
+        self.cache = cache
+        self._executor = None
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def _pool(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def submit(self, x, y, results, predictions=None, summary=None, fmt='HTML',
+               title="Calibration Report"):
+        key = report_key(x, y, results, predictions, summary, fmt, title)
+        cached = self.cache.get(key)
+        if cached is not None:
+            future = Future()
+            future.set_result(cached)
+            return future
+        with self._lock:
+            future = self._pending.get(key)
+            if future is not None:
+                return future
+            # Hanya parameter skalar dan array yang dikirim ke proses worker
+            task = (np.asarray(x, dtype=float), np.asarray(y, dtype=float), dict(results),
+                    predictions, summary, fmt, title)
+            future = self._pool().submit(_render_task, task)
+            self._pending[key] = future
+        # Di luar lock: callback langsung dijalankan di thread ini jika task sudah selesai
+        future.add_done_callback(lambda f, key=key: self._finish(key, f))
+        return future
+
+    def _finish(self, key, future):
+        # Simpan ke cache dulu, baru hapus dari pending, agar `submit` di antaranya
+        # selalu menemukan salah satunya dan tidak membuat report yang sama lagi
+        if not future.cancelled() and future.exception() is None:
+            self.cache.put(key, future.result())
+        with self._lock:
+            if self._pending.get(key) is future:
+                del self._pending[key]
+
+    def map(self, tasks):
+        """Report untuk banyak task `(x, y, results, ...)` sekaligus, urutan dipertahankan"""
+        futures = [self.submit(*task) for task in tasks]
+        return [future.result() for future in futures]
+
+    def pending(self):
+        return len(self._pending)
+
+    def shutdown(self, wait=True):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+# Pool bersama untuk aplikasi Streamlit (semua sesi)
+report_pool = ReportPool()
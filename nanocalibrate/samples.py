@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+
+
+class SampleQueue:
+    """Daftar respons sampel yang terus bertambah, untuk disimpan di session.
+
+    Respons disimpan di buffer numpy yang kapasitasnya dilipatgandakan saat
+    penuh, jadi menambah nilai bersifat amortized O(1) dan tidak menyalin
+    seluruh daftar setiap kali. ID sampel (opsional) disimpan sejajar;
+    nilai tanpa ID berisi None. `version` naik setiap isi berubah dan
+    dipakai sebagai kunci cache hasil turunan (prediksi, grup replikat).
+    """
+
+    def __init__(self, capacity=1024):
+        self._responses = np.empty(capacity, dtype=float)
+        self._ids = np.empty(capacity, dtype=object)
+        self._size = 0
+        self._missing_ids = 0
+        self._sources = set()
+        self.version = 0
+
+    def _reserve(self, size):
+        capacity = len(self._responses)
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        for name in ('_responses', '_ids'):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+
+    def append(self, responses, ids=None, source=None):
+        """Tambahkan respons (dan ID-nya) di akhir daftar.
+
+        Jika `source` (mis. ID file upload) sudah pernah ditambahkan, tidak
+        ada yang berubah; mengembalikan jumlah nilai yang ditambahkan.
+        """
+        if source is not None:
+            if source in self._sources:
+                return 0
+            self._sources.add(source)
+        responses = np.asarray(responses, dtype=float).ravel()
+        end = self._size + len(responses)
+        self._reserve(end)
+        self._responses[self._size:end] = responses
+        if ids is None:
+            self._ids[self._size:end] = None
+            self._missing_ids += len(responses)
+        else:
+            ids = np.asarray(ids, dtype=object).ravel()
+            self._ids[self._size:end] = ids
+            self._missing_ids += int((pd.isna(ids) | (ids == '')).sum())
+        self._size = end
+        if len(responses):
+            self.version += 1
+        return len(responses)
+
+    def has_source(self, source):
+        return source in self._sources
+
+    def clear(self):
+        self._size = 0
+        self._missing_ids = 0
+        self._sources.clear()
+        self.version += 1
+
+    @property
+    def responses(self):
+        """View read-only ke respons yang sudah ditambahkan"""
+        view = self._responses[:self._size]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def ids(self):
+        """ID sampel (None untuk respons tanpa ID), atau None jika tidak ada ID sama sekali"""
+        if self._size == 0 or self._missing_ids == self._size:
+            return None
+        return self._ids[:self._size]
+
+    @property
+    def missing_ids(self):
+        """Jumlah respons tanpa ID sampel"""
+        return self._missing_ids
+
+    def __len__(self):
+        return self._size
@@ -0,0 +1,407 @@
+"""Layanan HTTP lokal untuk inverse prediction dengan registry model yang sudah di-fit.
+
+Contoh:
+    python -m nanocalibrate serve --port 8765 --model plate1=data/plate1.csv
+    python -m nanocalibrate serve --artifacts models.ncal
+
+Model di-fit sekali (saat start atau lewat POST /models) lalu disimpan di
+memori berdasarkan ID; request prediksi tidak pernah fit ulang. Server
+memakai asyncio (HTTP/1.1 dengan keep-alive) sehingga banyak koneksi
+dilayani bersamaan; batch besar dihitung di thread pool agar event loop
+tetap responsif.
+
+Endpoint:
+    GET    /health
+    GET    /models
+    POST   /models                 JSON {"model_id", "x", "y", "confidence"}
+                                   atau CSV (?model_id=...&x_col=...&y_col=...)
+    GET    /models/<id>
+    DELETE /models/<id>
+    POST   /models/<id>/predict    JSON {"responses": [...], "confidence", "replicates"},
+                                   CSV (?column=...) atau teks satu nilai per baris.
+                                   Header `Accept: text/csv` menghasilkan CSV.
+"""
+import asyncio
+import io
+import json
+import threading
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import numpy as np
+import pandas as pd
+
+from .calibration import calculate_calibration
+from .prediction import predict_concentrations, prediction_frame
+
+# Parameter model yang dikirim di ringkasan /models
+MODEL_FIELDS = ('n', 'slope', 'intercept', 'r_squared', 's_res', 'LOD', 'LOQ',
+                'se_slope', 'se_intercept', 'x_min', 'x_max')
+PREDICTION_FIELDS = ('concentration', 'se_pred', 'ci_lower', 'ci_upper',
+                     'below_lod', 'below_loq', 'above_range')
+# Body di atas ukuran ini diproses di thread pool, bukan di event loop
+INLINE_BYTES = 64 * 1024
+MAX_BODY_BYTES = 256 * 2**20
+
+_REASONS = {200: 'OK', 201: 'Created', 400: 'Bad Request', 404: 'Not Found',
+            405: 'Method Not Allowed', 411: 'Length Required', 413: 'Payload Too Large',
+            431: 'Request Header Fields Too Large', 500: 'Internal Server Error'}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class ModelRegistry:
+    """Model kalibrasi yang sudah di-fit, disimpan di memori berdasarkan ID (thread-safe)"""
+
+    def __init__(self):
+        self._models = {}
+        self._lock = threading.Lock()
+
+    def fit(self, model_id, x, y, confidence=0.95):
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        valid = np.isfinite(x) & np.isfinite(y)
+        results = calculate_calibration(x[valid], y[valid], confidence=confidence)
+        if results is None:
+            raise ValueError("Not enough data points for calibration")
+        self.register(model_id, results)
+        return results
+
+    def register(self, model_id, results):
+        with self._lock:
+            self._models[str(model_id)] = results
+
+    def get(self, model_id):
+        with self._lock:
+            return self._models[model_id]
+
+    def remove(self, model_id):
+        with self._lock:
+            del self._models[model_id]
+
+    def __contains__(self, model_id):
+        return model_id in self._models
+
+    def __len__(self):
+        return len(self._models)
+
+    def ids(self):
+        with self._lock:
+            return sorted(self._models)
+
+    def save(self, path, confidence=0.95):
+        """Simpan semua model ke satu file `.ncal` (lihat `artifacts.save_models`)"""
+        from .artifacts import model_records, save_models
+
+        with self._lock:
+            ids = sorted(self._models)
+            fits = [self._models[model_id] for model_id in ids]
+        save_models(path, model_records(fits, ids, confidence=confidence))
+        return len(ids)
+
+    def load(self, path):
+        """Daftarkan semua model dari file `.ncal` tanpa fit ulang"""
+        from .artifacts import load_models, model_results
+
+        models = {}
+        for results in model_results(load_models(path)):
+            models[results.pop('model_id')] = results
+        with self._lock:
+            self._models.update(models)
+        return len(models)
+
+
+def model_summary(model_id, results):
+    summary = {'model_id': model_id, 'equation': results['equation']}
+    summary.update({key: _scalar(results[key]) for key in MODEL_FIELDS})
+    return summary
+
+
+def _scalar(value):
+    value = value.item() if isinstance(value, np.generic) else value
+    if isinstance(value, float) and not np.isfinite(value):
+        return None
+    return value
+
+
+def _json_list(values):
+    """Array -> list untuk JSON (NaN/inf menjadi null)"""
+    if values is None:
+        return None
+    values = np.asarray(values)
+    if values.dtype.kind == 'f' and not np.isfinite(values).all():
+        return [v if np.isfinite(v) else None for v in values.tolist()]
+    return values.tolist()
+
+
+def _is_json(body, content_type):
+    """JSON jika dinyatakan, atau jika body berbentuk objek/array JSON dan bukan CSV.
+
+    curl tanpa `-H 'Content-Type: ...'` mengirim application/x-www-form-urlencoded,
+    jadi body JSON tetap dikenali dari karakter pertamanya.
+    """
+    if content_type == 'application/json':
+        return True
+    return content_type != 'text/csv' and body.lstrip()[:1] in (b'{', b'[')
+
+
+def _parse_responses(body, content_type, query):
+    """Respons sampel dari body JSON, CSV atau teks; NaN/inf dibuang"""
+    if _is_json(body, content_type):
+        payload = json.loads(body or b'{}')
+        responses = payload.get('responses') if isinstance(payload, dict) else payload
+        if responses is None:
+            raise ValueError("JSON body needs a 'responses' list")
+        options = payload if isinstance(payload, dict) else {}
+        responses = np.asarray(responses, dtype=float).ravel()
+        return responses[np.isfinite(responses)], options
+    if content_type == 'text/csv':
+        column = query.get('column')
+        frame = pd.read_csv(io.BytesIO(body), usecols=[column] if column else None)
+        responses = frame[column or frame.columns[0]].to_numpy(dtype=float)
+    else:
+        responses = np.array(body.split(), dtype=float)
+    return responses[np.isfinite(responses)], query
+
+
+def _parse_standards(body, content_type, query):
+    if _is_json(body, content_type):
+        payload = json.loads(body or b'{}')
+        return payload.get('model_id'), payload.get('x'), payload.get('y'), payload
+    frame = pd.read_csv(io.BytesIO(body))
+    x_col = query.get('x_col') or frame.columns[0]
+    y_col = query.get('y_col') or frame.columns[1 if len(frame.columns) > 1 else 0]
+    return query.get('model_id'), frame[x_col].to_numpy(), frame[y_col].to_numpy(), query
+
+
+def _confidence(options):
+    value = options.get('confidence', 0.95)
+    try:
+        confidence = float(value)
+    except (TypeError, ValueError):
+        raise HTTPError(400, f"confidence must be a number, got {value!r}") from None
+    if not 0 < confidence < 1:
+        raise HTTPError(400, f"confidence must be between 0 and 1, got {value!r}")
+    return confidence
+
+
+def _replicates(options):
+    """Jumlah replikat; hanya bilangan bulat >= 1 (0.5 atau 1.9 tidak dibulatkan diam-diam)"""
+    value = options.get('replicates', 1)
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        number = None
+    if isinstance(value, bool) or number is None or not number.is_integer() or number < 1:
+        raise HTTPError(400, f"replicates must be a whole number of at least 1, got {value!r}")
+    return int(number)
+
+
+def _json(status, payload):
+    return status, 'application/json', json.dumps(payload).encode('utf-8')
+
+
+class PredictionService:
+    """Logika endpoint (tanpa jaringan): `handle(...)` -> `(status, content_type, body)`"""
+
+    def __init__(self, registry=None):
+        self.registry = registry if registry is not None else ModelRegistry()
+
+    def handle(self, method, path, query=None, headers=None, body=b''):
+        query = query or {}
+        headers = headers or {}
+        content_type = headers.get('content-type', 'application/json').split(';')[0].strip()
+        parts = [unquote(p) for p in path.strip('/').split('/') if p]
+        try:
+            if parts == ['health']:
+                return _json(200, {'status': 'ok', 'models': len(self.registry)})
+            if parts == ['models']:
+                if method == 'GET':
+                    return _json(200, [model_summary(i, self.registry.get(i))
+                                       for i in self.registry.ids()])
+                if method == 'POST':
+                    return self._fit(body, content_type, query)
+                raise HTTPError(405, f"{method} not allowed on /models")
+            if len(parts) == 2 and parts[0] == 'models':
+                if method == 'GET':
+                    return _json(200, model_summary(parts[1], self._model(parts[1])))
+                if method == 'DELETE':
+                    self._model(parts[1])
+                    self.registry.remove(parts[1])
+                    return _json(200, {'deleted': parts[1]})
+                raise HTTPError(405, f"{method} not allowed on /models/<id>")
+            if len(parts) == 3 and parts[0] == 'models' and parts[2] == 'predict':
+                if method != 'POST':
+                    raise HTTPError(405, "Use POST for predictions")
+                return self._predict(parts[1], body, content_type, query,
+                                     headers.get('accept', ''))
+            raise HTTPError(404, f"Unknown endpoint {path}")
+        except HTTPError as e:
+            return _json(e.status, {'error': str(e)})
+        except (ValueError, KeyError, TypeError, pd.errors.ParserError) as e:
+            return _json(400, {'error': f"{type(e).__name__}: {e}"})
+        except Exception as e:
+            return _json(500, {'error': f"{type(e).__name__}: {e}"})
+
+    def _model(self, model_id):
+        try:
+            return self.registry.get(model_id)
+        except KeyError:
+            raise HTTPError(404, f"Unknown model {model_id!r}") from None
+
+    def _fit(self, body, content_type, query):
+        model_id, x, y, options = _parse_standards(body, content_type, query)
+        if not model_id:
+            raise ValueError("model_id is required")
+        if x is None or y is None:
+            raise ValueError("x and y are required")
+        results = self.registry.fit(model_id, x, y, confidence=_confidence(options))
+        return _json(201, model_summary(str(model_id), results))
+
+    def _predict(self, model_id, body, content_type, query, accept):
+        model = self._model(model_id)
+        responses, options = _parse_responses(body, content_type, query)
+        confidence = _confidence(options)
+        replicates = _replicates(options)
+        prediction = predict_concentrations(responses, model, confidence=confidence,
+                                            replicates=replicates)
+        if 'text/csv' in accept:
+            csv = prediction_frame(prediction, confidence).to_csv(index=False)
+            return 200, 'text/csv', csv.encode('utf-8')
+        payload = {'model_id': model_id, 'n': len(responses), 'confidence': confidence}
+        payload.update({key: _json_list(prediction[key]) for key in PREDICTION_FIELDS})
+        return _json(200, payload)
+
+
+async def _read_request(reader, max_body):
+    """Baca satu request HTTP/1.1; None jika koneksi ditutup klien"""
+    try:
+        head = await reader.readuntil(b'\r\n\r\n')
+    except asyncio.IncompleteReadError:
+        return None
+    except asyncio.LimitOverrunError:
+        # Header melebihi limit buffer StreamReader (64 KiB)
+        raise HTTPError(431, "Request header too large") from None
+    lines = head.decode('latin-1').split('\r\n')
+    method, target, version = lines[0].split(' ', 2)
+    headers = {}
+    for line in lines[1:]:
+        if ':' in line:
+            name, value = line.split(':', 1)
+            headers[name.strip().lower()] = value.strip()
+    if 'chunked' in headers.get('transfer-encoding', '').lower():
+        raise HTTPError(411, "Chunked bodies are not supported; send Content-Length")
+    length = int(headers.get('content-length', 0))
+    if length > max_body:
+        raise HTTPError(413, f"Body larger than {max_body} bytes")
+    body = await reader.readexactly(length) if length else b''
+    url = urlsplit(target)
+    query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+    keep_alive = headers.get('connection', '').lower() != 'close' and version == 'HTTP/1.1'
+    return method.upper(), url.path, query, headers, body, keep_alive
+
+
+def _response_bytes(status, content_type, body, keep_alive):
+    head = (f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+    return head.encode('latin-1') + body
+
+
+class PredictionServer:
+    """Server asyncio untuk `PredictionService`"""
+
+    def __init__(self, service=None, host='127.0.0.1', port=8765, max_body=MAX_BODY_BYTES,
+                 inline_bytes=INLINE_BYTES):
+        self.service = service if service is not None else PredictionService()
+        self.host = host
+        self.port = port
+        self.max_body = max_body
+        self.inline_bytes = inline_bytes
+        self._server = None
+
+    async def _handle_connection(self, reader, writer):
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                try:
+                    request = await _read_request(reader, self.max_body)
+                except HTTPError as e:
+                    writer.write(_response_bytes(*_json(e.status, {'error': str(e)}), False))
+                    break
+                except (ValueError, UnicodeDecodeError):
+                    writer.write(_response_bytes(*_json(400, {'error': "Malformed request"}), False))
+                    break
+                if request is None:
+                    break
+                method, path, query, headers, body, keep_alive = request
+                if len(body) > self.inline_bytes:
+                    # Batch besar: parse dan prediksi di thread pool
+                    result = await loop.run_in_executor(
+                        None, self.service.handle, method, path, query, headers, body)
+                else:
+                    result = self.service.handle(method, path, query, headers, body)
+                writer.write(_response_bytes(*result, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self._server
+
+    async def serve_forever(self):
+        server = self._server or await self.start()
+        async with server:
+            await server.serve_forever()
+
+
+def load_models(registry, specs, x_col=None, y_col=None, confidence=0.95, artifacts=()):
+    """Fit model dari spesifikasi `id=path` (file kalibrasi CSV/Excel).
+
+    File `.ncal` di `artifacts` (atau sebagai path di spesifikasi) dibaca
+    langsung sebagai model yang sudah di-fit.
+    """
+    from .artifacts import MODEL_SUFFIX, load_model
+    from .ingest import read_table
+
+    for path in artifacts:
+        registry.load(path)
+    for spec in specs:
+        model_id, sep, path = spec.partition('=')
+        if not sep:
+            raise ValueError(f"Model spec must be id=path, got {spec!r}")
+        if path.endswith(MODEL_SUFFIX):
+            registry.register(model_id, load_model(path))
+            continue
+        df = read_table(path)
+        xc = x_col if x_col is not None else df.columns[0]
+        yc = y_col if y_col is not None else df.columns[1 if len(df.columns) > 1 else 0]
+        registry.fit(model_id, df[xc].to_numpy(), df[yc].to_numpy(), confidence=confidence)
+    return registry
+
+
+def serve(host='127.0.0.1', port=8765, models=(), x_col=None, y_col=None, confidence=0.95,
+          artifacts=()):
+    registry = load_models(ModelRegistry(), models, x_col, y_col, confidence, artifacts)
+    server = PredictionServer(PredictionService(registry), host, port)
+
+    async def run():
+        await server.start()
+        print(f"Serving {len(registry)} model(s) on http://{server.host}:{server.port}",
+              flush=True)
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,250 @@
+import atexit
+import json
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+import weakref
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from .artifacts import check_private_dir
+from .export import frame_hash
+
+# Folder induk store (opsional); tanpa ini store memakai folder sementara privat per proses
+DEFAULT_STORE_DIR = os.environ.get('NANOCALIBRATE_STORE_DIR') or None
+# Batas ukuran di disk; dataset tanpa referensi dihapus (LRU) di atas batas ini
+DEFAULT_MAX_BYTES = int(os.environ.get('NANOCALIBRATE_STORE_MAX_BYTES', 2 * 2**30))
+
+_META_FILE = 'meta.json'
+
+
+def _private_dir(parent=None):
+    """Folder baru milik proses ini (mode 0700) di `parent` atau folder sementara sistem.
+
+    `parent` yang sudah ada harus milik user ini dan tidak bisa ditulis
+    user lain, agar isi store tidak bisa ditanam atau ditukar dari luar.
+    """
+    if parent is not None:
+        check_private_dir(parent, "Dataset store")
+    return tempfile.mkdtemp(prefix='nanocalibrate_store-', dir=parent)
+
+
+def _save_array(path, name, values):
+    """Simpan satu kolom tanpa pickle; teks disimpan sebagai array unicode lebar tetap.
+
+    Nilai kosong (None/NaN) pada kolom teks dicatat di file mask terpisah.
+    Mengembalikan metadata kolom untuk meta.json.
+    """
+    values = np.asarray(values)
+    if values.dtype.kind in 'biufcmM':
+        np.save(os.path.join(path, f'{name}.npy'), values, allow_pickle=False)
+        return {'file': f'{name}.npy', 'mmap': True}
+    missing = pd.isna(values)
+    text = np.where(missing, '', values).astype(str)
+    np.save(os.path.join(path, f'{name}.npy'), text, allow_pickle=False)
+    meta = {'file': f'{name}.npy', 'mmap': False, 'mask': None}
+    if missing.any():
+        np.save(os.path.join(path, f'{name}_mask.npy'), missing, allow_pickle=False)
+        meta['mask'] = f'{name}_mask.npy'
+    return meta
+
+
+def _load_array(path, meta):
+    file = os.path.join(path, meta['file'])
+    if meta['mmap']:
+        return np.load(file, mmap_mode='r', allow_pickle=False)
+    values = np.load(file, allow_pickle=False).astype(object)
+    if meta.get('mask'):
+        values[np.load(os.path.join(path, meta['mask']), allow_pickle=False)] = None
+    return values
+
+
+def _write_dataset(df, path):
+    """Tulis setiap kolom sebagai file .npy; meta.json ditulis terakhir sebagai penanda selesai"""
+    columns = []
+    for i, col in enumerate(df.columns):
+        # Kolom non-numerik (mis. ID sampel) disimpan sebagai teks, bukan array object
+        columns.append({'name': col, **_save_array(path, f'col_{i}', df[col].to_numpy())})
+    index = None
+    if not isinstance(df.index, pd.RangeIndex) or df.index.start != 0 or df.index.step != 1:
+        index = _save_array(path, 'index', df.index.to_numpy())
+    meta = {'columns': columns, 'index': index, 'rows': len(df)}
+    with open(os.path.join(path, _META_FILE), 'w', encoding='utf-8') as f:
+        json.dump(meta, f)
+
+
+def _read_dataset(path):
+    """DataFrame yang kolom numeriknya memory-mapped (read-only) dari file .npy.
+
+    Mengembalikan `(frame, maps)` dengan `maps` weakref ke setiap memory
+    map; selama salah satunya hidup, file dataset masih dibaca seseorang.
+    """
+    with open(os.path.join(path, _META_FILE), encoding='utf-8') as f:
+        meta = json.load(f)
+    data = {column['name']: _load_array(path, column) for column in meta['columns']}
+    index = _load_array(path, meta['index']) if meta['index'] else None
+    maps = [weakref.ref(values) for values in [*data.values(), index]
+            if isinstance(values, np.memmap)]
+    # copy=False: kolom tetap berupa view ke file, tidak disalin ke memori proses
+    return pd.DataFrame(data, index=index, copy=False), maps
+
+
+def _disk_size(path):
+    return sum(entry.stat().st_size for entry in os.scandir(path) if entry.is_file())
+
+
+class DatasetHandle:
+    """Referensi ringan ke dataset di `DatasetStore`.
+
+    Yang disimpan sesi hanya handle ini; DataFrame-nya dibuka bersama
+    oleh semua sesi lewat `frame()`. Saat handle tidak dipakai lagi
+    (di-garbage-collect), jumlah referensi dataset berkurang.
+    """
+
+    def __init__(self, store, key, rows, columns):
+        self.store = store
+        self.key = key
+        self.rows = rows
+        self.columns = columns
+        weakref.finalize(self, store.release, key)
+
+    def frame(self):
+        return self.store.frame(self.key)
+
+    def __len__(self):
+        return self.rows
+
+    def __repr__(self):
+        return f"DatasetHandle({self.key!r}, rows={self.rows}, columns={self.columns!r})"
+
+
+class DatasetStore:
+    """Store dataset berdasarkan hash isi, dipakai bersama semua sesi.
+
+    `put(df)` menulis DataFrame sekali ke disk (satu file .npy per kolom)
+    dan mengembalikan `DatasetHandle`; upload dengan isi yang sama
+    menghasilkan handle ke dataset yang sama tanpa salinan baru. Kolom
+    numerik dibuka dengan memory map, sehingga halaman data yang jarang
+    dibaca tidak menetap di RAM dan semua sesi berbagi page cache yang
+    sama. Dataset tanpa handle yang hidup dihapus (LRU) jika total ukuran
+    di disk melebihi `max_bytes`, kecuali memory map-nya masih dipakai.
+
+    File disimpan di folder privat (0700) yang dibuat proses ini di dalam
+    `parent` (default folder sementara sistem) dan dihapus saat proses
+    selesai. Store hanya membuka dataset yang ditulisnya sendiri, dan
+    tidak pernah memakai pickle.
+    """
+
+    def __init__(self, parent=DEFAULT_STORE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.parent = parent
+        self._root = None
+        self.max_bytes = max_bytes
+        self._lock = threading.RLock()
+        # key -> {'refs', 'bytes', 'frame'}; urutan = LRU
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def root(self):
+        """Folder privat store, dibuat saat pertama dipakai"""
+        with self._lock:
+            if self._root is None:
+                self._root = _private_dir(self.parent)
+                atexit.register(shutil.rmtree, self._root, ignore_errors=True)
+            return self._root
+
+    def _path(self, key):
+        return os.path.join(self.root, key)
+
+    def put(self, df):
+        """Simpan `df` (atau pakai salinan yang sudah ada) dan kembalikan handle-nya"""
+        key = frame_hash(df)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                # Hanya dataset yang ditulis store ini sendiri yang dipakai ulang
+                path = self._path(key)
+                shutil.rmtree(path, ignore_errors=True)
+                self._write(df, path)
+                self.misses += 1
+                entry = {'refs': 0, 'bytes': _disk_size(path), 'frame': None, 'maps': []}
+                self._entries[key] = entry
+            else:
+                self.hits += 1
+            entry['refs'] += 1
+            self._entries.move_to_end(key)
+            self._evict()
+        return DatasetHandle(self, key, len(df), list(df.columns))
+
+    def _write(self, df, path):
+        # Tulis ke direktori sementara lalu rename, agar pembaca tidak melihat file setengah jadi
+        tmp = os.path.join(self.root, f'.tmp-{uuid.uuid4().hex}')
+        os.makedirs(tmp)
+        try:
+            _write_dataset(df, tmp)
+            os.replace(tmp, path)
+        except BaseException:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+
+    def frame(self, key):
+        """DataFrame (memory-mapped, read-only) untuk `key`; dibuka sekali per proses"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                raise KeyError(f"Dataset {key!r} is not in the store")
+            if entry['frame'] is None:
+                entry['frame'], maps = _read_dataset(self._path(key))
+                # Memory map yang mungkin masih dipegang sesi lain setelah handle dilepas
+                entry['maps'].extend(maps)
+            self._entries.move_to_end(key)
+            return entry['frame']
+
+    def release(self, key):
+        """Kurangi jumlah referensi (dipanggil otomatis saat handle hilang)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            entry['refs'] -= 1
+            if entry['refs'] <= 0:
+                # Tutup memory map; file tetap ada sampai terkena eviction
+                entry['frame'] = None
+            self._evict()
+
+    def _evict(self):
+        total = sum(entry['bytes'] for entry in self._entries.values())
+        for key in list(self._entries):
+            if total <= self.max_bytes:
+                break
+            entry = self._entries[key]
+            # Folder hanya dihapus jika tidak ada handle maupun view ke memory map-nya
+            entry['maps'] = [ref for ref in entry['maps'] if ref() is not None]
+            if entry['refs'] > 0 or entry['maps']:
+                continue
+            del self._entries[key]
+            shutil.rmtree(self._path(key), ignore_errors=True)
+            total -= entry['bytes']
+            self.evictions += 1
+
+    def stats(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._entries),
+                'referenced': sum(1 for entry in self._entries.values() if entry['refs'] > 0),
+                'bytes': sum(entry['bytes'] for entry in self._entries.values()),
+                'max_bytes': self.max_bytes,
+            }
+
+
+# Store yang dipakai bersama semua sesi Streamlit dalam proses ini
+dataset_store = DatasetStore()
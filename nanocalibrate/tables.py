@@ -0,0 +1,64 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+# Jumlah baris default per halaman tabel
+DEFAULT_PAGE_SIZE = 50
+
+
+def table_view(df, sort_by=None, ascending=True, filter_col=None, lo=None, hi=None):
+    """Indeks baris setelah filter dan sort, dihitung langsung pada array kolom.
+
+    Filter adalah rentang [lo, hi] pada kolom numerik `filter_col`.
+    Sort stabil ke dua arah (baris dengan nilai sama tetap urut aslinya)
+    dan nilai kosong selalu di akhir, seperti `sort_values(kind='stable',
+    na_position='last')`. Mengembalikan array posisi baris (bukan label index).
+    """
+    rows = np.arange(len(df))
+    if filter_col is not None and (lo is not None or hi is not None):
+        values = df[filter_col].to_numpy()
+        mask = np.ones(len(df), dtype=bool)
+        if lo is not None:
+            mask &= values >= lo
+        if hi is not None:
+            mask &= values <= hi
+        rows = rows[mask]
+    if sort_by is not None:
+        values = df[sort_by].to_numpy()[rows]
+        # Kunci sort = peringkat nilai; descending memakai peringkat terbalik (bukan urutan
+        # dibalik) agar tetap stabil, dan nilai kosong (kode -1) diberi peringkat terakhir
+        codes, uniques = pd.factorize(values, sort=True)
+        k = len(uniques)
+        key = np.where(codes < 0, k, codes if ascending else k - 1 - codes)
+        rows = rows[np.argsort(key, kind='stable')]
+    return rows
+
+
+def page_count(n_rows, page_size=DEFAULT_PAGE_SIZE):
+    return max(1, math.ceil(n_rows / page_size))
+
+
+def format_page(df, decimals=6):
+    """Format kolom float per kolom (vectorized) menjadi teks dengan `decimals` digit"""
+    out = {}
+    for col in df.columns:
+        values = df[col].to_numpy()
+        if values.dtype.kind == 'f':
+            text = np.char.mod(f'%.{decimals}f', values)
+            out[col] = np.where(np.isnan(values), '', text)
+        else:
+            out[col] = values
+    return pd.DataFrame(out, index=df.index)
+
+
+def table_page(df, page=1, page_size=DEFAULT_PAGE_SIZE, decimals=6, **view):
+    """Satu halaman tabel yang sudah difilter, diurutkan dan diformat.
+
+    Hanya baris di halaman tersebut yang diformat, sehingga biayanya tidak
+    bergantung pada jumlah total baris. Mengembalikan `(halaman, n_baris)`.
+    """
+    rows = table_view(df, **view)
+    start = (page - 1) * page_size
+    visible = df.iloc[rows[start:start + page_size]]
+    return format_page(visible, decimals), len(rows)
@@ -0,0 +1,145 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .calibration import calculate_calibration, fit_batch
+
+BOOTSTRAP_METHODS = ('residual', 'pairs', 'montecarlo')
+# Jumlah resample per chunk (unit kerja per worker dan per seed)
+CHUNK_SIZE = 2000
+# Jumlah sel (resample x sampel) per blok saat menghitung percentile prediksi
+PREDICTION_CELLS = 5_000_000
+
+PARAMETERS = ('slope', 'intercept', 's_res', 'LOD', 'LOQ')
+
+
+def _resample_chunk(x, y, y_pred, residuals, s_res, method, size, seed):
+    """Satu chunk resample: semua fit dikerjakan sekaligus lewat fit_batch"""
+    rng = np.random.default_rng(seed)
+    n = len(x)
+    if method == 'pairs':
+        idx = rng.integers(0, n, size=(n, size))
+        xb, yb = x[idx], y[idx]
+    elif method == 'residual':
+        # Residual diskalakan agar variansnya sesuai derajat bebas n-2
+        scaled = residuals * np.sqrt(n / (n - 2))
+        xb = x
+        yb = y_pred[:, None] + scaled[rng.integers(0, n, size=(n, size))]
+    else:
+        xb = x
+        yb = y_pred[:, None] + rng.normal(0.0, s_res, size=(n, size))
+    fit = fit_batch(xb, yb)
+    return {key: fit[key] for key in PARAMETERS}
+
+
+def _sorted_quantiles(sorted_values, quantiles):
+    """Quantile (interpolasi linear seperti np.percentile) dari array terurut per kolom"""
+    last = len(sorted_values) - 1
+    out = []
+    for q in quantiles:
+        pos = q * last
+        lo = int(np.floor(pos))
+        hi = min(lo + 1, last)
+        frac = pos - lo
+        out.append(sorted_values[lo] * (1 - frac) + sorted_values[hi] * frac)
+    return out
+
+
+def _run_chunk(args):
+    return _resample_chunk(*args)
+
+
+def bootstrap_calibration(x, y, n_resamples=2000, method='residual', seed=None,
+                          confidence=0.95, workers=1, chunk_size=CHUNK_SIZE):
+    """Bootstrap / Monte Carlo untuk slope, intercept, s_res, LOD dan LOQ.
+
+    Setiap chunk resample dibangkitkan sebagai satu matriks (n x B) dan
+    di-fit sekaligus oleh `fit_batch`, tanpa loop Python per resample.
+    Seed setiap chunk diturunkan dari `seed` dengan SeedSequence, jadi
+    hasilnya sama untuk jumlah `workers` berapa pun. Dengan `workers` > 1
+    chunk dibagi ke beberapa proses.
+
+    `method`: 'residual' (resample residual), 'pairs' (resample pasangan
+    x, y) atau 'montecarlo' (noise normal dengan sigma = s_res).
+    """
+    if method not in BOOTSTRAP_METHODS:
+        raise ValueError(f"Unknown bootstrap method {method!r}")
+    if n_resamples < 1:
+        raise ValueError(f"n_resamples must be at least 1, got {n_resamples}")
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    valid = np.isfinite(x) & np.isfinite(y)
+    x, y = x[valid], y[valid]
+    results = calculate_calibration(x, y)
+    if results is None or len(x) < 3:
+        return None
+
+    sizes = [min(chunk_size, n_resamples - start) for start in range(0, n_resamples, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes) + 1)
+    tasks = [(x, y, results['y_pred'], results['residuals'], results['s_res'], method,
+              size, child) for size, child in zip(sizes, seeds[1:])]
+
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunks = list(pool.map(_run_chunk, tasks))
+    else:
+        chunks = [_run_chunk(task) for task in tasks]
+
+    draws = {key: np.concatenate([chunk[key] for chunk in chunks]) for key in PARAMETERS}
+    alpha = (1 - confidence) / 2
+    intervals = {key: tuple(np.nanpercentile(values, [100 * alpha, 100 * (1 - alpha)]))
+                 for key, values in draws.items()}
+    return {
+        'method': method,
+        'n_resamples': n_resamples,
+        'confidence': confidence,
+        'estimate': {key: results[key] for key in PARAMETERS},
+        'intervals': intervals,
+        'draws': draws,
+        'seed': seeds[0],
+    }
+
+
+def bootstrap_predictions(responses, bootstrap, include_response_noise=True,
+                          clip_negative=True):
+    """Interval percentile konsentrasi untuk setiap respons sampel.
+
+    Memakai draw slope/intercept/s_res dari `bootstrap_calibration`.
+    Sampel diproses per blok sehingga matriks (resample x sampel) tidak
+    pernah melebihi PREDICTION_CELLS elemen. Jika tidak ada draw yang
+    valid, semua interval bernilai NaN.
+    """
+    responses = np.asarray(responses, dtype=float).ravel()
+    draws = bootstrap['draws']
+    # Resample yang gagal (mis. semua x sama) tidak ikut dihitung
+    ok = np.isfinite(draws['slope']) & (draws['slope'] != 0)
+    slope = draws['slope'][ok, None]
+    intercept = draws['intercept'][ok, None]
+    s_res = draws['s_res'][ok, None]
+    alpha = (1 - bootstrap['confidence']) / 2
+    rng = np.random.default_rng(bootstrap['seed'])
+
+    low = np.full(len(responses), np.nan)
+    high = np.full(len(responses), np.nan)
+    median = np.full(len(responses), np.nan)
+    if len(slope) == 0:
+        return {'low': low, 'median': median, 'high': high}
+    step = max(1, PREDICTION_CELLS // len(slope))
+    for start in range(0, len(responses), step):
+        block = responses[None, start:start + step]
+        # Operasi in-place agar tidak membuat matriks sementara baru
+        if include_response_noise:
+            conc = rng.standard_normal(size=(len(slope), block.shape[1]))
+            conc *= s_res
+            conc += block
+        else:
+            conc = np.repeat(block, len(slope), axis=0)
+        conc -= intercept
+        conc /= slope
+        if clip_negative:
+            np.maximum(conc, 0, out=conc)
+        # Sort per kolom lebih cepat daripada np.percentile untuk matriks besar
+        conc.sort(axis=0)
+        q = _sorted_quantiles(conc, [alpha, 0.5, 1 - alpha])
+        low[start:start + step], median[start:start + step], high[start:start + step] = q
+    return {'low': low, 'median': median, 'high': high}
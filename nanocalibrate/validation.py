@@ -0,0 +1,236 @@
+import numpy as np
+import pandas as pd
+from scipy import special
+
+from .calibration import fit_batch
+
+
+def _codes(values):
+    """Kode grup 0..k-1 dan label uniknya (urut)"""
+    codes, labels = pd.factorize(np.asarray(values), sort=True, use_na_sentinel=False)
+    return codes, labels
+
+
+def _group_sums(codes, k, *weights):
+    """Jumlah anggota dan jumlah `weights` per grup lewat np.bincount"""
+    n = np.bincount(codes, minlength=k)
+    return (n,) + tuple(np.bincount(codes, weights=w, minlength=k) for w in weights)
+
+
+def _f_pvalue(F, df1, df2):
+    with np.errstate(invalid='ignore'):
+        return np.where((df1 > 0) & (df2 > 0) & np.isfinite(F),
+                        special.fdtrc(np.maximum(df1, 1), np.maximum(df2, 1), F), np.nan)
+
+
+def _clean(*arrays):
+    """Buang baris yang mengandung NaN pada kolom numerik"""
+    arrays = [np.asarray(a) for a in arrays]
+    valid = np.ones(len(arrays[0]), dtype=bool)
+    for a in arrays:
+        if a.dtype.kind == 'f':
+            valid &= np.isfinite(a)
+    return [a[valid] for a in arrays]
+
+
+def lack_of_fit_anova(x, y):
+    """ANOVA regresi linear dengan uji lack-of-fit terhadap pure error.
+
+    Pure error dihitung dari replikat di setiap level x (jumlah kuadrat
+    deviasi terhadap rata-rata level, satu `np.bincount`), lack-of-fit =
+    residual - pure error. Mengembalikan DataFrame dengan baris
+    Regression, Residual, Lack of fit, Pure error dan Total.
+    """
+    x, y = _clean(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+    n = len(x)
+    fit = fit_batch(x, y)
+    ss_total = float(fit['Syy'])
+    ss_res = float(fit['s_res']) ** 2 * (n - 2) if n > 2 else 0.0
+    ss_reg = ss_total - ss_res
+
+    codes, levels = _codes(x)
+    k = len(levels)
+    count, total = _group_sums(codes, k, y)
+    level_mean = total / count
+    ss_pe = float(np.sum((y - level_mean[codes]) ** 2))
+    ss_lof = max(ss_res - ss_pe, 0.0)
+
+    ss = np.array([ss_reg, ss_res, ss_lof, ss_pe, ss_total])
+    dfs = np.array([1, n - 2, k - 2, n - k, n - 1])
+    with np.errstate(invalid='ignore', divide='ignore'):
+        ms = np.where(dfs > 0, ss / np.maximum(dfs, 1), np.nan)
+        ms[-1] = np.nan
+        F = np.array([ms[0] / ms[1], np.nan, ms[2] / ms[3], np.nan, np.nan])
+    p = _f_pvalue(F, np.array([dfs[0], 0, dfs[2], 0, 0]), np.array([dfs[1], 0, dfs[3], 0, 0]))
+    return pd.DataFrame({
+        'Source': ['Regression', 'Residual', 'Lack of fit', 'Pure error', 'Total'],
+        'df': dfs,
+        'SS': ss,
+        'MS': ms,
+        'F': F,
+        'p-value': p,
+    })
+
+
+def mandel_test(x, y, alpha=0.05):
+    """Uji Mandel: apakah model kuadratik memperbaiki fit linear secara signifikan.
+
+        DS² = (n-2)·s_lin² - (n-3)·s_quad²,   F = DS² / s_quad²   (df 1, n-3)
+
+    Fit kuadratik memakai x terpusat dan diskalakan agar stabil untuk
+    ratusan ribu titik. Mengembalikan dict dengan s_lin, s_quad, F,
+    p_value, F_critical dan `linear` (True jika F tidak signifikan).
+    """
+    x, y = _clean(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+    n = len(x)
+    if n < 4 or len(np.unique(x)) < 3:
+        return None
+    s_lin = float(fit_batch(x, y)['s_res'])
+    scale = np.ptp(x) or 1.0
+    xc = (x - x.mean()) / scale
+    design = np.column_stack((np.ones(n), xc, xc * xc))
+    coef = np.linalg.lstsq(design, y, rcond=None)[0]
+    ss_quad = float(np.sum((y - design @ coef) ** 2))
+    s_quad = np.sqrt(ss_quad / (n - 3))
+    ds2 = (n - 2) * s_lin ** 2 - ss_quad
+    with np.errstate(invalid='ignore', divide='ignore'):
+        F = ds2 / s_quad ** 2 if s_quad > 0 else np.inf
+    p_value = float(special.fdtrc(1, n - 3, F)) if np.isfinite(F) else 0.0
+    F_critical = float(special.fdtri(1, n - 3, 1 - alpha))
+    return {
+        'n': n, 's_lin': s_lin, 's_quad': float(s_quad), 'DS2': float(ds2),
+        'F': float(F), 'p_value': p_value, 'F_critical': F_critical,
+        'linear': bool(F <= F_critical),
+    }
+
+
+def run_labels(day=None, analyst=None):
+    """Label run (kombinasi hari x analis) untuk presisi antara; None jika keduanya kosong"""
+    parts = [np.asarray(v) for v in (day, analyst) if v is not None]
+    if not parts:
+        return None
+    if len(parts) == 1:
+        return parts[0]
+    codes = [_codes(p)[0] for p in parts]
+    return codes[0] * (codes[1].max() + 1) + codes[1]
+
+
+def precision_table(level, found, runs=None):
+    """Presisi per level: repeatability dan intermediate precision (ANOVA satu arah, ISO 5725).
+
+    Di setiap level, hasil dikelompokkan per run (mis. hari x analis):
+    s_r² = MS_within, s_L² = max((MS_between - MS_within) / n0, 0) dengan
+    n0 untuk desain tidak seimbang, dan s_I² = s_r² + s_L². Tanpa `runs`
+    hanya repeatability (semua replikat satu run). Semua reduksi memakai
+    `np.bincount` atas kode grup gabungan level x run.
+    """
+    level = np.asarray(level, dtype=float)
+    found = np.asarray(found, dtype=float)
+    if runs is None:
+        runs = np.zeros(len(level), dtype=np.intp)
+    level, found, runs = _clean(level, found, runs)
+    level_codes, levels = _codes(level)
+    run_codes, run_values = _codes(runs)
+    L, R = len(levels), len(run_values)
+
+    # Statistik per level
+    n_level, sum_level = _group_sums(level_codes, L, found)
+    mean_level = sum_level / n_level
+
+    # Statistik per sel (level, run); hanya sel yang berisi data
+    cells, cell = np.unique(level_codes * R + run_codes, return_inverse=True)
+    cell_level = cells // R
+    n_cell, sum_cell = _group_sums(cell, len(cells), found)
+    mean_cell = sum_cell / n_cell
+    ss_within = np.bincount(level_codes, weights=(found - mean_cell[cell]) ** 2, minlength=L)
+    ss_between = np.bincount(cell_level, minlength=L,
+                             weights=n_cell * (mean_cell - mean_level[cell_level]) ** 2)
+    n_runs = np.bincount(cell_level, minlength=L)
+    sum_sq_n = np.bincount(cell_level, weights=n_cell.astype(float) ** 2, minlength=L)
+
+    df_within = n_level - n_runs
+    df_between = n_runs - 1
+    with np.errstate(invalid='ignore', divide='ignore'):
+        ms_within = np.where(df_within > 0, ss_within / df_within, np.nan)
+        ms_between = np.where(df_between > 0, ss_between / df_between, np.nan)
+        n0 = np.where(df_between > 0, (n_level - sum_sq_n / n_level) / df_between, np.nan)
+        s_r = np.sqrt(ms_within)
+        s_between2 = np.where(df_between > 0,
+                              np.maximum((ms_between - ms_within) / n0, 0.0), 0.0)
+        s_I = np.sqrt(s_r ** 2 + s_between2)
+        rsd_r = s_r / np.abs(mean_level) * 100
+        rsd_I = s_I / np.abs(mean_level) * 100
+        F = ms_between / ms_within
+    return pd.DataFrame({
+        'Level': levels,
+        'n': n_level,
+        'Runs': n_runs,
+        'Mean Found': mean_level,
+        'Repeatability SD': s_r,
+        'Repeatability RSD%': rsd_r,
+        'Between-run SD': np.sqrt(s_between2),
+        'Intermediate Precision SD': s_I,
+        'Intermediate Precision RSD%': rsd_I,
+        'Between-run F': F,
+        'Between-run p-value': _f_pvalue(F, df_between, df_within),
+    })
+
+
+def accuracy_table(level, found, confidence=0.95):
+    """Bias dan recovery per level nominal, dengan CI recovery (t, n-1 derajat bebas)"""
+    level, found = _clean(np.asarray(level, dtype=float), np.asarray(found, dtype=float))
+    codes, levels = _codes(level)
+    k = len(levels)
+    n, total = _group_sums(codes, k, found)
+    mean = total / n
+    ss = np.bincount(codes, weights=(found - mean[codes]) ** 2, minlength=k)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        sd = np.where(n > 1, np.sqrt(ss / (n - 1)), np.nan)
+        t_val = np.where(n > 1, special.stdtrit(np.maximum(n - 1, 1), 0.5 + confidence / 2), np.nan)
+        half = t_val * sd / np.sqrt(n)
+        nominal = np.where(levels != 0, levels, np.nan)
+        bias = mean - levels
+        recovery = mean / nominal * 100
+    return pd.DataFrame({
+        'Level': levels,
+        'n': n,
+        'Mean Found': mean,
+        'SD': sd,
+        'Bias': bias,
+        'Bias%': bias / nominal * 100,
+        'Recovery%': recovery,
+        f'{confidence:.0%} CI Lower%': (mean - half) / nominal * 100,
+        f'{confidence:.0%} CI Upper%': (mean + half) / nominal * 100,
+    })
+
+
+def back_calculate(response, model):
+    """Konsentrasi ditemukan (found) dari respons dengan model linear"""
+    return (np.asarray(response, dtype=float) - model['intercept']) / model['slope']
+
+
+def validate_method(level, response, day=None, analyst=None, model=None, confidence=0.95,
+                    alpha=0.05):
+    """Validasi metode lengkap dari data long-format (satu baris per pengukuran).
+
+    `level` = konsentrasi nominal standar, `response` = sinyal; `day` dan
+    `analyst` (opsional) mendefinisikan run untuk presisi antara. Baris
+    dengan level, hari dan analis yang sama adalah replikat. Konsentrasi
+    found dihitung balik dengan `model` (default: fit linear semua data).
+    Mengembalikan dict: lack_of_fit (tabel ANOVA), mandel, precision,
+    accuracy dan model.
+    """
+    level = np.asarray(level, dtype=float)
+    response = np.asarray(response, dtype=float)
+    if model is None:
+        fit = fit_batch(*_clean(level, response))
+        model = {key: value.item() for key, value in fit.items()}
+    found = back_calculate(response, model)
+    runs = run_labels(day, analyst)
+    return {
+        'model': model,
+        'lack_of_fit': lack_of_fit_anova(level, response),
+        'mandel': mandel_test(level, response, alpha),
+        'precision': precision_table(level, found, runs),
+        'accuracy': accuracy_table(level, found, confidence),
+    }
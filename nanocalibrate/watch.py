@@ -0,0 +1,249 @@
+"""Mode watch: ikuti file sampel di folder instrumen dan prediksi hanya baris baru.
+
+Contoh:
+    python -m nanocalibrate watch /data/spectro --model plate1.ncal --out live.csv
+
+Setiap file yang cocok dengan pola dibaca mulai dari offset terakhir
+(hanya byte yang ditambahkan sejak poll sebelumnya, sampai baris lengkap
+terakhir). Respons baru diprediksi per blok dengan model saat ini, ditulis
+ke file output (append) dan dirangkum secara berjalan; yang disimpan di
+memori hanya offset per file, ringkasan dan sejumlah kecil baris terbaru,
+termasuk saat poll pertama membaca backlog file yang besar.
+"""
+import csv
+import fnmatch
+import io
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from .ingest import StreamSummary
+from .prediction import predict_concentrations, prediction_frame
+
+# Pola file sampel yang diikuti
+DEFAULT_PATTERNS = ('*.txt', '*.csv')
+# Batas byte yang dibaca per file per langkah (memori tetap walau file tumbuh cepat)
+READ_BLOCK_BYTES = 8 * 2**20
+# Jumlah baris terbaru yang disimpan untuk ditampilkan
+RECENT_ROWS = 1000
+# Satu-satunya folder (beserta isinya) yang boleh diikuti dan ditulis dari aplikasi web;
+# tanpa ini mode watch hanya tersedia lewat CLI
+DEFAULT_WATCH_ROOT = os.environ.get('NANOCALIBRATE_WATCH_ROOT') or None
+
+
+def resolve_under(root, path):
+    """Path `path` (relatif terhadap `root`) setelah realpath; ValueError jika berada di luar `root`"""
+    root = os.path.realpath(root)
+    resolved = os.path.realpath(os.path.join(root, path))
+    if os.path.commonpath([root, resolved]) != root:
+        raise ValueError(f"{path} is outside the watch folder {root}")
+    return resolved
+
+
+class _TailState:
+    """Posisi baca satu file: offset byte, indeks kolom respons, jumlah baris"""
+
+    __slots__ = ('offset', 'column', 'rows', 'inode', 'discard')
+
+    def __init__(self, inode):
+        self.offset = 0
+        self.column = None
+        self.rows = 0
+        self.inode = inode
+        # True jika sisa baris yang lebih panjang dari read_block masih harus dilewati
+        self.discard = False
+
+
+def _parse_header(line, column):
+    """Indeks kolom respons dan apakah baris pertama adalah header.
+
+    ValueError jika file punya header tetapi `column` tidak ada di dalamnya.
+    """
+    fields = [field.strip().strip('"') for field in line.decode('utf-8', 'replace').split(',')]
+    try:
+        float(fields[0])
+    except ValueError:
+        if column is None:
+            return 0, True
+        if column not in fields:
+            raise ValueError(f"Column {column!r} not found in header {fields}") from None
+        return fields.index(column), True
+    return 0, False
+
+
+def _parse_values(block, column):
+    """Respons dari blok baris CSV/teks lengkap; baris yang bukan angka atau rusak dilewati"""
+    table = pd.read_csv(io.BytesIO(block), header=None, usecols=[column], skip_blank_lines=True,
+                        on_bad_lines='skip', quoting=csv.QUOTE_NONE)
+    values = table[column]
+    if not pd.api.types.is_numeric_dtype(values):
+        values = values.astype(str).str.strip('"')
+    values = pd.to_numeric(values, errors='coerce').to_numpy(dtype=float)
+    return values[np.isfinite(values)]
+
+
+class FolderWatcher:
+    """Ikuti file baru dan file yang terus bertambah di satu folder.
+
+    `poll()` membaca hanya byte yang ditambahkan ke setiap file sejak poll
+    sebelumnya, memprediksi baris baru dengan `model` saat ini (bisa
+    diganti lewat `set_model`, baris lama tidak diproses ulang), menulis
+    hasilnya ke `output` (CSV, append) dan memperbarui ringkasan berjalan.
+    File yang mengecil atau diganti (inode berbeda) dibaca ulang dari awal.
+    """
+
+    def __init__(self, directory, model, patterns=DEFAULT_PATTERNS, column=None, output=None,
+                 confidence=0.95, recent_rows=RECENT_ROWS, read_block=READ_BLOCK_BYTES,
+                 skip_existing=False):
+        self.directory = directory
+        self.model = model
+        self.patterns = tuple(patterns)
+        self.column = column
+        self.output = output
+        self.confidence = confidence
+        self.recent_rows = recent_rows
+        self.read_block = read_block
+        self.summary = StreamSummary()
+        self.recent = None
+        self.files = {}
+        self.polls = 0
+        self.seconds = 0.0
+        self.last_poll_rows = 0
+        self._write_header = output is not None and not (
+            os.path.exists(output) and os.path.getsize(output) > 0)
+        if skip_existing:
+            # Mulai dari akhir file yang sudah ada; hanya baris yang ditambahkan nanti yang diproses
+            for path, entry in self._scan():
+                state = self.files[path] = _TailState(entry.stat().st_ino)
+                state.offset = entry.stat().st_size
+
+    def set_model(self, model):
+        self.model = model
+
+    def _scan(self):
+        output = os.path.abspath(self.output) if self.output else None
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if not entry.is_file() or entry.name.startswith('.'):
+                    continue
+                if not any(fnmatch.fnmatch(entry.name, pattern) for pattern in self.patterns):
+                    continue
+                if output is not None and os.path.abspath(entry.path) == output:
+                    continue
+                yield entry.path, entry
+
+    def _read_new(self, path, entry):
+        """Respons dari baris lengkap yang ditambahkan sejak poll terakhir.
+
+        Offset dan kolom baru disimpan setelah blok berhasil diparse, jadi
+        error tidak membuang byte; poll berikutnya membaca blok yang sama.
+        """
+        stat = entry.stat()
+        state = self.files.get(path)
+        if state is None or stat.st_ino != state.inode or stat.st_size < state.offset:
+            state = self.files[path] = _TailState(stat.st_ino)
+        if stat.st_size <= state.offset:
+            return None
+        with open(path, 'rb') as f:
+            f.seek(state.offset)
+            block = f.read(min(stat.st_size - state.offset, self.read_block))
+        # Baris terakhir yang belum lengkap ditunda sampai poll berikutnya
+        end = block.rfind(b'\n') + 1
+        if end == 0:
+            if len(block) < self.read_block:
+                return None
+            # Baris lebih panjang dari read_block bukan pembacaan instrumen; dilewati utuh
+            state.offset += len(block)
+            state.discard = True
+            return np.empty(0)
+        # Sisa baris terlalu panjang dari blok sebelumnya dilewati sampai newline pertama
+        data = block[block.find(b'\n') + 1 if state.discard else 0:end]
+        column = state.column
+        if column is None:
+            data = data.lstrip(b'\r\n')
+            if data:
+                first, _, rest = data.partition(b'\n')
+                try:
+                    column, is_header = _parse_header(first, self.column)
+                except ValueError as e:
+                    raise ValueError(f"{os.path.basename(path)}: {e}") from None
+                if is_header:
+                    data = rest
+        values = _parse_values(data, column) if data.strip() else np.empty(0)
+        state.offset += end
+        state.column = column
+        state.discard = False
+        state.rows += len(values)
+        return values
+
+    def _process(self, path, values):
+        """Prediksi satu blok: ringkasan, file output dan baris terbaru diperbarui langsung"""
+        prediction = predict_concentrations(values, self.model, confidence=self.confidence)
+        self.summary.update(prediction)
+        frame = prediction_frame(prediction, self.confidence)
+        frame.insert(0, 'File', os.path.basename(path))
+        if self.output is not None:
+            frame.to_csv(self.output, mode='a', header=self._write_header, index=False)
+            self._write_header = False
+        recent = frame if self.recent is None else pd.concat([self.recent, frame])
+        self.recent = recent.tail(self.recent_rows).reset_index(drop=True)
+        return frame
+
+    def poll(self):
+        """Proses semua data baru di folder; kembalikan baris baru terakhir (bisa kosong).
+
+        Setiap blok langsung ditulis ke output lalu dibuang, jadi memori
+        tidak bergantung pada ukuran backlog. DataFrame yang dikembalikan
+        berisi paling banyak `recent_rows` baris terbaru; jumlah semua
+        baris baru ada di `last_poll_rows`.
+        """
+        start = time.perf_counter()
+        frames = []
+        kept = count = 0
+        for path, entry in self._scan():
+            # File yang tumbuh lebih cepat dari read_block dibaca beberapa blok
+            while True:
+                values = self._read_new(path, entry)
+                if values is None:
+                    break
+                if len(values):
+                    frame = self._process(path, values)
+                    count += len(frame)
+                    frames.append(frame)
+                    kept += len(frame)
+                    # Hanya blok yang masih masuk `recent_rows` baris terakhir yang disimpan
+                    while kept - len(frames[0]) >= self.recent_rows:
+                        kept -= len(frames.pop(0))
+                if self.files[path].offset >= entry.stat().st_size:
+                    break
+        new_rows = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+        if len(new_rows) > self.recent_rows:
+            new_rows = new_rows.tail(self.recent_rows).reset_index(drop=True)
+        self.last_poll_rows = count
+        self.polls += 1
+        self.seconds += time.perf_counter() - start
+        return new_rows
+
+    def stats(self):
+        summary = self.summary.as_dict()
+        return {
+            'files': len(self.files),
+            'rows': summary['count'],
+            'polls': self.polls,
+            'seconds': self.seconds,
+            'rows_per_second': summary['count'] / self.seconds if self.seconds else 0.0,
+            'summary': summary,
+        }
+
+    def run(self, interval=1.0, stop=None, callback=None):
+        """Poll terus setiap `interval` detik sampai `stop` (threading.Event) di-set"""
+        while stop is None or not stop.is_set():
+            new_rows = self.poll()
+            if callback is not None and self.last_poll_rows:
+                callback(new_rows, self)
+            if stop is not None:
+                stop.wait(interval)
+            else:
+                time.sleep(interval)
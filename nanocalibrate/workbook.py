@@ -0,0 +1,181 @@
+import hashlib
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from .cache import LRUCache
+from .calibration import calibrate_frame
+
+# Workbook di bawah ukuran ini diparse berurutan (overhead proses lebih mahal)
+PARALLEL_MIN_BYTES = 512 * 1024
+
+# Sheet yang sudah diparse (per hash isi file dan nama sheet), dipakai bersama semua sesi
+workbook_cache = LRUCache(maxsize=64)
+
+
+def _source_bytes(source):
+    """Isi file sebagai bytes dari path, bytes atau objek file (mis. UploadedFile)"""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return bytes(source)
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as f:
+            return f.read()
+    if hasattr(source, 'getvalue'):
+        return source.getvalue()
+    if hasattr(source, 'seek'):
+        source.seek(0)
+    return source.read()
+
+
+def _is_xls(data):
+    # File .xls lama (OLE2) diawali signature ini; .xlsx berupa arsip zip
+    return data[:8] == b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'
+
+
+def workbook_hash(data):
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _calamine():
+    """Modul python-calamine (parser Rust, opsional) atau None"""
+    try:
+        import python_calamine
+    except ImportError:
+        return None
+    return python_calamine
+
+
+def _is_empty(value):
+    # Sel kosong: None dari openpyxl, '' dari calamine
+    return value is None or value == ''
+
+
+def _rows_frame(rows):
+    """DataFrame dari baris sel (baris pertama = header), tipe kolom ditebak sekali per kolom"""
+    rows = list(rows)
+    # Baris kosong di bawah data tidak ikut dibaca
+    while rows and all(_is_empty(value) for value in rows[-1]):
+        rows.pop()
+    if not rows:
+        return pd.DataFrame()
+    header, body = rows[0], rows[1:]
+    df = pd.DataFrame(body, columns=range(len(header)))
+    for col in df.columns:
+        if df[col].dtype.kind not in 'biufcmM':
+            df[col] = df[col].mask(df[col] == '')
+    # Kolom kosong di ujung kanan (header dan isi) juga tidak ikut dibaca
+    width = len(header)
+    while width and _is_empty(header[width - 1]) and df[width - 1].isna().all():
+        width -= 1
+    df = df.iloc[:, :width]
+    df.columns = [f"Unnamed: {i}" if _is_empty(name) else name
+                  for i, name in enumerate(header[:width])]
+    return df.infer_objects()
+
+
+def _parse_sheet(data, sheet):
+    """Parse satu sheet .xlsx: python-calamine jika ada, selain itu openpyxl read-only"""
+    calamine = _calamine()
+    if calamine is not None:
+        wb = calamine.CalamineWorkbook.from_filelike(io.BytesIO(data))
+        return _rows_frame(iter(wb.get_sheet_by_name(sheet).to_python(skip_empty_area=False)))
+    import openpyxl
+
+    # Mode read-only membaca XML sheet secara streaming, tanpa style dan objek sel
+    wb = openpyxl.load_workbook(io.BytesIO(data), read_only=True, data_only=True)
+    try:
+        return _rows_frame(iter(wb[sheet].iter_rows(values_only=True)))
+    finally:
+        wb.close()
+
+
+def _parse_task(task):
+    return _parse_sheet(*task)
+
+
+def sheet_names(source):
+    """Nama sheet dalam workbook, tanpa membaca isi sel"""
+    data = _source_bytes(source)
+    if _is_xls(data):
+        return pd.ExcelFile(io.BytesIO(data)).sheet_names
+    calamine = _calamine()
+    if calamine is not None:
+        return list(calamine.CalamineWorkbook.from_filelike(io.BytesIO(data)).sheet_names)
+    import openpyxl
+
+    wb = openpyxl.load_workbook(io.BytesIO(data), read_only=True)
+    try:
+        return list(wb.sheetnames)
+    finally:
+        wb.close()
+
+
+def _parse_workbook(data, sheets, workers):
+    if _is_xls(data):
+        # .xls (xlrd) jarang dan kecil; dibaca sekaligus oleh pandas
+        frames = pd.read_excel(io.BytesIO(data), sheet_name=list(sheets))
+        return [frames[sheet] for sheet in sheets]
+    workers = min(workers or os.cpu_count() or 1, len(sheets))
+    if workers > 1 and len(data) >= PARALLEL_MIN_BYTES:
+        # openpyxl murni Python (terikat GIL), jadi paralel lewat proses, satu sheet per task
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_parse_task, [(data, sheet) for sheet in sheets]))
+    return [_parse_sheet(data, sheet) for sheet in sheets]
+
+
+def read_workbook(source, sheets=None, workers=None):
+    """Baca sheet-sheet workbook Excel menjadi `{nama_sheet: DataFrame}`.
+
+    Semua sheet (atau hanya `sheets`) diparse dengan python-calamine jika
+    terpasang, selain itu openpyxl read-only; workbook besar dengan
+    beberapa sheet diparse paralel di beberapa proses. Setiap sheet
+    di-cache per hash isi file, sehingga membuka file yang sama lagi
+    (rerun, sesi lain, sheet lain dari workbook yang sama) hanya memparse
+    sheet yang belum pernah dibaca. DataFrame hasil cache dipakai
+    bersama, jadi jangan diubah in-place.
+    """
+    data = _source_bytes(source)
+    digest = workbook_hash(data)
+    if sheets is None:
+        # Daftar sheet ikut di-cache (kunci sheet None)
+        sheets = workbook_cache.get_or_compute((digest, None), lambda: sheet_names(data))
+    frames = {sheet: workbook_cache.get((digest, sheet)) for sheet in sheets}
+    missing = [sheet for sheet, df in frames.items() if df is None]
+    if missing:
+        for sheet, df in zip(missing, _parse_workbook(data, missing, workers)):
+            workbook_cache.put((digest, sheet), df)
+            frames[sheet] = df
+    return frames
+
+
+def calibrate_workbook(frames, x_col=None, y_col=None, confidence=0.95):
+    """Fit satu kurva per sheet dalam satu panggilan `fit_batch` (grup = sheet).
+
+    `x_col`/`y_col` default ke kolom pertama/kedua setiap sheet. Sheet
+    tanpa kolom tersebut dilewati. Hasilnya tabel seperti `calibrate_frame`
+    dengan kolom 'Sheet'.
+    """
+    parts = []
+    for sheet, df in frames.items():
+        if len(df.columns) < 2 and (x_col is None or y_col is None):
+            continue
+        xc = x_col if x_col is not None else df.columns[0]
+        yc = y_col if y_col is not None else df.columns[1]
+        if xc not in df or yc not in df:
+            continue
+        parts.append(pd.DataFrame({
+            'Sheet': sheet,
+            'Concentration': pd.to_numeric(df[xc], errors='coerce').to_numpy(dtype=float),
+            'Response': pd.to_numeric(df[yc], errors='coerce').to_numpy(dtype=float),
+        }))
+    if not parts:
+        return pd.DataFrame()
+    combined = pd.concat(parts, ignore_index=True)
+    table = calibrate_frame(combined, 'Concentration', ['Response'], group_col='Sheet',
+                            confidence=confidence)
+    # Urutkan kembali sesuai urutan sheet di workbook
+    order = {sheet: i for i, sheet in enumerate(frames)}
+    table = table.sort_values('Sheet', key=lambda s: s.map(order), ignore_index=True)
+    return table.drop(columns='Analyte')
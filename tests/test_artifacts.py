@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from nanocalibrate import (FIT_KEYS, ModelCache, calculate_calibration, dump_models, load_model,
+                           load_models, model_records, parse_models, save_model, save_models)
+
+
+@pytest.fixture
+def fit():
+    x = np.array([0.0, 1.0, 2.0, 5.0, 10.0])
+    return calculate_calibration(x, 0.01 + 0.3 * x + np.array([0.002, -0.001, 0.003, -0.002, 0.001]))
+
+
+def test_ncal_round_trip(tmp_path, fit):
+    path = tmp_path / 'plate1.ncal'
+    save_model(path, fit, model_id='plate1', data_hash='abc', confidence=0.99)
+    loaded = load_model(path)
+    for key in FIT_KEYS:
+        assert loaded[key] == fit[key], key
+    assert loaded['model_id'] == 'plate1'
+    assert loaded['data_hash'] == 'abc'
+    assert loaded['confidence'] == 0.99
+    assert loaded['equation'] == fit['equation']
+
+
+def test_many_models_per_file(tmp_path, fit):
+    records = model_records([fit, fit], model_ids=['a', 'b'])
+    save_models(tmp_path / 'all.ncal', records)
+    loaded = load_models(tmp_path / 'all.ncal')
+    assert [m.decode() for m in loaded['model_id']] == ['a', 'b']
+    np.testing.assert_array_equal(loaded['slope'], [fit['slope']] * 2)
+
+
+def test_parse_models_rejects_foreign_data(fit):
+    with pytest.raises(ValueError):
+        parse_models(b'not a model file at all, just text')
+    data = bytearray(dump_models(model_records(fit)))
+    data[8] = 99  # versi format yang tidak dikenal
+    with pytest.raises(ValueError, match="version"):
+        parse_models(bytes(data))
+
+
+def test_model_cache_ignores_records_for_other_data(tmp_path, fit):
+    x = np.array([0.0, 1.0, 2.0, 5.0, 10.0])
+    y = 2 * x + 1
+    cache = ModelCache(tmp_path / 'models')
+    key = 'ab' * 16
+    # Record yang ditanam dengan kunci benar tetapi dari data lain tidak dipakai
+    save_model(cache.path(key), fit, data_hash=key)
+    assert cache.calibrate(key, x, y)['slope'] == pytest.approx(2.0)
+    assert cache.misses == 1
+    assert cache.calibrate(key, x, y)['slope'] == pytest.approx(2.0)
+    assert cache.hits == 1
+    assert len(cache) == 1
+
+
+def test_model_cache_is_bounded(tmp_path):
+    cache = ModelCache(tmp_path / 'models', max_entries=5)
+    x = np.arange(4.0)
+    for i in range(12):
+        cache.calibrate(f'{i:032d}', x, x * (i + 1))
+    assert len(cache) <= 5
+
+
+def test_model_cache_disabled_without_root():
+    fit = ModelCache(None).calibrate('k', [0.0, 1.0, 2.0], [1.0, 3.0, 5.0])
+    assert fit['slope'] == pytest.approx(2.0)
@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from nanocalibrate import calculate_calibration, calibrate_frame, fit_batch
+
+
+@pytest.fixture
+def standards():
+    rng = np.random.default_rng(0)
+    x = np.repeat([0.5, 1.0, 2.0, 5.0, 10.0, 20.0], 3)
+    y = 0.02 + 0.31 * x + rng.normal(0, 0.05, len(x))
+    return x, y
+
+
+def test_calculate_calibration_matches_linregress(standards):
+    x, y = standards
+    fit = calculate_calibration(x, y)
+    ref = stats.linregress(x, y)
+    assert fit['n'] == len(x)
+    assert fit['slope'] == pytest.approx(ref.slope, rel=1e-12)
+    assert fit['intercept'] == pytest.approx(ref.intercept, rel=1e-10)
+    assert fit['r_value'] == pytest.approx(ref.rvalue, rel=1e-12)
+    assert fit['p_value'] == pytest.approx(ref.pvalue, rel=1e-6)
+    assert fit['se_slope'] == pytest.approx(ref.stderr, rel=1e-10)
+    assert fit['se_intercept'] == pytest.approx(ref.intercept_stderr, rel=1e-10)
+    np.testing.assert_allclose(fit['residuals'], y - (ref.intercept + ref.slope * x), atol=1e-12)
+
+
+def test_lod_loq_from_residual_sd(standards):
+    x, y = standards
+    fit = calculate_calibration(x, y)
+    s_res = np.sqrt(np.sum(fit['residuals'] ** 2) / (len(x) - 2))
+    assert fit['s_res'] == pytest.approx(s_res, rel=1e-10)
+    assert fit['LOD'] == pytest.approx(3.3 * s_res / fit['slope'], rel=1e-10)
+    assert fit['LOQ'] == pytest.approx(10 * s_res / fit['slope'], rel=1e-10)
+
+
+def test_fit_batch_columns_match_single_fits(standards):
+    x, y = standards
+    ys = np.column_stack([y, 2 * y + 1, y[::-1]])
+    batch = fit_batch(x, ys)
+    for j in range(ys.shape[1]):
+        ref = stats.linregress(x, ys[:, j])
+        assert batch['slope'][j] == pytest.approx(ref.slope, rel=1e-12)
+        assert batch['intercept'][j] == pytest.approx(ref.intercept, rel=1e-10)
+
+
+def test_degenerate_input_returns_none():
+    assert calculate_calibration([1.0], [2.0]) is None
+    assert calculate_calibration([2.0, 2.0, 2.0], [1.0, 2.0, 3.0]) is None
+
+
+def test_fit_batch_groups_match_linregress_per_group():
+    rng = np.random.default_rng(1)
+    x = np.tile([0.0, 1.0, 2.0, 5.0, 10.0], 4)
+    groups = np.repeat(['run1', 'run2', 'run3', 'run4'], 5)
+    slopes = np.repeat([0.3, 0.31, 0.29, 0.35], 5)
+    Y = np.column_stack([0.01 + slopes * x + rng.normal(0, 0.01, len(x)),
+                         0.5 * x + rng.normal(0, 0.02, len(x))])
+    Y[3, 1] = np.nan  # nilai kosong hanya diabaikan di kurva itu
+    fit = fit_batch(x, Y, groups=groups)
+    assert fit['slope'].shape == (4, 2)
+    assert fit['groups'].tolist() == ['run1', 'run2', 'run3', 'run4']
+    for g, label in enumerate(fit['groups']):
+        for j in range(2):
+            rows = (groups == label) & np.isfinite(Y[:, j])
+            ref = stats.linregress(x[rows], Y[rows, j])
+            assert fit['n'][g, j] == rows.sum()
+            assert fit['slope'][g, j] == pytest.approx(ref.slope, rel=1e-10)
+            assert fit['intercept'][g, j] == pytest.approx(ref.intercept, rel=1e-8, abs=1e-12)
+            assert fit['r_value'][g, j] == pytest.approx(ref.rvalue, rel=1e-10)
+
+
+def test_calibrate_frame_one_row_per_group_and_analyte():
+    df = pd.DataFrame({'Run': np.repeat(['a', 'b'], 4), 'Conc': np.tile([1.0, 2.0, 3.0, 4.0], 2)})
+    df['Cu'] = 2 * df['Conc'] + np.where(df['Run'] == 'a', 0.0, 1.0)
+    df['Zn'] = 3 * df['Conc']
+    table = calibrate_frame(df, 'Conc', group_col='Run')
+    assert table[['Run', 'Analyte']].values.tolist() == [['a', 'Cu'], ['a', 'Zn'],
+                                                         ['b', 'Cu'], ['b', 'Zn']]
+    assert table['slope'].tolist() == pytest.approx([2.0, 3.0, 2.0, 3.0])
+    assert table['intercept'].tolist() == pytest.approx([0.0, 0.0, 1.0, 0.0], abs=1e-12)
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from nanocalibrate import calculate_calibration, influence_diagnostics, influence_frame
+
+
+@pytest.fixture
+def standards():
+    rng = np.random.default_rng(8)
+    x = np.repeat([0.5, 1.0, 2.0, 5.0, 10.0, 20.0], 2)
+    y = 0.02 + 0.31 * x + rng.normal(0, 0.05, len(x))
+    y[7] += 0.4  # satu standar menyimpang
+    return x, y
+
+
+def brute_force(x, y):
+    """Fit ulang n kali tanpa titik ke-i, langsung dari definisinya"""
+    n = len(x)
+    X = np.column_stack((np.ones(n), x))
+    hat = X @ np.linalg.inv(X.T @ X) @ X.T
+    full = calculate_calibration(x, y)
+    fitted = full['intercept'] + full['slope'] * x
+    rows = []
+    for i in range(n):
+        mask = np.arange(n) != i
+        loo = calculate_calibration(x[mask], y[mask])
+        fitted_loo = loo['intercept'] + loo['slope'] * x
+        h = hat[i, i]
+        e = y[i] - fitted[i]
+        rows.append({
+            'leverage': h,
+            'studentized': e / (full['s_res'] * np.sqrt(1 - h)),
+            'studentized_deleted': e / (loo['s_res'] * np.sqrt(1 - h)),
+            'cooks_d': np.sum((fitted - fitted_loo) ** 2) / (2 * full['s_res'] ** 2),
+            'dffits': (fitted[i] - fitted_loo[i]) / (loo['s_res'] * np.sqrt(h)),
+            'loo_slope': loo['slope'],
+            'loo_intercept': loo['intercept'],
+            'loo_s_res': loo['s_res'],
+            'loo_LOD': loo['LOD'],
+            'loo_LOQ': loo['LOQ'],
+        })
+    return {key: np.array([row[key] for row in rows]) for key in rows[0]}
+
+
+def test_matches_brute_force_leave_one_out(standards):
+    x, y = standards
+    diag = influence_diagnostics(x, y)
+    expected = brute_force(x, y)
+    for key, values in expected.items():
+        np.testing.assert_allclose(diag[key], values, rtol=1e-8, atol=1e-12, err_msg=key)
+    assert diag['influential'][7]
+    assert diag['influential'].sum() == 1
+
+
+def test_multiple_curves_match_single_curve(standards):
+    x, y = standards
+    Y = np.column_stack((y, 2 * y + 1, y[::-1]))
+    diag = influence_diagnostics(x, Y)
+    for j in range(Y.shape[1]):
+        single = influence_diagnostics(x, Y[:, j])
+        for key in ('leverage', 'studentized_deleted', 'cooks_d', 'loo_LOD'):
+            np.testing.assert_allclose(diag[key][:, j], single[key], rtol=1e-10)
+
+
+def test_influence_frame_one_row_per_standard(standards):
+    x, y = standards
+    frame = influence_frame(x, y)
+    assert len(frame) == len(x)
+    assert frame['Influential'].dtype == bool
+    np.testing.assert_allclose(frame['Leverage'].sum(), 2.0)
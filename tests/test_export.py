@@ -0,0 +1,87 @@
+import gzip
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from nanocalibrate import (available_formats, cached_export, cached_text, export_bytes,
+                           export_cache, export_file_name, export_mime, frame_hash, lazy_export)
+from nanocalibrate.export import iter_csv_chunks
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(11)
+    return pd.DataFrame({
+        'Sample': [f'S{i}' for i in range(250)],
+        'Concentration': rng.uniform(0, 10, 250),
+        '< LOD': rng.random(250) < 0.2,
+    })
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    export_cache.clear()
+    yield
+    export_cache.clear()
+
+
+def test_chunked_csv_equals_to_csv(frame):
+    data = b''.join(iter_csv_chunks(frame, chunk_rows=64))
+    assert data == frame.to_csv(index=False).encode('utf-8')
+    assert export_bytes(frame, 'CSV', chunk_rows=7) == data
+    # Frame kosong tetap menghasilkan header
+    assert export_bytes(frame.iloc[:0]) == b'Sample,Concentration,< LOD\n'
+
+
+@pytest.mark.parametrize('fmt', available_formats())
+def test_round_trip(frame, fmt):
+    data = export_bytes(frame, fmt, chunk_rows=100)
+    if fmt == 'Parquet':
+        back = pd.read_parquet(io.BytesIO(data))
+    else:
+        if fmt == 'CSV (gzip)':
+            data = gzip.decompress(data)
+        back = pd.read_csv(io.BytesIO(data))
+    pd.testing.assert_frame_equal(back, frame, check_dtype=False, check_exact=False, rtol=1e-12)
+
+
+def test_gzip_output_is_deterministic(frame):
+    assert export_bytes(frame, 'CSV (gzip)') == export_bytes(frame, 'CSV (gzip)')
+
+
+def test_unknown_format_raises(frame):
+    with pytest.raises(ValueError):
+        export_bytes(frame, 'XLS')
+
+
+def test_frame_hash_tracks_content(frame):
+    assert frame_hash(frame) == frame_hash(frame.copy())
+    changed = frame.copy()
+    changed.loc[3, 'Concentration'] += 1e-9
+    assert frame_hash(changed) != frame_hash(frame)
+    assert frame_hash(frame.rename(columns={'Sample': 'ID'})) != frame_hash(frame)
+
+
+def test_cached_export_reuses_bytes(frame, monkeypatch):
+    calls = []
+    original = export_bytes
+
+    def counting(df, fmt='CSV', **kwargs):
+        calls.append(fmt)
+        return original(df, fmt, **kwargs)
+
+    monkeypatch.setattr('nanocalibrate.export.export_bytes', counting)
+    download = lazy_export(frame)
+    assert calls == []  # belum dibuat sebelum tombol diklik
+    first = download()
+    assert cached_export(frame.copy()) is first
+    assert calls == ['CSV']
+    assert cached_text('report') == b'report'
+
+
+def test_file_name_and_mime():
+    assert export_file_name('results', 'CSV (gzip)') == 'results.csv.gz'
+    assert export_mime('CSV') == 'text/csv'
+    assert export_mime('Parquet') == 'application/vnd.apache.parquet'
@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from nanocalibrate import find_linear_range, linear_range_frame
+
+
+@pytest.fixture
+def saturating():
+    rng = np.random.default_rng(9)
+    levels = np.array([0.0, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 50.0, 100.0])
+    x = np.repeat(levels, 3)
+    # Linear sampai ~20, lalu jenuh di ujung atas
+    y = 4.0 * 30 * np.tanh(x / 30) + 0.1 + rng.normal(0, 0.02, len(x))
+    return x, y
+
+
+def brute_force(x, y, min_r2, max_residual_pct, min_points):
+    """Nilai setiap jendela level kontigu dengan linregress biasa"""
+    levels = np.unique(x)
+    best = None
+    for i in range(len(levels)):
+        for j in range(i, len(levels)):
+            inside = (x >= levels[i]) & (x <= levels[j])
+            if inside.sum() < min_points or levels[i] == levels[j]:
+                continue
+            fit = stats.linregress(x[inside], y[inside])
+            r2 = fit.rvalue ** 2
+            if r2 < min_r2:
+                continue
+            nominal = x[inside]
+            back = (y[inside] - fit.intercept) / fit.slope
+            dev = np.abs(back - nominal)[nominal != 0] / np.abs(nominal[nominal != 0]) * 100
+            if max_residual_pct is not None and dev.max(initial=0) > max_residual_pct:
+                continue
+            score = (j - i + 1, levels[j] - levels[i], r2)
+            if best is None or score > best[0]:
+                best = (score, levels[i], levels[j], fit)
+    return best
+
+
+@pytest.mark.parametrize('min_r2, max_residual_pct', [
+    (0.99, None), (0.999, None), (0.995, 15.0), (0.99, 2.0), (0.99, 1.0),
+])
+def test_matches_brute_force_window_search(saturating, min_r2, max_residual_pct):
+    x, y = saturating
+    found = find_linear_range(x, y, min_r2=min_r2, max_residual_pct=max_residual_pct)
+    expected = brute_force(x, y, min_r2, max_residual_pct, min_points=5)
+    assert expected is not None
+    (levels, _, r2), x_low, x_high, fit = expected
+    assert (found['x_low'], found['x_high'], found['levels']) == (x_low, x_high, levels)
+    assert found['r_squared'] == pytest.approx(r2, rel=1e-9)
+    assert found['slope'] == pytest.approx(fit.slope, rel=1e-9)
+    assert found['intercept'] == pytest.approx(fit.intercept, rel=1e-7, abs=1e-9)
+    # Ujung jenuh tidak boleh masuk rentang linear
+    assert found['x_high'] < 100
+
+
+def test_unsorted_input_and_small_blocks(saturating, monkeypatch):
+    x, y = saturating
+    expected = find_linear_range(x, y)
+    order = np.random.default_rng(0).permutation(len(x))
+    monkeypatch.setattr('nanocalibrate.linear_range.BLOCK_SIZE', 2)
+    monkeypatch.setattr('nanocalibrate.linear_range.VERIFY_CELLS', 1)
+    found = find_linear_range(x[order], y[order])
+    assert found['x_low'] == expected['x_low'] and found['x_high'] == expected['x_high']
+    assert found['r_squared'] == pytest.approx(expected['r_squared'])
+
+
+def test_none_when_nothing_qualifies():
+    x = np.arange(10.0)
+    y = np.random.default_rng(2).normal(size=10)
+    assert find_linear_range(x, y, min_r2=0.99) is None
+    assert find_linear_range(x[:3], 2 * x[:3]) is None
+
+
+def test_linear_range_frame_keeps_missing_analytes(saturating):
+    x, y = saturating
+    df = pd.DataFrame({'Conc': x, 'Cu': y, 'Noise': np.random.default_rng(4).normal(size=len(x))})
+    frame = linear_range_frame(df, 'Conc', ['Cu', 'Noise'], min_r2=0.99)
+    assert frame['Analyte'].tolist() == ['Cu', 'Noise']
+    assert frame.loc[0, 'x_high'] < 100
+    assert pd.isna(frame.loc[1, 'x_high'])
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from nanocalibrate import CalibrationModel, calculate_calibration
+
+KEYS = ('n', 'slope', 'intercept', 'r_value', 's_res', 'se_slope', 'se_intercept', 'LOD', 'LOQ',
+        'x_min', 'x_max')
+
+
+@pytest.fixture
+def standards():
+    rng = np.random.default_rng(7)
+    x = np.repeat([0.5, 1.0, 2.0, 5.0, 10.0, 20.0], 4)
+    return x, 0.05 + 0.4 * x + rng.normal(0, 0.1, len(x))
+
+
+def assert_matches_refit(model, x, y):
+    fit, ref = model.results(), calculate_calibration(x, y)
+    for key in KEYS:
+        assert fit[key] == pytest.approx(ref[key], rel=1e-9, abs=1e-12), key
+
+
+def test_add_and_remove_match_full_refit(standards):
+    x, y = standards
+    model = CalibrationModel(x, y)
+    assert_matches_refit(model, x, y)
+    # Hapus titik ekstrem dan titik tengah, lalu tambahkan lagi
+    model.remove(len(x) - 1)
+    model.remove(3)
+    keep = np.ones(len(x), dtype=bool)
+    keep[[3, len(x) - 1]] = False
+    assert_matches_refit(model, x[keep], y[keep])
+    model.add(x[3], y[3], key=3)
+    keep[3] = True
+    assert_matches_refit(model, x[keep], y[keep])
+
+
+def test_replace_matches_refit(standards):
+    x, y = standards
+    model = CalibrationModel(x, y)
+    model.replace(5, x[5], y[5] + 1.0)
+    y2 = y.copy()
+    y2[5] += 1.0
+    assert_matches_refit(model, x, y2)
+
+
+def test_set_excluded_only_touches_changed_rows(standards, monkeypatch):
+    x, y = standards
+    y = y.copy()
+    y[2] = np.nan
+    model = CalibrationModel()
+    model.set_excluded([0], x, y)
+    assert sorted(model.points) == [i for i in range(len(x)) if i not in (0, 2)]
+    calls = []
+    monkeypatch.setattr(model, 'add', lambda *a, **k: calls.append(('add', k['key'])))
+    monkeypatch.setattr(model, 'remove', lambda key: calls.append(('remove', key)))
+    model.set_excluded([1, 2], x, y)
+    assert sorted(calls) == [('add', 0), ('remove', 1)]
+
+
+def test_set_excluded_matches_refit(standards):
+    x, y = standards
+    model = CalibrationModel()
+    for excluded in ([0], [0, 7], [7], [7, 23], []):
+        model.set_excluded(excluded, x, y)
+        keep = np.ones(len(x), dtype=bool)
+        keep[excluded] = False
+        assert_matches_refit(model, x[keep], y[keep])
+    x_active, _ = model.arrays()
+    np.testing.assert_array_equal(x_active, x)
+
+
+def test_non_finite_standard_is_rejected():
+    with pytest.raises(ValueError):
+        CalibrationModel().add(np.nan, 1.0)
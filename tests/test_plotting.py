@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from nanocalibrate import calculate_calibration
+from nanocalibrate.plotting import calibration_figure, decimate, lttb_indices, minmax_indices
+
+
+@pytest.fixture
+def signal():
+    rng = np.random.default_rng(5)
+    x = np.sort(rng.uniform(0, 100, 20000))
+    y = np.sin(x / 7) + rng.normal(0, 0.05, len(x))
+    y[12345] = 8.0  # puncak tunggal harus tetap terlihat
+    return x, y
+
+
+def test_lttb_keeps_ends_and_peak(signal):
+    x, y = signal
+    idx = lttb_indices(x, y, 500)
+    assert idx[0] == 0 and idx[-1] == len(x) - 1
+    assert np.all(np.diff(idx) > 0)
+    assert 3 <= len(idx) <= 500
+    assert 12345 in idx
+    # Input kecil dikembalikan utuh
+    assert lttb_indices(x[:10], y[:10], 50).tolist() == list(range(10))
+
+
+def test_minmax_keeps_extremes_of_every_bin(signal):
+    _, y = signal
+    n_bins = 100
+    idx = minmax_indices(y, n_bins)
+    assert np.all(np.diff(idx) > 0)
+    edges = np.linspace(0, len(y), n_bins + 1).astype(int)
+    for lo, hi in zip(edges[:-1], edges[1:]):
+        chunk = idx[(idx >= lo) & (idx < hi)]
+        assert y[chunk].min() == y[lo:hi].min()
+        assert y[chunk].max() == y[lo:hi].max()
+
+
+@pytest.mark.parametrize('method', ['lttb', 'minmax'])
+def test_decimate_respects_budget_and_keep(signal, method):
+    x, y = signal
+    rng = np.random.default_rng(0)
+    order = rng.permutation(len(x))
+    x, y = x[order], y[order]
+    keep = np.zeros(len(x), dtype=bool)
+    keep[[3, 77, 5000]] = True
+    idx = decimate(x, y, max_points=400, keep=keep, method=method)
+    assert len(idx) <= 400 + keep.sum()
+    assert set(np.flatnonzero(keep)) <= set(idx)
+    assert np.all(np.diff(x[idx]) >= 0)
+    # Di bawah kuota semua titik dikembalikan, terurut menurut x
+    small = decimate(x[:50], y[:50], max_points=400)
+    assert sorted(small.tolist()) == list(range(50))
+    assert np.all(np.diff(x[small]) >= 0)
+
+
+def test_calibration_figure_switches_to_webgl():
+    rng = np.random.default_rng(1)
+    x = rng.uniform(0, 10, 3000)
+    y = 0.3 * x + rng.normal(0, 0.02, len(x))
+    y[10] += 5  # outlier > 3 s_res
+    results = calculate_calibration(x, y)
+    small = calibration_figure(x[:100], y[:100], calculate_calibration(x[:100], y[:100]))
+    assert {trace.type for trace in small.data} == {'scatter'}
+    big = calibration_figure(x, y, results, max_points=500)
+    points = [trace for trace in big.data if trace.type == 'scattergl']
+    assert len(points) == 2
+    assert len(points[0].x) <= 501
+    assert y[10] in points[0].y
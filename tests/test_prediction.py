@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+from nanocalibrate import calculate_calibration, predict_concentrations, prediction_frame
+
+
+@pytest.fixture
+def model():
+    rng = np.random.default_rng(3)
+    x = np.repeat([0.5, 1.0, 2.0, 5.0, 10.0], 3)
+    y = 0.05 + 0.4 * x + rng.normal(0, 0.03, len(x))
+    return calculate_calibration(x, y)
+
+
+@pytest.mark.parametrize('replicates', [1, 3])
+def test_se_and_ci_match_textbook_formula(model, replicates):
+    responses = np.array([0.1, 0.8, 2.0, 4.5])
+    pred = predict_concentrations(responses, model, confidence=0.9,
+                                  replicates=replicates, clip_negative=False)
+    b, n = model['slope'], model['n']
+    x0 = (responses - model['intercept']) / b
+    se = model['s_res'] / abs(b) * np.sqrt(
+        1 / replicates + 1 / n + (responses - model['y_mean']) ** 2 / (b ** 2 * model['Sxx']))
+    half = stats.t.ppf(0.95, n - 2) * se
+    np.testing.assert_allclose(pred['concentration'], x0, rtol=1e-12)
+    np.testing.assert_allclose(pred['se_pred'], se, rtol=1e-12)
+    np.testing.assert_allclose(pred['ci_lower'], x0 - half, rtol=1e-10)
+    np.testing.assert_allclose(pred['ci_upper'], x0 + half, rtol=1e-10)
+
+
+def test_flags_and_clipping_use_raw_concentration(model):
+    lod_response = model['intercept'] + model['slope'] * model['LOD']
+    loq_response = model['intercept'] + model['slope'] * model['LOQ']
+    top_response = model['intercept'] + model['slope'] * model['x_max']
+    responses = [model['intercept'] - 0.5, (lod_response + loq_response) / 2, top_response + 1]
+    pred = predict_concentrations(responses, model)
+    assert pred['concentration'][0] == 0
+    assert pred['below_lod'].tolist() == [True, False, False]
+    assert pred['below_loq'].tolist() == [True, True, False]
+    assert pred['above_range'].tolist() == [False, False, True]
+    # Tanpa clipping, konsentrasi negatif tetap dilaporkan apa adanya
+    raw = predict_concentrations(responses, model, clip_negative=False)
+    assert raw['concentration'][0] < 0
+
+
+def test_float32_close_to_float64(model):
+    responses = np.linspace(0.1, 4.0, 1000)
+    full = predict_concentrations(responses, model)
+    half = predict_concentrations(responses, model, dtype=np.float32)
+    assert half['concentration'].dtype == np.float32
+    assert half['se_pred'].dtype == np.float32
+    np.testing.assert_allclose(half['concentration'], full['concentration'], rtol=1e-5, atol=1e-6)
+    np.testing.assert_allclose(half['ci_upper'], full['ci_upper'], rtol=1e-5, atol=1e-6)
+
+
+def test_prediction_frame_labels(model):
+    pred = predict_concentrations([1.0, 2.0], model)
+    frame = prediction_frame(pred, confidence=0.95)
+    assert list(frame.columns) == ['Response', 'Calculated Concentration', 'SE Prediction',
+                                   '95% CI Lower', '95% CI Upper', '< LOD', '< LOQ', '> Range']
+    # Model tanpa SE (misalnya slope nol) tidak menampilkan kolom SE/CI
+    flat = dict(model, slope=0.0)
+    frame = prediction_frame(predict_concentrations([1.0], flat))
+    assert 'SE Prediction' not in frame and 'CI Lower' not in frame
+    assert frame['Calculated Concentration'].tolist() == [0.0]
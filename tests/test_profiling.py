@@ -0,0 +1,86 @@
+import tracemalloc
+
+from nanocalibrate import RunProfiler, read_log, span_totals
+from nanocalibrate.cache import LRUCache
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = RunProfiler()
+    assert profiler.span('fit') is profiler.span('plot')
+    with profiler.span('fit'):
+        profiler.count('rows', 10)
+    assert profiler.spans == [] and profiler.counters == {}
+    assert profiler.finish() is None
+
+
+def test_spans_counters_and_cache_deltas(tmp_path):
+    cache = LRUCache(maxsize=4)
+    cache.put('a', 1)
+    cache.get('a')
+    log = tmp_path / 'profile.jsonl'
+    profiler = RunProfiler(True, label='Page', caches={'fits': cache}, log_path=str(log))
+    with profiler.span('calibrate'):
+        with profiler.span('fit'):
+            cache.get('a')
+            cache.get('b')
+        profiler.count('rows', 5)
+        profiler.count('rows', 2)
+    record = profiler.finish()
+    assert [(s['name'], s['depth']) for s in record['spans']] == [('calibrate', 0), ('fit', 1)]
+    assert record['spans'][0]['seconds'] >= record['spans'][1]['seconds'] >= 0
+    assert record['counters'] == {'rows': 7}
+    assert record['caches']['fits'] == {'hits': 1, 'misses': 1, 'size': 1}
+    assert record['peak_memory_bytes'] is None
+    assert profiler.finish() is None  # hanya satu record per run
+
+    assert read_log(str(log)) == [record]
+    assert read_log(str(tmp_path / 'missing.jsonl')) == []
+
+
+def test_read_log_last_and_span_totals(tmp_path):
+    log = tmp_path / 'profile.jsonl'
+    for i in range(3):
+        profiler = RunProfiler(True, label=f'run{i}', log_path=str(log))
+        with profiler.span('fit'):
+            pass
+        profiler.finish()
+    records = read_log(str(log), last=2)
+    assert [r['label'] for r in records] == ['run1', 'run2']
+    records[0]['spans'][0]['seconds'] = 1.0
+    records[1]['spans'][0]['seconds'] = 3.0
+    assert span_totals(records) == {'fit': {'count': 2, 'total': 4.0, 'max': 3.0, 'mean': 2.0}}
+
+
+def test_fragment_rerun_gets_its_own_profiler():
+    parent = RunProfiler(True, label='Page', trace_memory=True)
+    with parent.fragment('table') as inner:
+        assert inner is parent
+    parent.finish()
+    assert [s['name'] for s in parent.record['spans']] == ['table']
+    assert parent.record['peak_memory_bytes'] is not None
+
+    # Fragment rerun setelah run utama selesai
+    with parent.fragment('table') as inner:
+        assert inner is not parent
+        inner.count('rows')
+    assert inner.record['label'] == 'Page/table'
+    assert inner.record['counters'] == {'rows': 1}
+    assert inner.record['peak_memory_bytes'] is not None
+    assert not tracemalloc.is_tracing()
+
+    # Profiler yang tidak pernah aktif tidak membuat record
+    off = RunProfiler()
+    with off.fragment('table') as inner:
+        assert inner is off
+    assert off.record is None
+
+
+def test_memory_tracing_is_opt_in():
+    profiler = RunProfiler(True)
+    assert not tracemalloc.is_tracing()
+    assert profiler.finish()['peak_memory_bytes'] is None
+    aborted = RunProfiler(True, trace_memory=True)
+    assert tracemalloc.is_tracing()
+    aborted.abort()
+    assert not tracemalloc.is_tracing()
+    assert aborted.finish() is None
@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from nanocalibrate import SampleQueue, group_replicates, read_samples, replicate_summary
+
+
+def test_replicate_summary_statistics():
+    summary = replicate_summary([1.0, 2.0, 3.0, 10.0], ['a', 'a', 'a', 'b'])
+    a, b = summary.iloc[0], summary.iloc[1]
+    assert a['Replicates'] == 3 and a['Mean Concentration'] == 2.0
+    assert a['SD'] == pytest.approx(1.0)
+    assert a['CV%'] == pytest.approx(50.0)
+    assert b['Replicates'] == 1 and np.isnan(b['SD']) and np.isnan(b['95% CI Lower'])
+
+
+def test_replicate_summary_groups_missing_ids():
+    groups = np.array(['b', None, 'a', np.nan, 'b'], dtype=object)
+    summary = replicate_summary([1.0, 2.0, 3.0, 4.0, 5.0], groups)
+    assert summary['Replicates'].tolist() == [1, 2, 2]
+    assert summary['Sample'].tolist()[:2] == ['a', 'b']
+    assert pd.isna(summary['Sample'].iloc[2])
+    assert summary['Mean Concentration'].tolist() == [3.0, 3.0, 3.0]
+
+
+def test_blank_ids_in_file(tmp_path):
+    path = tmp_path / 'samples.csv'
+    path.write_text("id,response\nS1,1.0\n,2.0\nS1,1.2\n,2.1\n")
+    responses, ids = read_samples(str(path), column='response', id_column='id')
+    summary = replicate_summary(responses, ids)
+    assert summary['Replicates'].sum() == 4
+
+
+def test_group_replicates_fills_only_missing_ids():
+    responses = np.array([1.0, 1.01, 5.0, 5.02, 9.0])
+    ids = np.array(['A', 'A', None, None, ''], dtype=object)
+    groups = group_replicates(responses, ids, tolerance=0.05)
+    assert groups.tolist() == ['A', 'A', 'Group 1', 'Group 1', 'Group 2']
+
+
+def test_sample_queue_keeps_ids_when_some_are_missing():
+    queue = SampleQueue(capacity=2)
+    assert queue.ids is None
+    queue.append([5.0, 5.1])
+    assert queue.ids is None
+    queue.append([1.0], ids=['A'])
+    assert queue.ids.tolist() == [None, None, 'A']
+    assert queue.missing_ids == 2
+    queue.clear()
+    assert queue.ids is None and queue.missing_ids == 0
+
+
+def test_generated_labels_do_not_merge_with_real_ids():
+    responses = np.array([1.0, 5.0, 5.01, 9.0])
+    ids = np.array(['Group 1', None, None, 'Group 1*'], dtype=object)
+    groups = group_replicates(responses, ids, tolerance=0.05)
+    assert groups.tolist() == ['Group 1', 'Group 1**', 'Group 1**', 'Group 1*']
+    summary = replicate_summary(responses, groups)
+    assert summary['Replicates'].tolist() == [1, 1, 2]
@@ -0,0 +1,85 @@
+import threading
+from concurrent.futures import Future
+
+import numpy as np
+import pytest
+
+from nanocalibrate import LRUCache, ReportPool, calculate_calibration, render_report
+from nanocalibrate.report import _render_task, report_cache, report_key
+
+
+@pytest.fixture
+def standards():
+    x = np.array([0.0, 1.0, 2.0, 5.0, 10.0])
+    y = 0.01 + 0.3 * x + np.array([0.002, -0.001, 0.003, -0.002, 0.001])
+    return x, y, calculate_calibration(x, y)
+
+
+class ImmediateExecutor:
+    """Executor palsu: task dijalankan saat submit, Future sudah selesai saat dikembalikan"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def submit(self, func, *args):
+        self.calls += 1
+        future = Future()
+        future.set_result(func(*args))
+        return future
+
+
+def test_html_report_is_self_contained(standards):
+    x, y, fit = standards
+    html = render_report(x, y, fit).decode('utf-8')
+    assert '<svg' in html and fit['equation'] in html
+    assert '<script' not in html
+
+
+def test_submit_with_finished_task_does_not_deadlock(standards):
+    pool = ReportPool(workers=1, cache=LRUCache())
+    executor = pool._executor = ImmediateExecutor()
+    result = {}
+    worker = threading.Thread(target=lambda: result.setdefault('future', pool.submit(*standards)),
+                              daemon=True)
+    worker.start()
+    worker.join(timeout=10)
+    assert not worker.is_alive()
+    assert result['future'].result().startswith(b'<!DOCTYPE html>')
+    assert pool.pending() == 0
+    # Report sudah di cache: submit berikutnya tidak merender lagi
+    assert pool.submit(*standards).result() == result['future'].result()
+    assert executor.calls == 1
+
+
+def test_same_report_is_rendered_once(standards):
+    pool = ReportPool(workers=1, cache=LRUCache())
+    gate = Future()
+
+    class BlockedExecutor(ImmediateExecutor):
+        def submit(self, func, *args):
+            self.calls += 1
+            future = Future()
+            gate.add_done_callback(lambda _: future.set_result(func(*args)))
+            return future
+
+    executor = pool._executor = BlockedExecutor()
+    first = pool.submit(*standards)
+    second = pool.submit(*standards)
+    assert first is second and pool.pending() == 1
+    gate.set_result(None)
+    assert first.result() == render_report(*standards)
+    assert pool.cache.get(report_key(*standards)) == first.result()
+    assert pool.pending() == 0 and executor.calls == 1
+
+
+def test_process_pool_renders_report(standards):
+    pool = ReportPool(workers=1, cache=LRUCache())
+    try:
+        assert pool.map([standards]) == [_render_task((*standards, None, None, 'HTML',
+                                                       "Calibration Report"))]
+    finally:
+        pool.shutdown()
+
+
+def test_report_cache_is_bounded_by_bytes():
+    assert report_cache.maxbytes is not None
@@ -0,0 +1,72 @@
+import json
+
+import pytest
+
+from nanocalibrate.service import PredictionService
+
+
+@pytest.fixture
+def service():
+    service = PredictionService()
+    body = json.dumps({'model_id': 'm', 'x': [0, 1, 2, 5], 'y': [0.01, 0.31, 0.6, 1.5]})
+    status, _, _ = service.handle('POST', '/models', {}, {'content-type': 'application/json'},
+                                  body.encode())
+    assert status == 201
+    return service
+
+
+def predict(service, content_type='application/json', **payload):
+    body = json.dumps({'responses': [0.3, 0.9], **payload}).encode()
+    status, _, data = service.handle('POST', '/models/m/predict', {},
+                                     {'content-type': content_type}, body)
+    return status, json.loads(data)
+
+
+def test_predict(service):
+    status, data = predict(service)
+    assert status == 200
+    assert data['n'] == 2 and len(data['concentration']) == 2
+
+
+def test_json_body_without_json_content_type(service):
+    # curl -d tanpa header mengirim application/x-www-form-urlencoded
+    status, data = predict(service, content_type='application/x-www-form-urlencoded')
+    assert status == 200 and data['n'] == 2
+    status, _, body = service.handle('POST', '/models/m/predict', {}, {'content-type': ''},
+                                     b'[0.3, 0.9]')
+    assert status == 200 and json.loads(body)['n'] == 2
+
+
+def test_text_body(service):
+    status, _, body = service.handle('POST', '/models/m/predict', {},
+                                     {'content-type': 'text/plain'}, b'0.3\n0.9\nnan\n')
+    assert status == 200 and json.loads(body)['n'] == 2
+
+
+def test_json_drops_non_finite_responses(service):
+    body = b'{"responses": [0.3, NaN, Infinity, null, 0.9]}'
+    status, _, data = service.handle('POST', '/models/m/predict', {},
+                                     {'content-type': 'application/json'}, body)
+    assert status == 200 and json.loads(data)['n'] == 2
+
+
+def test_whole_replicates_are_accepted(service):
+    assert predict(service, replicates=3)[0] == 200
+    assert predict(service, replicates=3.0)[0] == 200
+    assert predict(service, replicates="2")[0] == 200
+
+
+@pytest.mark.parametrize('payload', [
+    {'replicates': 0}, {'replicates': 0.5}, {'replicates': 1.9}, {'replicates': 'abc'},
+    {'replicates': None}, {'replicates': True}, {'confidence': 0}, {'confidence': 1.5},
+    {'confidence': 'high'}, {'confidence': None},
+])
+def test_invalid_options_are_rejected(service, payload):
+    status, data = predict(service, **payload)
+    assert status == 400
+    assert 'must be' in data['error']
+
+
+def test_unknown_model(service):
+    status, _, _ = service.handle('POST', '/models/nope/predict', {}, {}, b'{"responses": [1]}')
+    assert status == 404
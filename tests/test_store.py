@@ -0,0 +1,53 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from nanocalibrate import frame_hash
+from nanocalibrate.store import DatasetStore
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({'Concentration': [0.0, 1.0, 2.0], 'Response': [0.01, 0.3, 0.61],
+                         'Sample': ['a', None, 'c']})
+
+
+def test_round_trip_without_pickle(tmp_path, df):
+    store = DatasetStore(str(tmp_path))
+    handle = store.put(df)
+    frame = handle.frame()
+    pd.testing.assert_frame_equal(frame[['Concentration', 'Response']],
+                                  df[['Concentration', 'Response']])
+    assert frame['Sample'].iloc[[0, 2]].tolist() == ['a', 'c']
+    assert pd.isna(frame['Sample'].iloc[1])
+    for name in os.listdir(os.path.join(store.root, handle.key)):
+        if name.endswith('.npy'):
+            # Setiap file bisa dibaca tanpa allow_pickle
+            np.load(os.path.join(store.root, handle.key, name), allow_pickle=False)
+
+
+def test_store_folder_is_private(tmp_path, df):
+    store = DatasetStore(str(tmp_path))
+    store.put(df)
+    assert os.stat(store.root).st_mode & 0o777 == 0o700
+
+
+def test_planted_entry_is_rewritten(tmp_path, df):
+    store = DatasetStore(str(tmp_path))
+    planted = os.path.join(store.root, frame_hash(df))
+    os.makedirs(planted)
+    with open(os.path.join(planted, 'meta.json'), 'w') as f:
+        f.write('{"columns": [], "index": null, "rows": 0}')
+    frame = store.put(df).frame()
+    assert len(frame) == 3
+    assert list(frame.columns) == list(df.columns)
+
+
+def test_shared_parent_writable_by_others_is_refused(tmp_path, df):
+    parent = tmp_path / 'shared'
+    parent.mkdir()
+    os.chmod(parent, 0o777)
+    with pytest.raises(PermissionError):
+        DatasetStore(str(parent)).put(df)
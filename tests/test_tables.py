@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from nanocalibrate import format_page, page_count, table_page, table_view
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({
+        'value': [3.0, np.nan, 1.0, 3.0, 2.0, np.nan, 1.0],
+        'name': ['c', None, 'a', 'c', 'b', 'd', 'a'],
+        'n': [3, 1, 1, 3, 2, 5, 1],
+    })
+
+
+@pytest.mark.parametrize('column', ['value', 'name', 'n'])
+@pytest.mark.parametrize('ascending', [True, False])
+def test_sort_matches_pandas_stable_sort(df, column, ascending):
+    expected = df.reset_index(drop=True).sort_values(column, ascending=ascending, kind='stable',
+                                                      na_position='last').index.to_numpy()
+    np.testing.assert_array_equal(table_view(df, sort_by=column, ascending=ascending), expected)
+
+
+def test_descending_keeps_ties_in_original_order_and_nan_last(df):
+    rows = table_view(df, sort_by='value', ascending=False)
+    assert rows.tolist() == [0, 3, 4, 2, 6, 1, 5]
+
+
+def test_filter_then_sort(df):
+    rows = table_view(df, sort_by='value', ascending=False, filter_col='value', lo=1.5, hi=3.0)
+    assert rows.tolist() == [0, 3, 4]
+
+
+def test_table_page_formats_only_visible_rows(df):
+    page, total = table_page(df, page=2, page_size=3, decimals=2, sort_by='value')
+    assert total == len(df)
+    assert page['value'].tolist() == ['3.00', '3.00', '']
+    assert page.index.tolist() == [0, 3, 1]
+    assert page_count(total, 3) == 3 and page_count(0) == 1
+
+
+def test_format_page_blanks_nan():
+    page = format_page(pd.DataFrame({'x': [1.23456, np.nan], 'id': ['a', 'b']}), decimals=3)
+    assert page['x'].tolist() == ['1.235', '']
+    assert page['id'].tolist() == ['a', 'b']
@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from nanocalibrate import bootstrap_calibration, bootstrap_predictions
+
+
+@pytest.fixture
+def standards():
+    x = np.repeat([1.0, 2.0, 5.0, 10.0], 3)
+    return x, 0.3 * x + np.tile([0.01, -0.01, 0.005], 4)
+
+
+def test_bootstrap_is_reproducible_and_covers_fit(standards):
+    x, y = standards
+    first = bootstrap_calibration(x, y, n_resamples=500, seed=1)
+    second = bootstrap_calibration(x, y, n_resamples=500, seed=1)
+    np.testing.assert_array_equal(first['draws']['slope'], second['draws']['slope'])
+    low, high = first['intervals']['slope']
+    assert low < first['estimate']['slope'] < high
+
+
+def test_bootstrap_rejects_zero_resamples(standards):
+    with pytest.raises(ValueError, match="n_resamples"):
+        bootstrap_calibration(*standards, n_resamples=0)
+
+
+def test_predictions_without_valid_draws_are_nan(standards):
+    x, y = standards
+    draws = bootstrap_calibration(x, y, n_resamples=10, seed=0)
+    # Semua draw gagal (slope NaN)
+    draws['draws']['slope'][:] = np.nan
+    intervals = bootstrap_predictions([1.0, 2.0], draws)
+    assert all(np.isnan(np.asarray(v, dtype=float)).all() for v in intervals.values())
@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+from nanocalibrate import (accuracy_table, lack_of_fit_anova, mandel_test, precision_table,
+                           validate_method)
+
+
+@pytest.fixture
+def study():
+    """5 level x 3 hari x 4 replikat, efek hari acak"""
+    rng = np.random.default_rng(3)
+    level = np.repeat([1.0, 2.0, 5.0, 10.0, 20.0], 12)
+    day = np.tile(np.repeat([1, 2, 3], 4), 5)
+    found = level * (1 + rng.normal(0, 0.02, 3)[day - 1]) + rng.normal(0, 0.05, len(level))
+    return level, day, found
+
+
+def test_lack_of_fit_matches_brute_force(study):
+    x, _, y = study
+    y = y + 0.002 * x ** 2
+    table = lack_of_fit_anova(x, y).set_index('Source')
+    ref = stats.linregress(x, y)
+    ss_res = np.sum((y - ref.intercept - ref.slope * x) ** 2)
+    ss_pe = sum(np.sum((y[x == v] - y[x == v].mean()) ** 2) for v in np.unique(x))
+    k, n = len(np.unique(x)), len(x)
+    assert table.loc['Residual', 'SS'] == pytest.approx(ss_res, rel=1e-9)
+    assert table.loc['Pure error', 'SS'] == pytest.approx(ss_pe, rel=1e-9)
+    F = ((ss_res - ss_pe) / (k - 2)) / (ss_pe / (n - k))
+    assert table.loc['Lack of fit', 'F'] == pytest.approx(F, rel=1e-9)
+    assert table.loc['Lack of fit', 'p-value'] == pytest.approx(stats.f.sf(F, k - 2, n - k), rel=1e-6)
+
+
+def test_mandel_matches_polyfit(study):
+    x, _, y = study
+    y = y + 0.01 * x ** 2
+    result = mandel_test(x, y)
+    n = len(x)
+    ss_lin = np.sum((y - np.polyval(np.polyfit(x, y, 1), x)) ** 2)
+    ss_quad = np.sum((y - np.polyval(np.polyfit(x, y, 2), x)) ** 2)
+    F = (ss_lin - ss_quad) / (ss_quad / (n - 3))
+    assert result['F'] == pytest.approx(F, rel=1e-6)
+    assert result['F_critical'] == pytest.approx(stats.f.ppf(0.95, 1, n - 3), rel=1e-9)
+    assert result['linear'] is False
+    assert mandel_test([1.0, 2.0, 1.0, 2.0], [1.0, 2.0, 1.1, 2.1]) is None
+
+
+def test_precision_matches_one_way_anova(study):
+    level, day, found = study
+    table = precision_table(level, found, day).set_index('Level')
+    for value in np.unique(level):
+        groups = [found[(level == value) & (day == d)] for d in (1, 2, 3)]
+        n0 = len(groups[0])
+        grand = np.concatenate(groups).mean()
+        ms_within = sum(np.sum((g - g.mean()) ** 2) for g in groups) / (3 * n0 - 3)
+        ms_between = sum(n0 * (g.mean() - grand) ** 2 for g in groups) / 2
+        s_between2 = max((ms_between - ms_within) / n0, 0.0)
+        row = table.loc[value]
+        assert row['Repeatability SD'] == pytest.approx(np.sqrt(ms_within), rel=1e-9)
+        assert row['Intermediate Precision SD'] == pytest.approx(
+            np.sqrt(ms_within + s_between2), rel=1e-9)
+        assert row['Between-run F'] == pytest.approx(stats.f_oneway(*groups).statistic, rel=1e-9)
+
+
+def test_precision_without_runs_is_repeatability_only(study):
+    level, _, found = study
+    table = precision_table(level, found)
+    assert (table['Runs'] == 1).all()
+    np.testing.assert_allclose(table['Intermediate Precision SD'], table['Repeatability SD'])
+
+
+def test_accuracy_recovery_and_interval(study):
+    level, _, found = study
+    table = accuracy_table(level, found, confidence=0.9).set_index('Level')
+    for value in np.unique(level):
+        values = found[level == value]
+        mean, sem = values.mean(), stats.sem(values)
+        low, high = stats.t.interval(0.9, len(values) - 1, loc=mean, scale=sem)
+        row = table.loc[value]
+        assert row['Recovery%'] == pytest.approx(mean / value * 100, rel=1e-12)
+        assert row['90% CI Lower%'] == pytest.approx(low / value * 100, rel=1e-9)
+        assert row['90% CI Upper%'] == pytest.approx(high / value * 100, rel=1e-9)
+
+
+def test_validate_method_back_calculates_with_model(study):
+    level, day, found = study
+    response = 0.02 + 0.3 * found
+    model = {'slope': 0.3, 'intercept': 0.02}
+    result = validate_method(level, response, day=day, analyst=np.where(day > 1, 'A', 'B'),
+                             model=model)
+    expected = precision_table(level, found, day)
+    np.testing.assert_allclose(result['precision']['Repeatability SD'],
+                               expected['Repeatability SD'], rtol=1e-9)
+    assert result['lack_of_fit'].equals(lack_of_fit_anova(level, response))
@@ -0,0 +1,105 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from nanocalibrate import FolderWatcher, calculate_calibration, resolve_under
+from nanocalibrate import watch
+
+
+@pytest.fixture
+def model():
+    x = np.arange(5.0)
+    return calculate_calibration(x, 2 * x)
+
+
+def append(path, text):
+    with open(path, 'a') as f:
+        f.write(text)
+
+
+def test_partial_line_waits_for_newline(tmp_path, model):
+    path = tmp_path / 'a.csv'
+    watcher = FolderWatcher(str(tmp_path), model, column='Response')
+    append(path, "id,Response\nx,2.0\ny,4")
+    assert watcher.poll()['Response'].tolist() == [2.0]
+    append(path, ".5\n")
+    assert watcher.poll()['Response'].tolist() == [4.5]
+    assert len(watcher.poll()) == 0
+
+
+def test_bad_lines_are_skipped(tmp_path, model):
+    path = tmp_path / 'a.csv'
+    watcher = FolderWatcher(str(tmp_path), model, column='Response')
+    append(path, 'id,Response\nx,2.0\nbad,line,extra,fields\nnot-a-number\nz,"6.0"\n\nq,8.0\n')
+    assert watcher.poll()['Response'].tolist() == [2.0, 6.0, 8.0]
+    assert watcher.files[str(path)].offset == os.path.getsize(path)
+
+
+def test_overlong_line_is_skipped_whole(tmp_path, model):
+    path = tmp_path / 'a.txt'
+    watcher = FolderWatcher(str(tmp_path), model, read_block=32)
+    append(path, "1.0\n" + "9" * 100 + "\n2.0\n")
+    rows = pd.concat([watcher.poll() for _ in range(2)])
+    assert rows['Response'].tolist() == [1.0, 2.0]
+
+
+def test_missing_header_column_raises(tmp_path, model):
+    append(tmp_path / 'a.csv', "id,Other\nx,1.0\n")
+    watcher = FolderWatcher(str(tmp_path), model, column='Response')
+    with pytest.raises(ValueError, match="a.csv"):
+        watcher.poll()
+
+
+def test_parse_error_keeps_offset(tmp_path, model, monkeypatch):
+    path = tmp_path / 'a.txt'
+    append(path, "1.0\n2.0\n")
+    watcher = FolderWatcher(str(tmp_path), model)
+
+    def fail(block, column):
+        raise pd.errors.ParserError("boom")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(watch, '_parse_values', fail)
+        with pytest.raises(pd.errors.ParserError):
+            watcher.poll()
+    assert watcher.files[str(path)].offset == 0
+    assert watcher.poll()['Response'].tolist() == [1.0, 2.0]
+
+
+def test_output_is_appended_not_watched(tmp_path, model):
+    out = tmp_path / 'live.csv'
+    watcher = FolderWatcher(str(tmp_path), model, output=str(out))
+    append(tmp_path / 'a.txt', "1.0\n")
+    watcher.poll()
+    append(tmp_path / 'a.txt', "3.0\n")
+    watcher.poll()
+    assert pd.read_csv(out)['Response'].tolist() == [1.0, 3.0]
+
+
+def test_resolve_under_rejects_paths_outside_root(tmp_path):
+    root = tmp_path / 'root'
+    (root / 'data').mkdir(parents=True)
+    os.symlink(tmp_path, root / 'escape')
+    assert resolve_under(str(root), 'data') == os.path.realpath(root / 'data')
+    for path in ('..', '/etc', 'escape/x.csv', 'data/../../x.csv'):
+        with pytest.raises(ValueError):
+            resolve_under(str(root), path)
+
+
+def test_large_backlog_is_written_per_block(tmp_path, model):
+    path = tmp_path / 'a.txt'
+    path.write_text(''.join(f"{i % 7 + 1}.0\n" for i in range(5000)))
+    out = tmp_path / 'live.csv'
+    watcher = FolderWatcher(str(tmp_path), model, output=str(out), read_block=1024,
+                            recent_rows=100)
+    new_rows = watcher.poll()
+    # Hanya baris terbaru yang dikembalikan dan disimpan; semuanya ada di file output
+    assert len(new_rows) == 100 and len(watcher.recent) == 100
+    assert watcher.last_poll_rows == 5000
+    assert watcher.stats()['rows'] == 5000
+    written = pd.read_csv(out)
+    assert len(written) == 5000
+    assert written['Response'].tail(100).tolist() == new_rows['Response'].tolist()
+    assert len(watcher.poll()) == 0 and watcher.last_poll_rows == 0
@@ -0,0 +1,57 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from nanocalibrate import calibrate_workbook, read_table, read_workbook, sheet_names
+from nanocalibrate.workbook import workbook_cache, workbook_hash
+
+
+@pytest.fixture
+def workbook():
+    buffer = io.BytesIO()
+    with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
+        for k, slope in enumerate([0.3, 0.5, 0.7]):
+            x = np.array([0.0, 1.0, 2.0, 5.0])
+            pd.DataFrame({'Concentration': x, 'Response': 0.01 + slope * x}).to_excel(
+                writer, sheet_name=f"plate{k + 1}", index=False)
+    return buffer.getvalue()
+
+
+def test_sheet_names_in_order(workbook):
+    assert sheet_names(workbook) == ['plate1', 'plate2', 'plate3']
+
+
+def test_selected_sheet_only_is_parsed(workbook):
+    workbook_cache.clear()
+    frames = read_workbook(workbook, ['plate2'])
+    assert list(frames) == ['plate2']
+    assert frames['plate2']['Response'].tolist() == pytest.approx([0.01, 0.51, 1.01, 2.51])
+    digest = workbook_hash(workbook)
+    assert workbook_cache.get((digest, 'plate2')) is not None
+    assert workbook_cache.get((digest, 'plate1')) is None
+
+
+def test_sheets_are_cached_per_file_content(workbook):
+    workbook_cache.clear()
+    first = read_workbook(workbook, workers=1)
+    misses = workbook_cache.stats()['misses']
+    second = read_workbook(workbook, workers=1)
+    assert workbook_cache.stats()['misses'] == misses
+    for sheet in first:
+        assert second[sheet] is first[sheet]
+
+
+def test_read_table_reads_one_sheet(workbook):
+    named = io.BytesIO(workbook)
+    named.name = 'plates.xlsx'
+    df = read_table(named, sheet_name='plate3')
+    assert list(df.columns) == ['Concentration', 'Response']
+    assert df['Response'].iloc[-1] == pytest.approx(3.51)
+
+
+def test_calibrate_workbook_fits_each_sheet(workbook):
+    table = calibrate_workbook(read_workbook(workbook, workers=1))
+    assert table['Sheet'].tolist() == ['plate1', 'plate2', 'plate3']
+    assert table['slope'].tolist() == pytest.approx([0.3, 0.5, 0.7])